@@ -1,13 +1,20 @@
+import logging
 from collections.abc import Sequence
 from typing import Annotated
 
 from dependency_injector.wiring import Provide, inject
 from fastapi import HTTPException, Request, status, Depends, Security
 from fastapi.security.oauth2 import OAuth2PasswordBearer
+from jwt import InvalidTokenError
+from pydantic import ValidationError
 
 from app.core.container import DIContainer
-from app.managers import UserManager
-from app.schemas.auth import UserSessionInfo
+from app.core.permissions import role_permissions
+from app.core.security import TokenValidator
+from app.schemas.auth import Principal, TokenPayload, UserSessionInfo
+from app.services import PrincipalService
+
+logger = logging.getLogger(__name__)
 
 
 oauth2_bearer = OAuth2PasswordBearer(
@@ -15,57 +22,77 @@ oauth2_bearer = OAuth2PasswordBearer(
 )
 
 
+@inject
+async def get_principal(
+    request: Request,
+    token: str | None = Security(oauth2_bearer),
+    token_validator: TokenValidator = Depends(Provide[DIContainer.token_validator]),
+    principal_service: PrincipalService = \
+        Depends(Provide[DIContainer.principal_service])
+) -> Principal:
+    """Authenticate the bearer token and resolve the principal of the request.
+
+    Authentication is lazy: only routes depending on `Authorize` or 
+    `CurrentUser` validate the token and resolve the principal, once per 
+    request.
+    """
+    if not token:
+        raise __unauthorized("Not authenticated.")
+
+    try:
+        token_payload = TokenPayload(**token_validator.decode_token(token))
+    except (InvalidTokenError, ValidationError, ValueError):
+        logger.error("Failed to validate user authentication credentials")
+        raise __unauthorized("Invalid authentication credentials.")
+
+    principal = await principal_service.resolve(
+        token_payload.sub, token_payload.stamp
+    )
+    if principal is None:
+        raise __unauthorized("Invalid authentication credentials.")
+    if not principal.is_active:
+        raise __unauthorized("Inactive user.")
+
+    # Roles are issued as token claims; the security stamp check above 
+    # rejects tokens whose roles have since changed, as assigning, removing,
+    # renaming or deleting a role rotates the stamps of its members.
+    request.state.user = principal
+    request.state.user_roles = token_payload.roles
+    request.state.permissions = role_permissions.granted(token_payload.roles)
+
+    return principal
+
+
 class Authorize:
     """A class for authorizing users.
+
+    A user is authorized if any of their roles is, or implies, one of the 
+    given roles.
     """
 
     def __init__(self, roles: Sequence[str] | None = None) -> None:
-        self.__roles = set(roles) if roles else None
-
-    def __call__(self, request: Request, _: str = Security(oauth2_bearer)) -> None:
-        # Authentication check
-        if not request.user.is_authenticated:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Not authenticated.",
-                headers={"WWW-Authenticate": "Bearer"}
-            )
-
-        # Authorize check
-        if self.__roles:
-            user_roles = set(getattr(request.state, "user_roles", []))
-            if not self.__roles.intersection(user_roles):
+        self.__required = role_permissions.required(roles) if roles else 0
+
+    def __call__(
+        self, 
+        request: Request, 
+        _: Principal = Depends(get_principal)
+    ) -> None:
+        if self.__required:
+            if not request.state.permissions & self.__required:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="Insufficient permissions."
                 )
 
 
-@inject
 def get_current_user(
     request: Request,
-    user_manager: UserManager = Depends(Provide[DIContainer.user_manager])
-) -> UserSessionInfo | None:
+    principal: Principal = Depends(get_principal)
+) -> UserSessionInfo:
     """Get the current user
     """
-    if not request.user.is_authenticated:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated.",
-            headers={"WWW-Authenticate": "Bearer"}
-        )
-
-    # Use cached user from middleware if available
-    if not (user := getattr(request.state, "user", None)):
-        user = user_manager.get_by_name(request.user.username)
-
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User does not exist"
-            )
-
-    sessionInfo = UserSessionInfo.model_validate(user, from_attributes=True)
+    sessionInfo = UserSessionInfo.model_validate(principal, from_attributes=True)
 
     if request.client:
         sessionInfo.ip_address = request.client.host
@@ -74,3 +101,11 @@ def get_current_user(
 
 
 CurrentUser = Annotated[UserSessionInfo, Depends(get_current_user)]
+
+
+def __unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"}
+    )
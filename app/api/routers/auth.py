@@ -1,12 +1,12 @@
 from typing import Annotated, Any
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request
 from fastapi.security.oauth2 import OAuth2PasswordRequestForm
 
 from app.api.dependencies import Authorize, CurrentUser
 from app.core.container import DIContainer
-from app.schemas.auth import TokenResponse, UserSessionInfo
+from app.schemas.auth import RefreshTokenRequest, TokenResponse, UserSessionInfo
 from app.schemas.common import Error
 from app.services import AuthService
 
@@ -22,6 +22,7 @@ auth_router = APIRouter(prefix="/auth", tags=["Auth"])
 @inject
 def get_access_token(
     request: Annotated[OAuth2PasswordRequestForm, Depends()],
+    http_request: Request,
     auth_service: AuthService = Depends(Provide(DIContainer.auth_service))
 ) -> Any:
     """
@@ -29,7 +30,11 @@ def get_access_token(
 
     The token can be used for authentication in subsequent requests.
     """
-    token_result = auth_service.authenticate_user(request.username, request.password)
+    token_result = auth_service.authenticate_user(
+        request.username, 
+        request.password, 
+        http_request.client.host if http_request.client else None
+    )
 
     if isinstance(token_result, Error):
         raise HTTPException(
@@ -38,7 +43,35 @@ def get_access_token(
             headers={"WWW-Authenticate": "Bearer"}
         )
 
-    return TokenResponse(access_token=token_result)
+    return token_result
+
+
+@auth_router.post(
+    "/refresh-token", 
+    operation_id="RefreshAccessToken", 
+    response_model=TokenResponse
+)
+@inject
+def refresh_access_token(
+    request: RefreshTokenRequest,
+    auth_service: AuthService = Depends(Provide[DIContainer.auth_service])
+) -> Any:
+    """
+    Exchange a refresh token for a new token.
+
+    Each refresh token can be exchanged once; the response carries its 
+    replacement.
+    """
+    token_result = auth_service.refresh_access_token(request.refresh_token)
+
+    if isinstance(token_result, Error):
+        raise HTTPException(
+            status_code=token_result.error_type.value,
+            detail=token_result.details,
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+    return token_result
 
 
 @auth_router.get(
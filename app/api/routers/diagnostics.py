@@ -0,0 +1,139 @@
+from typing import Any
+from uuid import UUID
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, status
+
+from app.api.dependencies import Authorize
+from app.constants import roles
+from app.core.container import DIContainer
+from app.core.security import PasswordHasher, TokenValidator
+from app.database import DatabaseContext, QueryBuilder
+from app.schemas.auth import Principal
+from app.schemas.diagnostics import (
+    CacheStatistics,
+    CompiledCacheStatistics,
+    ConnectionPoolStatistics,
+    SlowQueryEntry,
+    StatementCacheStatistics,
+    WorkerPoolStatistics,
+)
+from app.utils.cache import LRUCache
+
+diagnostics_router = APIRouter(
+    prefix="/diagnostics", 
+    tags=["Diagnostics"], 
+    dependencies=[Depends(Authorize(roles=[roles.ADMINISTRATOR]))]
+)
+
+
+@diagnostics_router.get(
+    "/principal-cache", 
+    operation_id="GetPrincipalCacheStatistics", 
+    response_model=CacheStatistics, 
+    status_code=status.HTTP_200_OK
+)
+@inject
+def get_principal_cache_statistics(
+    principal_cache: LRUCache[UUID, Principal] = Depends(
+        Provide[DIContainer.principal_cache]
+    )
+) -> Any:
+    """Retrieve the principal cache hit/miss statistics.
+    """
+    return CacheStatistics.model_validate(principal_cache.stats, from_attributes=True)
+
+
+@diagnostics_router.get(
+    "/token-cache", 
+    operation_id="GetTokenCacheStatistics", 
+    response_model=CacheStatistics, 
+    status_code=status.HTTP_200_OK
+)
+@inject
+def get_token_cache_statistics(
+    token_validator: TokenValidator = Depends(Provide[DIContainer.token_validator])
+) -> Any:
+    """Retrieve the verified-token cache hit/miss statistics.
+    """
+    return CacheStatistics.model_validate(
+        token_validator.cache_stats, from_attributes=True
+    )
+
+
+@diagnostics_router.get(
+    "/password-hasher", 
+    operation_id="GetPasswordHasherStatistics", 
+    response_model=WorkerPoolStatistics, 
+    status_code=status.HTTP_200_OK
+)
+@inject
+def get_password_hasher_statistics(
+    password_hasher: PasswordHasher = Depends(Provide[DIContainer.password_hasher])
+) -> Any:
+    """Retrieve the password hashing pool utilization.
+    """
+    return WorkerPoolStatistics.model_validate(
+        password_hasher.stats, from_attributes=True
+    )
+
+
+@diagnostics_router.get(
+    "/database-pool", 
+    operation_id="GetDatabasePoolStatistics", 
+    response_model=list[ConnectionPoolStatistics], 
+    status_code=status.HTTP_200_OK
+)
+@inject
+def get_database_pool_statistics(
+    app_db_context: DatabaseContext = Depends(Provide[DIContainer.app_db_context])
+) -> Any:
+    """Retrieve the database connection pool utilization of each engine.
+    """
+    return [
+        ConnectionPoolStatistics.model_validate(stats, from_attributes=True) 
+        for stats in app_db_context.pool_stats
+    ]
+
+
+@diagnostics_router.get(
+    "/statement-cache", 
+    operation_id="GetStatementCacheStatistics", 
+    response_model=StatementCacheStatistics, 
+    status_code=status.HTTP_200_OK
+)
+@inject
+def get_statement_cache_statistics(
+    app_db_context: DatabaseContext = Depends(Provide[DIContainer.app_db_context])
+) -> Any:
+    """Retrieve the hit rates of the query builder statement cache and of each 
+    engine's compiled SQL cache.
+    """
+    return StatementCacheStatistics(
+        query_builder=CacheStatistics.model_validate(
+            QueryBuilder.cache_stats(), from_attributes=True
+        ),
+        compiled=[
+            CompiledCacheStatistics.model_validate(stats, from_attributes=True) 
+            for stats in app_db_context.compiled_cache_stats
+        ]
+    )
+
+
+@diagnostics_router.get(
+    "/slow-queries", 
+    operation_id="GetSlowQueries", 
+    response_model=list[SlowQueryEntry], 
+    status_code=status.HTTP_200_OK
+)
+@inject
+def get_slow_queries(
+    app_db_context: DatabaseContext = Depends(Provide[DIContainer.app_db_context])
+) -> Any:
+    """Retrieve the most recent slow database statements, with the plans
+    captured for a sample of them.
+    """
+    return [
+        SlowQueryEntry.model_validate(entry, from_attributes=True) 
+        for entry in app_db_context.slow_queries
+    ]
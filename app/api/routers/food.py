@@ -38,14 +38,7 @@ def get_food_categories(
     return categories
 
 
-food_editor_check = Authorize(
-    roles=[
-        roles.ADMINISTRATOR, 
-        roles.EDITOR, 
-        roles.FOOD_ADMIN, 
-        roles.FOOD_EDITOR
-    ]
-)
+food_editor_check = Authorize(roles=[roles.FOOD_EDITOR])
 
 
 @food_router.put(
@@ -84,11 +77,19 @@ def get_food_items(
     """Retrieve a list of food items.
     """
     items = food_service.get_food_items(filter)
+    if isinstance(items, Error):
+        raise HTTPException(
+            status_code=items.error_type.value, 
+            detail=items.details
+        )
     response.headers['X-Pagination'] = PaginationResponse(
         index=filter.index, 
         size=filter.size, 
         items_count=items._items_count,  
-        page_count=items._page_count
+        page_count=items._page_count,
+        is_count_estimated=items._is_count_estimated,
+        cursor=filter.cursor,
+        next_cursor=items._next_cursor
     ).model_dump_json()
     
     return items
@@ -165,7 +166,7 @@ def update_food_item(
     "/items/{food_id}", 
     operation_id="DeleteFoodItem", 
     status_code=204, 
-    dependencies=[Depends(Authorize(roles=[roles.ADMINISTRATOR, roles.FOOD_ADMIN]))]
+    dependencies=[Depends(Authorize(roles=[roles.FOOD_ADMIN]))]
 )
 @inject
 def delete_food_item(
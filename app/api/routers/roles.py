@@ -18,11 +18,7 @@ roles_router = APIRouter(
     tags=["Roles", "IAM"], 
     dependencies=[
         Depends(
-            Authorize(roles=[
-                role_consts.ADMINISTRATOR, 
-                role_consts.IAM_ADMIN, 
-                role_consts.IAM_ROLE_ADMIN
-            ])
+            Authorize(roles=[role_consts.IAM_ROLE_ADMIN])
         )
     ]
 )
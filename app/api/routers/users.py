@@ -128,11 +128,7 @@ users_manage_router = APIRouter(
     tags=["IAM"],
     dependencies=[
         Depends(
-            Authorize(roles=[
-                roles.ADMINISTRATOR, 
-                roles.IAM_ADMIN, 
-                roles.IAM_USER_ADMIN
-            ])
+            Authorize(roles=[roles.IAM_USER_ADMIN])
         )
     ]
 )
@@ -1,10 +1,25 @@
+from datetime import timedelta
+from uuid import UUID
+
 from dependency_injector import containers, providers
 
+from app.core.security import PasswordHasher, TokenValidator
 from app.core.settings import get_app_settings
-from app.database import DatabaseContext
-from app.managers import *  # noqa: F403
-from app.repositories import *  # noqa: F403
-from app.services import *  # noqa: F403
+from app.database import DatabaseContext, UnitOfWork
+from app.managers import RoleManager, UserManager
+from app.repositories import (
+    AsyncFoodCategoryRepository,
+    AsyncFoodItemRepository,
+    FoodCategoryRepository,
+    FoodItemRepository,
+    RefreshTokenRepository,
+    RoleRepository,
+    UserRepository,
+)
+from app.schemas.auth import Principal
+from app.services import AuthService, FoodService, PrincipalService, UserService
+from app.utils.cache import LRUCache
+from app.utils.rate_limit import SlidingWindowRateLimiter
 
 
 class DIContainer(containers.DeclarativeContainer):
@@ -15,9 +30,11 @@ class DIContainer(containers.DeclarativeContainer):
         modules=[
             "app.api.dependencies", 
             "app.api.routers.auth", 
+            "app.api.routers.diagnostics", 
             "app.api.routers.food", 
             "app.api.routers.users", 
             "app.api.routers.roles",
+            "app.database.initializer",
         ]
     )
 
@@ -27,56 +44,152 @@ class DIContainer(containers.DeclarativeContainer):
 
     app_db_context = providers.Singleton(
         DatabaseContext, 
-        connection_string=str(app_settings.provided().database_url))
+        connection_string=str(app_settings.provided().database_url),
+        replica_connection_strings=app_settings.provided.DB_REPLICA.URLS)
+    
+    unit_of_work = providers.ContextLocalSingleton(
+        UnitOfWork,
+        session_factory=app_db_context.provided.create_session
+    )
     
     ## food ##
     
     food_category_repository = providers.Factory(
         FoodCategoryRepository,
-        db_session_factory=app_db_context.provided.get_session
+        db_session_factory=unit_of_work.provided.session
     )
 
     food_item_repository = providers.Factory(
         FoodItemRepository,
-        db_session_factory=app_db_context.provided.get_session
+        db_session_factory=unit_of_work.provided.session
+    )
+
+    # Async repositories use sessions of their own, outside the unit of work.
+    async_food_category_repository = providers.Factory(
+        AsyncFoodCategoryRepository,
+        db_session_factory=app_db_context.provided.get_async_session
+    )
+
+    async_food_item_repository = providers.Factory(
+        AsyncFoodItemRepository,
+        db_session_factory=app_db_context.provided.get_async_session
     )
 
     food_service = providers.Factory(
         FoodService,
         food_category_repository=food_category_repository,
-        food_item_repository=food_item_repository
+        food_item_repository=food_item_repository,
+        unit_of_work=unit_of_work
     )
 
     ### auth ###
 
+    token_validator = providers.Singleton(
+        TokenValidator,
+        secret_key=app_settings.provided.JWT.SECRET_KEY,
+        issuer=app_settings.provided.JWT.VALID_ISSUER,
+        audience=app_settings.provided.JWT.VALID_AUDIENCES,
+        cache_size=app_settings.provided.JWT.VALIDATION_CACHE_SIZE
+    )
+
+    principal_cache: providers.Singleton[LRUCache[UUID, Principal]] = \
+        providers.Singleton(
+            LRUCache,
+            max_size=app_settings.provided.AUTH.PRINCIPAL_CACHE_MAX_SIZE,
+            ttl=app_settings.provided.AUTH.PRINCIPAL_CACHE_TTL_SECONDS
+        )
+
     role_repository = providers.Factory(
         RoleRepository,
-        db_session_factory=app_db_context.provided.get_session
+        db_session_factory=unit_of_work.provided.session
     )
 
     role_manager = providers.Factory(
         RoleManager,
-        role_repository=role_repository
+        role_repository=role_repository,
+        unit_of_work=unit_of_work,
+        principal_cache=principal_cache
     )
 
     user_repository = providers.Factory(
         UserRepository,
-        db_session_factory=app_db_context.provided.get_session
+        db_session_factory=unit_of_work.provided.session
+    )
+
+    password_hasher = providers.Singleton(
+        PasswordHasher,
+        max_workers=app_settings.provided.AUTH.PASSWORD_HASH_WORKERS,
+        max_queue=app_settings.provided.AUTH.PASSWORD_HASH_QUEUE_SIZE,
+        retry_after=app_settings.provided.AUTH.PASSWORD_HASH_RETRY_AFTER_SECONDS
     )
 
     user_manager = providers.Factory(
         UserManager,
-        user_repository=user_repository
+        user_repository=user_repository,
+        unit_of_work=unit_of_work,
+        principal_cache=principal_cache,
+        password_hasher=password_hasher,
+        max_failed_access_attempts=\
+            app_settings.provided.AUTH.MAX_FAILED_ACCESS_ATTEMPTS,
+        lockout_duration=providers.Factory(
+            timedelta, 
+            seconds=app_settings.provided.AUTH.LOCKOUT_DURATION_SECONDS
+        )
+    )
+
+    login_username_rate_limiter: \
+        providers.Singleton[SlidingWindowRateLimiter[str]] = \
+        providers.Singleton(
+            SlidingWindowRateLimiter,
+            limit=app_settings.provided.AUTH.LOGIN_ATTEMPTS_PER_USERNAME,
+            window=app_settings.provided.AUTH.LOGIN_ATTEMPT_WINDOW_SECONDS,
+            max_keys=app_settings.provided.AUTH.LOGIN_THROTTLE_MAX_KEYS
+        )
+
+    login_ip_rate_limiter: providers.Singleton[SlidingWindowRateLimiter[str]] = \
+        providers.Singleton(
+            SlidingWindowRateLimiter,
+            limit=app_settings.provided.AUTH.LOGIN_ATTEMPTS_PER_IP,
+            window=app_settings.provided.AUTH.LOGIN_ATTEMPT_WINDOW_SECONDS,
+            max_keys=app_settings.provided.AUTH.LOGIN_THROTTLE_MAX_KEYS
+        )
+
+    refresh_token_repository = providers.Factory(
+        RefreshTokenRepository,
+        db_session_factory=unit_of_work.provided.session
     )
 
     auth_service = providers.Factory(
         AuthService,
-        user_manager=user_manager
+        user_manager=user_manager,
+        refresh_token_repository=refresh_token_repository,
+        username_rate_limiter=login_username_rate_limiter,
+        ip_rate_limiter=login_ip_rate_limiter,
+        unit_of_work=unit_of_work
+    )
+
+    # Principals are loaded on worker threads shared by all requests, so each 
+    # lookup uses its own session rather than a request's unit of work.
+    principal_user_manager = providers.Factory(
+        user_manager,
+        user_repository=providers.Factory(
+            UserRepository,
+            db_session_factory=app_db_context.provided.get_session
+        )
+    )
+
+    principal_service = providers.Singleton(
+        PrincipalService,
+        user_manager_factory=principal_user_manager.provider,
+        principal_cache=principal_cache,
+        thread_limit=app_settings.provided.AUTH.RESOLVER_THREAD_LIMIT
     )
 
     ### users ##
     
     user_service = providers.Factory(
         UserService,
-        user_repo=user_repository
+        user_repo=user_repository,
+        principal_cache=principal_cache,
+        unit_of_work=unit_of_work
     )
@@ -0,0 +1,94 @@
+from collections.abc import Iterable, Mapping
+
+from app.constants import roles
+from app.utils.cache import LRUCache
+
+ROLE_HIERARCHY: Mapping[str, Iterable[str]] = {
+    roles.ADMINISTRATOR: [roles.IAM_ADMIN, roles.EDITOR, roles.FOOD_ADMIN],
+    roles.IAM_ADMIN: [roles.IAM_USER_ADMIN, roles.IAM_ROLE_ADMIN],
+    roles.EDITOR: [roles.VIEWER, roles.FOOD_EDITOR],
+    roles.FOOD_ADMIN: [roles.FOOD_EDITOR],
+}
+"""The roles directly implied by each role."""
+
+
+class RolePermissions:
+    """A role hierarchy compiled to integer bitmasks.
+
+    Every role is assigned a bit. The permissions granted by a set of roles
+    are the bits of those roles and of every role they imply, while the
+    permissions required by a route are only the bits of the roles it lists.
+    A route check is then a single AND of the two masks.
+    """
+
+    def __init__(
+        self,
+        role_names: Iterable[str],
+        hierarchy: Mapping[str, Iterable[str]],
+        cache_size: int = 1024
+    ) -> None:
+        """
+        Parameters:
+            role_names (Iterable[str]): The known role names.
+            hierarchy (Mapping[str, Iterable[str]]):
+                The roles directly implied by each role.
+            cache_size (int): The maximum number of role sets cached.
+
+        Raises:
+            ValueError: If the hierarchy refers to an unknown role.
+        """
+        self.__bits = {
+            name: 1 << index for index, name in enumerate(dict.fromkeys(role_names))
+        }
+        for role, implied_roles in hierarchy.items():
+            unknown = {role, *implied_roles} - self.__bits.keys()
+            if unknown:
+                raise ValueError(f"Unknown roles in hierarchy: {sorted(unknown)}")
+
+        self.__grants = {
+            role: self.__closure(role, hierarchy) for role in self.__bits
+        }
+        self.__cache: LRUCache[frozenset[str], int] = LRUCache(max_size=cache_size)
+
+    def required(self, role_names: Iterable[str]) -> int:
+        """Get the mask satisfied by any of the named roles.
+
+        Raises:
+            ValueError: If a role name is unknown.
+        """
+        mask = 0
+        for role in role_names:
+            if role not in self.__bits:
+                raise ValueError(f"Unknown role '{role}'.")
+            mask |= self.__bits[role]
+        return mask
+
+    def granted(self, role_names: Iterable[str]) -> int:
+        """Get the mask of the named roles and every role they imply.
+
+        Unknown role names grant nothing. Masks are cached per role set.
+        """
+        key = frozenset(role_names)
+        mask = self.__cache.get(key)
+        if mask is None:
+            mask = 0
+            for role in key:
+                mask |= self.__grants.get(role, 0)
+            self.__cache.set(key, mask)
+        return mask
+
+    def __closure(self, role: str, hierarchy: Mapping[str, Iterable[str]]) -> int:
+        mask = 0
+        pending = [role]
+        while pending:
+            current = pending.pop()
+            bit = self.__bits[current]
+            if mask & bit:
+                continue
+            mask |= bit
+            pending.extend(hierarchy.get(current, ()))
+        return mask
+
+
+role_permissions = RolePermissions(roles, ROLE_HIERARCHY)
+"""The application role permissions, compiled at startup."""
@@ -1,10 +1,20 @@
+import hashlib
+import multiprocessing
+import secrets
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import Any, TypeVar, final
 
 import jwt
 from passlib.context import CryptContext
 
 from app.core.settings import get_app_settings
+from app.utils.cache import CacheStats, LRUCache
 
 
 class TokenProvider:
@@ -48,11 +58,61 @@ class TokenProvider:
 
         return token
 
+    def generate_refresh_token(self) -> tuple[str, datetime]:
+        """Generates an opaque refresh token.
+
+        Returns:
+            tuple[str, datetime]: The refresh token and its expiry time.
+        """
+        app_settings = get_app_settings()
+
+        token = secrets.token_urlsafe(32)
+        expire = datetime.now(UTC) + \
+            timedelta(days=app_settings.JWT.REFRESH_TOKEN_EXPIRE_DAYS)
+        
+        return token, expire
+
+    @staticmethod
+    def hash_refresh_token(token: str) -> str:
+        """Gets the digest under which a refresh token is stored.
+        """
+        return hashlib.sha256(token.encode()).hexdigest()
+
 
 class TokenValidator:
     """TokenValidator that validates JWT tokens.
+
+    The signing key, issuer and audience are fixed at construction, and 
+    verified payloads are cached (keyed by a digest of the token) until the 
+    token expires, so a token reused across requests is only verified once.
     """
 
+    def __init__(
+        self, 
+        secret_key: str, 
+        issuer: str | None = None, 
+        audience: str | Sequence[str] | None = None,
+        cache_size: int = 10_000
+    ) -> None:
+        """
+        Parameters:
+            secret_key (str): The key used to verify token signatures.
+            issuer (str | None): The expected token issuer.
+            audience (str | Sequence[str] | None): The accepted token audience(s).
+            cache_size (int): The maximum number of verified tokens cached.
+        """
+        self.__secret_key = secret_key
+        self.__issuer = issuer
+        self.__audience = audience
+        self.__algorithms = [TokenProvider.ALGORITHM]
+        self.__cache: LRUCache[bytes, dict[str, Any]] = LRUCache(cache_size)
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Get a snapshot of the verified-token cache statistics.
+        """
+        return self.__cache.stats
+
     def decode_token(self, token: str) -> dict[str, Any]:
         """Decodes a JWT token.
 
@@ -60,29 +120,187 @@ class TokenValidator:
             token (str): The JWT token to decode.
 
         Returns:
-            (dict[str, Any] | None): 
-                The decoded payload if the token is valid, otherwise None.
+            dict[str, Any]: The decoded payload.
+
+        Raises:
+            jwt.InvalidTokenError: If the token is invalid or expired.
         """
-        app_settings = get_app_settings()
-        
+        digest = hashlib.sha256(token.encode()).digest()
+        if (payload := self.__cache.get(digest)) is not None:
+            return dict(payload)
+
         payload = jwt.decode(
             token, 
-            app_settings.JWT.SECRET_KEY,
-            issuer=app_settings.JWT.VALID_ISSUER,
-            audience="http://localhost:8000", # TODO: do not hardcode
-            algorithms=[TokenProvider.ALGORITHM]
+            self.__secret_key,
+            issuer=self.__issuer,
+            audience=self.__audience,
+            algorithms=self.__algorithms
         )
-        return payload # type: ignore[no-any-return]
+
+        if isinstance(expires_at := payload.get("exp"), int | float):
+            ttl = expires_at - time.time()
+            if ttl > 0:
+                self.__cache.set(digest, payload, ttl=ttl)
+
+        return dict(payload)
+
+
+_T = TypeVar('_T')
+
+_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def _hash_password(password: str) -> str:
+    return str(_pwd_context.hash(password))
+
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    return bool(_pwd_context.verify(plain_password, hashed_password))
+
+
+class PasswordHasherBusyError(Exception):
+    """Raised when the password hashing pool cannot accept more work.
+    """
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__("Password hashing pool is saturated.")
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+@final
+class PasswordHasherStats:
+    """A snapshot of the password hashing pool statistics.
+
+    Attributes:
+        max_workers (int): Number of worker processes.
+        max_queue (int): Maximum number of requests waiting for a worker.
+        in_flight (int): Number of requests running or waiting for a worker.
+        completed (int): Number of requests completed successfully.
+        rejected (int): Number of requests rejected because the pool was full.
+    """
+
+    max_workers: int
+    max_queue: int
+    in_flight: int
+    completed: int
+    rejected: int
+
+    @property
+    def utilization(self) -> float:
+        """The ratio of busy workers.
+        """
+        return min(self.in_flight, self.max_workers) / self.max_workers
+
+    @property
+    def queued(self) -> int:
+        """Number of requests waiting for a worker.
+        """
+        return max(self.in_flight - self.max_workers, 0)
 
 
 class PasswordHasher:
     """A class for hashing and verifying passwords using bcrypt.
+
+    The bcrypt work runs in a dedicated, bounded process pool. At most 
+    `max_workers + max_queue` requests are admitted at once, so a login spike 
+    only ties up that many request threads; any further request fails fast 
+    with a `PasswordHasherBusyError`.
     """
 
-    __pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    def __init__(
+        self, 
+        max_workers: int, 
+        max_queue: int, 
+        retry_after: int = 1
+    ) -> None:
+        """
+        Parameters:
+            max_workers (int): Number of worker processes.
+            max_queue (int): Maximum number of requests waiting for a worker.
+            retry_after (int): 
+                Seconds a rejected client is advised to wait before retrying.
+        """
+        self.__max_workers = max_workers
+        self.__max_queue = max_queue
+        self.__retry_after = retry_after
+        self.__admission = threading.BoundedSemaphore(max_workers + max_queue)
+        self.__lock = threading.Lock()
+        self.__executor: ProcessPoolExecutor | None = None
+        self.__in_flight = 0
+        self.__completed = 0
+        self.__rejected = 0
+
+    @property
+    def stats(self) -> PasswordHasherStats:
+        """Get a snapshot of the pool statistics.
+        """
+        with self.__lock:
+            return PasswordHasherStats(
+                max_workers=self.__max_workers,
+                max_queue=self.__max_queue,
+                in_flight=self.__in_flight,
+                completed=self.__completed,
+                rejected=self.__rejected
+            )
 
     def hash_password(self, password: str) -> str:
-        return self.__pwd_context.hash(password)
+        return self.__run(_hash_password, password)
     
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        return self.__pwd_context.verify(plain_password, hashed_password)
+        return self.__run(_verify_password, plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        """Shut down the worker processes.
+        """
+        with self.__lock:
+            executor, self.__executor = self.__executor, None
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    def __run(self, fn: Callable[..., _T], *args: Any) -> _T:
+        if not self.__admission.acquire(blocking=False):
+            with self.__lock:
+                self.__rejected += 1
+            raise PasswordHasherBusyError(self.__retry_after)
+
+        try:
+            with self.__lock:
+                self.__in_flight += 1
+            try:
+                result = self.__submit(fn, *args)
+            except BrokenProcessPool:
+                # The request may have been lost with a worker that died, so 
+                # it is run once more on the replacement pool.
+                result = self.__submit(fn, *args)
+            with self.__lock:
+                self.__completed += 1
+            return result
+        finally:
+            with self.__lock:
+                self.__in_flight -= 1
+            self.__admission.release()
+
+    def __submit(self, fn: Callable[..., _T], *args: Any) -> _T:
+        with self.__lock:
+            executor = self.__get_executor()
+        try:
+            return executor.submit(fn, *args).result()
+        except BrokenProcessPool:
+            # A worker died, e.g. killed for memory, and the pool refuses any 
+            # further work; the next request starts a new one.
+            with self.__lock:
+                if self.__executor is executor:
+                    self.__executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    def __get_executor(self) -> ProcessPoolExecutor:
+        if self.__executor is None:
+            # Workers are spawned rather than forked, so they never inherit 
+            # the parent's threads, sockets or connection pools.
+            self.__executor = ProcessPoolExecutor(
+                max_workers=self.__max_workers, 
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self.__executor
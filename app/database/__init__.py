@@ -1,4 +1,13 @@
 from .base import DatabaseContext, create_db_if_not_exists
-from .query_builder import QueryBuilder
+from .pool import PoolStats
+from .query_builder import LoadStrategy, QueryBuilder
+from .unit_of_work import UnitOfWork
 
-__all__ = ['DatabaseContext', 'create_db_if_not_exists', 'QueryBuilder']
+__all__ = [
+    'DatabaseContext', 
+    'create_db_if_not_exists', 
+    'LoadStrategy', 
+    'PoolStats', 
+    'QueryBuilder', 
+    'UnitOfWork'
+]
@@ -1,11 +1,26 @@
-from collections.abc import Iterator
-from contextlib import contextmanager
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any
 
 from sqlalchemy import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from sqlalchemy_utils import create_database, database_exists # type: ignore[import-untyped]
 from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.settings import Environment, get_app_settings
+from app.core.settings import (
+    DatabasePoolSettings, 
+    DatabaseStatementSettings,
+    Environment, 
+    get_app_settings
+)
+from app.database.instrumentation import QueryMonitor
+from app.database.pool import PoolMonitor, PoolStats
+from app.database.query_builder import QueryBuilder
+from app.database.slow_queries import SlowQuery, SlowQueryLog
+from app.database.replicas import ReplicaSet
+from app.database.statement_cache import CompiledCacheMonitor, CompiledCacheStats
 
 
 def create_db_if_not_exists(engine: Engine) -> None:
@@ -18,16 +33,168 @@ def create_db_if_not_exists(engine: Engine) -> None:
         create_database(engine.url)
 
 
+def _engine_options(
+    pool: DatabasePoolSettings, 
+    statement: DatabaseStatementSettings
+) -> dict[str, Any]:
+    """Build the engine keyword arguments for the pool and statement settings.
+    """
+    # psycopg prepares a query server-side once it has run `prepare_threshold` 
+    # times on a connection; compiled cache hits render the identical SQL.
+    connect_args: dict[str, Any] = {
+        "prepare_threshold": statement.PREPARE_THRESHOLD
+    }
+    if pool.STATEMENT_TIMEOUT_MS:
+        connect_args["options"] = f"-c statement_timeout={pool.STATEMENT_TIMEOUT_MS}"
+
+    return {
+        "pool_size": pool.SIZE,
+        "max_overflow": pool.MAX_OVERFLOW,
+        "pool_timeout": pool.TIMEOUT_SECONDS,
+        "pool_recycle": pool.RECYCLE_SECONDS,
+        "pool_pre_ping": pool.PRE_PING,
+        "query_cache_size": statement.CACHE_SIZE,
+        "connect_args": connect_args,
+    }
+
+
 class DatabaseContext:
     """Database context manager.
     """
 
-    def __init__(self, connection_string: str) -> None:
+    def __init__(
+        self, 
+        connection_string: str, 
+        replica_connection_strings: Sequence[str] = ()
+    ) -> None:
+        """
+        Parameters:
+            connection_string (str): URL of the primary database.
+            replica_connection_strings (Sequence[str]): 
+                URLs of the read replicas serving read-only sessions.
+        """
         settings = get_app_settings()
+        echo = settings.ENVIRONMENT == Environment.DEVELOPMENT
+        options = _engine_options(settings.DB_POOL, settings.DB_STATEMENT)
+        QueryBuilder.configure_cache(settings.DB_STATEMENT.BUILDER_CACHE_SIZE)
+
+        self._connection_string = connection_string
+        self._echo = echo
+        self._options = options
+
+        self._pool_monitors: tuple[PoolMonitor, ...] = (PoolMonitor("sync"),)
         self._engine = create_engine(
             connection_string, 
-            echo=settings.ENVIRONMENT == Environment.DEVELOPMENT
+            echo=echo,
+            poolclass=self._pool_monitors[0].instrument(QueuePool),
+            **options
         )
+        # Created on first use, as nothing but the async repositories needs it.
+        self._async_engine: AsyncEngine | None = None
+
+        replica_monitors = [
+            PoolMonitor(f"replica-{i}") 
+            for i, _ in enumerate(replica_connection_strings, start=1)
+        ]
+        # An unreachable replica fails fast, so it is skipped rather than 
+        # holding up the sessions and lag probes connecting to it.
+        replica_options = {
+            **options,
+            "connect_args": {
+                **options["connect_args"],
+                "connect_timeout": settings.DB_REPLICA.CONNECT_TIMEOUT_SECONDS
+            }
+        }
+        self._replicas = ReplicaSet(
+            [
+                create_engine(
+                    replica, 
+                    echo=echo, 
+                    poolclass=monitor.instrument(QueuePool), 
+                    **replica_options
+                )
+                for replica, monitor in zip(
+                    replica_connection_strings, replica_monitors, strict=True
+                )
+            ],
+            balancing=settings.DB_REPLICA.BALANCING,
+            max_lag=settings.DB_REPLICA.MAX_LAG_SECONDS,
+            lag_check_interval=settings.DB_REPLICA.LAG_CHECK_SECONDS
+        )
+        self._pool_monitors += tuple(replica_monitors)
+
+        self._compiled_cache_monitors: list[CompiledCacheMonitor] = []
+        self._query_monitor: QueryMonitor | None = None
+        if settings.DB_INSTRUMENTATION.ENABLED:
+            self._query_monitor = QueryMonitor()
+
+        self._slow_query_log: SlowQueryLog | None = None
+        if settings.DB_SLOW_QUERY.THRESHOLD_MS > 0:
+            self._slow_query_log = SlowQueryLog(
+                threshold_seconds=settings.DB_SLOW_QUERY.THRESHOLD_MS / 1000,
+                max_entries=settings.DB_SLOW_QUERY.MAX_ENTRIES,
+                explain_sample_rate=settings.DB_SLOW_QUERY.EXPLAIN_SAMPLE_RATE
+            )
+
+        engines = [self._engine, *self._replicas.engines]
+        for engine, pool_monitor in zip(engines, self._pool_monitors, strict=True):
+            self._monitor(engine, pool_monitor.name)
+
+    def _monitor(
+        self, 
+        engine: Engine, 
+        name: str, 
+        explain_engine: Engine | None = None
+    ) -> None:
+        """Attach the statement cache, query and slow query monitors to an 
+        engine.
+        """
+        cache_monitor = CompiledCacheMonitor(name)
+        cache_monitor.attach(engine)
+        self._compiled_cache_monitors.append(cache_monitor)
+        if self._query_monitor is not None:
+            self._query_monitor.attach(engine)
+        if self._slow_query_log is not None:
+            self._slow_query_log.attach(engine, explain_engine)
+
+    def _get_async_engine(self) -> AsyncEngine:
+        """Get the async engine, creating it on first use.
+        """
+        if self._async_engine is None:
+            pool_monitor = PoolMonitor("async")
+            # psycopg 3 drives both engines; the async one has its own pool.
+            self._async_engine = create_async_engine(
+                self._connection_string, 
+                echo=self._echo,
+                poolclass=pool_monitor.instrument(AsyncAdaptedQueuePool),
+                **self._options
+            )
+            self._pool_monitors += (pool_monitor,)
+            # Its statements are explained on the primary.
+            self._monitor(self._async_engine.sync_engine, "async", self._engine)
+        return self._async_engine
+
+    @property
+    def pool_stats(self) -> Sequence[PoolStats]:
+        """Get a snapshot of the connection pool statistics of each engine.
+        """
+        return [monitor.stats for monitor in self._pool_monitors]
+
+    @property
+    def compiled_cache_stats(self) -> Sequence[CompiledCacheStats]:
+        """Get a snapshot of the compiled statement cache statistics of each 
+        engine.
+        """
+        return [monitor.stats for monitor in self._compiled_cache_monitors]
+
+    @property
+    def slow_queries(self) -> Sequence[SlowQuery]:
+        """Get the most recent slow statements of every engine, the most 
+        recent first.
+        """
+        if self._slow_query_log is None:
+            return []
+        return self._slow_query_log.entries
 
     def apply_migrations(self) -> None:
         """Apply all alembic migrations to the database.
@@ -61,15 +228,70 @@ class DatabaseContext:
             # Apply all migrations up to 'head' (latest)
             command.upgrade(alembic_cfg, "head")
     
+    def create_session(self, read_only: bool = False) -> Session:
+        """Create a database session owned by the caller.
+
+        Repositories flush their changes explicitly, so autoflush is off. 
+        Attributes are not expired on commit, so entities stay readable once 
+        the session is closed.
+
+        Parameters:
+            read_only (bool): 
+                If True, bind the session to a read replica. The primary is 
+                used when there is no replica within the allowed lag.
+        """
+        engine = (self._replicas.select() if read_only else None) or self._engine
+        return Session(engine, autoflush=False, expire_on_commit=False)
+    
     @contextmanager
-    def get_session(self) -> Iterator[Session]:
-        """Get a database session.
+    def get_session(self, read_only: bool = False) -> Iterator[Session]:
+        """Get a database session, committed when the block exits cleanly.
+
+        Parameters:
+            read_only (bool): If True, read from a replica when one is usable.
         """
-        session = Session(self._engine)
+        session = self.create_session(read_only)
         try:
             yield session
+            session.commit()
         except:
             session.rollback()
             raise
         finally:
             session.close()
+
+    @asynccontextmanager
+    async def get_async_session(self) -> AsyncIterator[AsyncSession]:
+        """Get an asynchronous database session, committed when the block 
+        exits cleanly.
+
+        The session is bound to the async engine, created on first use. It is 
+        not shared through the request's `UnitOfWork` and always uses the 
+        primary, never a read replica.
+
+        Attributes are not expired on commit, since they cannot be lazily 
+        reloaded outside of an awaited call.
+        """
+        session = AsyncSession(
+            self._get_async_engine(), autoflush=False, expire_on_commit=False
+        )
+        try:
+            yield session
+            await session.commit()
+        except:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+    async def dispose(self) -> None:
+        """Close all pooled connections of every engine.
+        """
+        if self._slow_query_log is not None:
+            self._slow_query_log.shutdown()
+        self._replicas.shutdown()
+        self._engine.dispose()
+        for replica in self._replicas.engines:
+            replica.dispose()
+        if self._async_engine is not None:
+            await self._async_engine.dispose()
@@ -0,0 +1,165 @@
+"""
+Bulk loading of table rows.
+"""
+
+import itertools
+import uuid
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any
+
+from sqlalchemy import Column, Connection, Table, column, select, table
+from sqlalchemy.dialects.postgresql import Insert, insert
+
+DEFAULT_BATCH_SIZE = 1000
+"""Rows sent per multi-row INSERT statement."""
+
+DEFAULT_COPY_THRESHOLD = 10_000
+"""Row count from which rows are streamed with COPY instead of INSERTs."""
+
+
+def insert_rows(
+    connection: Connection,
+    target: Table,
+    rows: Sequence[Mapping[str, Any]],
+    *,
+    conflict_columns: Sequence[str] | None = None,
+    update_columns: Sequence[str] = (),
+    update_values: Mapping[str, Any] | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    copy_threshold: int = DEFAULT_COPY_THRESHOLD
+) -> None:
+    """Insert rows into a table, optionally resolving conflicts.
+
+    Rows are sent as multi-row INSERT statements of `batch_size` rows. From
+    `copy_threshold` rows, if the driver supports it, they are streamed with
+    COPY instead; conflicts are then resolved by copying into a temporary
+    table first and inserting from it.
+
+    Parameters:
+        connection (Connection): The connection of the current transaction.
+        target (Table): The table to insert into.
+        rows (Sequence[Mapping[str, Any]]):
+            The rows to insert, keyed by column name. All rows have the same keys.
+        conflict_columns (Sequence[str] | None):
+            Columns of the unique constraint to resolve conflicts on, or None
+            to fail on conflict.
+        update_columns (Sequence[str]):
+            Columns overwritten with the inserted values on conflict. When
+            empty, conflicting rows are skipped.
+        update_values (Mapping[str, Any] | None):
+            Values additionally set on conflicting rows, keyed by column name.
+        batch_size (int): Rows per INSERT statement.
+        copy_threshold (int): Row count from which COPY is used.
+    """
+    if not rows:
+        return
+
+    columns = [target.c[name] for name in rows[0]]
+    if len(rows) >= copy_threshold and _supports_copy(connection):
+        if conflict_columns is None:
+            _copy(connection, target, columns, rows)
+        else:
+            _copy_upsert(
+                connection, target, columns, rows,
+                conflict_columns, update_columns, update_values or {}
+            )
+        return
+
+    for batch in _batched(rows, batch_size):
+        statement = insert(target).values(batch)
+        if conflict_columns is not None:
+            statement = _on_conflict(
+                statement, conflict_columns, update_columns, update_values or {}
+            )
+        connection.execute(statement)
+
+
+def _on_conflict(
+    statement: Insert,
+    conflict_columns: Sequence[str],
+    update_columns: Sequence[str],
+    update_values: Mapping[str, Any]
+) -> Insert:
+    if not update_columns:
+        return statement.on_conflict_do_nothing(index_elements=conflict_columns)
+    return statement.on_conflict_do_update(
+        index_elements=conflict_columns,
+        set_={
+            **{name: statement.excluded[name] for name in update_columns},
+            **update_values
+        }
+    )
+
+
+def _supports_copy(connection: Connection) -> bool:
+    dialect = connection.dialect
+    return dialect.name == "postgresql" and dialect.driver == "psycopg"
+
+
+def _copy(
+    connection: Connection,
+    target: Table | str,
+    columns: Sequence[Column[Any]],
+    rows: Iterable[Mapping[str, Any]]
+) -> None:
+    """Stream rows into a table with COPY.
+
+    Values go through the column types' bind processing, as they would for
+    an INSERT, e.g. to wrap JSONB documents.
+    """
+    dialect = connection.dialect
+    preparer = dialect.identifier_preparer
+    table_name = target if isinstance(target, str) else preparer.format_table(target)
+    column_names = ", ".join(preparer.format_column(c) for c in columns)
+    processors = [c.type.dialect_impl(dialect).bind_processor(dialect) for c in columns]
+
+    driver_connection = connection.connection.driver_connection
+    with driver_connection.cursor() as cursor: # type: ignore[union-attr]
+        with cursor.copy(f"COPY {table_name} ({column_names}) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row([
+                    process(row[c.name]) if process else row[c.name]
+                    for c, process in zip(columns, processors, strict=True)
+                ])
+
+
+def _copy_upsert(
+    connection: Connection,
+    target: Table,
+    columns: Sequence[Column[Any]],
+    rows: Iterable[Mapping[str, Any]],
+    conflict_columns: Sequence[str],
+    update_columns: Sequence[str],
+    update_values: Mapping[str, Any]
+) -> None:
+    """Stream rows into a temporary table with COPY, then insert them from it.
+
+    COPY cannot resolve conflicts itself. Should the transaction fail, the
+    temporary table goes away with it.
+    """
+    preparer = connection.dialect.identifier_preparer
+    staging_name = f"bulk_{uuid.uuid4().hex}"
+    staging = table(staging_name, *(column(c.name) for c in columns))
+    quoted_name = preparer.quote(staging_name)
+
+    driver_connection = connection.connection.driver_connection
+    driver_connection.execute( # type: ignore[union-attr]
+        f"CREATE TEMPORARY TABLE {quoted_name} "
+        f"(LIKE {preparer.format_table(target)} INCLUDING DEFAULTS) ON COMMIT DROP"
+    )
+    _copy(connection, quoted_name, columns, rows)
+    statement = insert(target).from_select(
+        [c.name for c in columns], select(*staging.c)
+    )
+    connection.execute(
+        _on_conflict(statement, conflict_columns, update_columns, update_values)
+    )
+    driver_connection.execute(f"DROP TABLE {quoted_name}") # type: ignore[union-attr]
+
+
+def _batched(
+    rows: Sequence[Mapping[str, Any]], size: int
+) -> Iterator[list[Mapping[str, Any]]]:
+    iterator = iter(rows)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
@@ -0,0 +1,63 @@
+"""
+Constraint violations reported by the database.
+"""
+
+from typing import Any
+
+from sqlalchemy import Column, Constraint, Index, Table, UniqueConstraint
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import ColumnProperty, Mapped, QueryableAttribute
+from sqlalchemy.sql import visitors
+
+UNIQUE_VIOLATION = "23505"
+
+
+def violated_unique_constraint(error: IntegrityError) -> str | None:
+    """Get the name of the unique index or constraint an error violated.
+
+    Returns:
+        str | None:
+            The name, or None if the error is not a unique violation or the
+            driver does not report it.
+    """
+    if getattr(error.orig, "sqlstate", None) != UNIQUE_VIOLATION:
+        return None
+    diagnostic = getattr(error.orig, "diag", None)
+    return getattr(diagnostic, "constraint_name", None)
+
+
+def violates_unique(error: IntegrityError, attribute: Mapped[Any]) -> bool:
+    """Check if an error is a violation of a unique index or constraint over
+    the column of a mapped attribute, e.g. `col(User.username)`, including 
+    one on an expression of it such as `lower(name)`.
+    """
+    name = violated_unique_constraint(error)
+    if name is None:
+        return False
+
+    if not isinstance(attribute, QueryableAttribute) or \
+            not isinstance(attribute.property, ColumnProperty):
+        raise TypeError("A mapped column attribute is expected.")
+    [column] = attribute.property.columns
+    table = column.table if isinstance(column, Column) else None
+    if not isinstance(table, Table):
+        return False
+
+    constraints: list[Index | Constraint] = [*table.indexes, *table.constraints]
+    for constraint in constraints:
+        if constraint.name != name:
+            continue
+        expressions: list[Any]
+        if isinstance(constraint, Index):
+            expressions = list(constraint.expressions)
+        elif isinstance(constraint, UniqueConstraint):
+            expressions = list(constraint.columns)
+        else:
+            return False
+        return any(
+            element is column
+            for expression in expressions
+            if not isinstance(expression, str)
+            for element in visitors.iterate(expression)
+        )
+    return False
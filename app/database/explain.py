@@ -0,0 +1,60 @@
+"""
+Query plans from the PostgreSQL planner.
+"""
+
+from collections.abc import Mapping
+from typing import Any
+
+from sqlalchemy import Connection, Executable
+
+
+def explain(
+    connection: Connection,
+    statement: Executable,
+    parameters: Mapping[str, Any] | None = None
+) -> dict[str, Any]:
+    """Get the plan the planner chooses for a statement, without running it.
+
+    Parameters:
+        connection (Connection): The connection to plan the statement on.
+        statement (Executable): The statement to plan.
+        parameters (Mapping[str, Any] | None): Values of its bound parameters.
+
+    Returns:
+        dict[str, Any]: The root node of the plan, as given by `EXPLAIN (FORMAT JSON)`.
+    """
+    compiled = statement.compile(dialect=connection.dialect) # type: ignore[attr-defined]
+    return explain_sql(
+        connection, compiled.string, compiled.construct_params(parameters)
+    )
+
+
+def explain_sql(
+    connection: Connection,
+    sql: str,
+    parameters: Any = None,
+    analyze: bool = False
+) -> dict[str, Any]:
+    """Get the plan of a statement given as SQL in the driver's parameter style.
+
+    Parameters:
+        connection (Connection): The connection to plan the statement on.
+        sql (str): The SQL of the statement.
+        parameters (Any): Values of its parameters, as passed to the driver.
+        analyze (bool): 
+            Whether to run the statement, for the actual row counts, timings
+            and buffer usage of each node.
+
+    Returns:
+        dict[str, Any]: The root node of the plan, as given by `EXPLAIN (FORMAT JSON)`.
+    """
+    options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze else "FORMAT JSON"
+    result = connection.exec_driver_sql(f"EXPLAIN ({options}) {sql}", parameters)
+    [document] = result.scalar_one()
+    return document["Plan"] # type: ignore[no-any-return]
+
+
+def estimated_rows(plan: Mapping[str, Any]) -> int:
+    """Get the number of rows the planner estimates a plan to return.
+    """
+    return int(plan["Plan Rows"])
@@ -1,36 +1,45 @@
 import logging
 
+from dependency_injector.wiring import Provide, inject
 from sqlmodel import select
 
 import app.constants as constants
 from app.core.container import DIContainer
+from app.database import DatabaseContext, UnitOfWork
+from app.managers import RoleManager, UserManager
 from app.models.auth import Role, User
 from app.models.food import FoodCategory, FoodItem, NutritionContent
 
 logger = logging.getLogger(__name__)
 
-__app_db_context = DIContainer.app_db_context()
-__role_manager = DIContainer.role_manager()
-__user_manager = DIContainer.user_manager()
 
-
-def init_db() -> None:
+@inject
+def init_db(
+    app_db_context: DatabaseContext = Provide[DIContainer.app_db_context]
+) -> None:
     """Initialize the database."""
     try:
-        __app_db_context.apply_migrations()
+        app_db_context.apply_migrations()
     except Exception as e:
         logger.error("Error initializing the database.", exc_info=True)
         raise e
 
 
-def seed_db() -> None:
+@inject
+def seed_db(
+    app_db_context: DatabaseContext = Provide[DIContainer.app_db_context],
+    role_manager: RoleManager = Provide[DIContainer.role_manager],
+    user_manager: UserManager = Provide[DIContainer.user_manager],
+    unit_of_work: UnitOfWork = Provide[DIContainer.unit_of_work]
+) -> None:
     """Seed the database with initial data."""
     try:
-        __seed_roles()
-        __seed_admin_user()
-        __seed_basic_user()
-        __seed_app_user()
-        with __app_db_context.get_session() as db_session:
+        __seed_roles(role_manager)
+        __seed_admin_user(user_manager)
+        __seed_basic_user(user_manager)
+        __seed_app_user(user_manager)
+        unit_of_work.commit()
+        with app_db_context.get_session() as db_session:
             if db_session.exec(select(1).select_from(FoodCategory)).first() is None:
                 db_session.add_all(__food_categories)
 
@@ -41,46 +50,48 @@ def seed_db() -> None:
     except Exception as e:
         logger.error("Error seeding the database.", exc_info=True)
         raise e
+    finally:
+        unit_of_work.close()
 
 
-def __seed_roles() -> None:
+def __seed_roles(role_manager: RoleManager) -> None:
     roles_names = list(constants.roles)
     for role_name in roles_names:
-        if __role_manager.role_exists(role_name):
+        if role_manager.role_exists(role_name):
             continue
-        __role_manager.create(Role(name=role_name))
+        role_manager.create(Role(name=role_name))
 
 
-def __seed_admin_user() -> None:
-    user = __user_manager.get_by_email(constants.users.admin_user)
+def __seed_admin_user(user_manager: UserManager) -> None:
+    user = user_manager.get_by_email(constants.users.admin_user)
     if not user:
         user = User(
             username="admin",
             email_address=constants.users.admin_user,
             is_active=True,
         )
-        __user_manager.create(user, constants.users.password)
+        user_manager.create(user, constants.users.password)
 
-    __user_manager.add_to_role(user, constants.roles.ADMINISTRATOR)
+    user_manager.add_to_role(user, constants.roles.ADMINISTRATOR)
 
 
-def __seed_basic_user() -> None:
-    user = __user_manager.get_by_email(constants.users.basic_user)
+def __seed_basic_user(user_manager: UserManager) -> None:
+    user = user_manager.get_by_email(constants.users.basic_user)
     if not user:
         user = User(
             username="basic",
             email_address=constants.users.basic_user,
             is_active=True,
         )
-        __user_manager.create(user, constants.users.password)
+        user_manager.create(user, constants.users.password)
 
-    __user_manager.add_to_role(user, constants.roles.VIEWER)
+    user_manager.add_to_role(user, constants.roles.VIEWER)
 
 
-def __seed_app_user() -> None:
+def __seed_app_user(user_manager: UserManager) -> None:
     from app.models.user import ActivityLevel, AppUser, Gender, HealthGoal
 
-    user = __user_manager.get_by_email("app.user@mail.com")
+    user = user_manager.get_by_email("app.user@mail.com")
     if not user:
         user = User(
             username="app_user",
@@ -101,7 +112,7 @@ def __seed_app_user() -> None:
 
         user.app_user = user_profile
 
-        __user_manager.create(user, constants.users.password)
+        user_manager.create(user, constants.users.password)
 
 
 __food_categories = (
@@ -146,3 +157,4 @@ if __name__ == "__main__":
     container = DIContainer()
     init_db()
     seed_db()
+    container.password_hasher().shutdown()
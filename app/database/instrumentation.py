@@ -0,0 +1,140 @@
+"""
+Per-request database statement instrumentation.
+"""
+
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, final
+
+from sqlalchemy import Engine, event
+
+
+@dataclass(frozen=True)
+@final
+class QueryStats:
+    """A snapshot of the statements executed on behalf of a request.
+
+    Attributes:
+        statements (int): Number of statements executed.
+        duration_seconds (float): Total time spent executing them.
+        repeated_statements (Mapping[str, int]):
+            Statements executed at least the repeated statement threshold
+            number of times, with their number of executions.
+    """
+
+    statements: int
+    duration_seconds: float
+    repeated_statements: Mapping[str, int]
+
+
+class QueryRecorder:
+    """Collects the statements executed on behalf of a request.
+    """
+
+    def __init__(self, repeated_statement_threshold: int) -> None:
+        """
+        Parameters:
+            repeated_statement_threshold (int):
+                Executions of the same statement from which it is reported
+                as repeated, a likely N+1 query.
+        """
+        self.__repeated_statement_threshold = repeated_statement_threshold
+        self.__lock = threading.Lock()
+        self.__duration = 0.0
+        self.__executions: Counter[str] = Counter()
+
+    @property
+    def stats(self) -> QueryStats:
+        """Get a snapshot of the statements executed so far.
+        """
+        with self.__lock:
+            return QueryStats(
+                statements=self.__executions.total(),
+                duration_seconds=self.__duration,
+                repeated_statements={
+                    statement: count
+                    for statement, count in self.__executions.most_common()
+                    if count >= self.__repeated_statement_threshold
+                }
+            )
+
+    def record(self, statement: str, duration: float) -> None:
+        """Record the execution of a statement.
+        """
+        with self.__lock:
+            self.__executions[statement] += 1
+            self.__duration += duration
+
+
+_recorder: ContextVar[QueryRecorder | None] = ContextVar("query_recorder", default=None)
+
+
+@contextmanager
+def record_queries(repeated_statement_threshold: int) -> Iterator[QueryRecorder]:
+    """Record the statements executed by instrumented engines within the
+    block, including by the threads and tasks it starts.
+
+    Parameters:
+        repeated_statement_threshold (int):
+            Executions of the same statement from which it is reported as
+            repeated.
+    """
+    recorder = QueryRecorder(repeated_statement_threshold)
+    token = _recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _recorder.reset(token)
+
+
+class QueryMonitor:
+    """Times the statements executed by engines for the current recorder.
+    """
+
+    def attach(self, engine: Engine) -> None:
+        """Time the statements of the engine.
+
+        Parameters:
+            engine (Engine): The engine, or the sync engine of an async one.
+        """
+        event.listen(engine, "before_cursor_execute", self.__start)
+        event.listen(engine, "after_cursor_execute", self.__record)
+        event.listen(engine, "handle_error", self.__discard)
+
+    def __start(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool
+    ) -> None:
+        if _recorder.get() is not None:
+            conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    def __record(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool
+    ) -> None:
+        recorder = _recorder.get()
+        started = conn.info.get("query_start_time")
+        if recorder is None or not started:
+            return
+        recorder.record(statement, time.perf_counter() - started.pop())
+
+    def __discard(self, context: Any) -> None:
+        started = context.connection.info.get("query_start_time") \
+            if context.connection is not None else None
+        if started:
+            started.pop()
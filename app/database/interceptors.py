@@ -1,7 +1,15 @@
 from datetime import UTC, datetime
 
-from sqlalchemy import event
-from sqlmodel import Session
+from sqlalchemy import event, false, inspect
+from sqlalchemy.orm import (
+    Mapper,
+    ORMExecuteState,
+    configure_mappers,
+    with_loader_criteria,
+)
+from sqlalchemy.orm.util import LoaderCriteriaOption
+from sqlmodel import Session, col
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models import AuditableEntity, SoftDeleteEntity
 
@@ -16,7 +24,57 @@ def set_auditable_modified_time(mapper, connection, target) -> None: # type: ign
     target.last_modified_utc = datetime.now(UTC)
 
 
-def soft_delete_entity(db_session: Session, entity: SoftDeleteEntity) -> None:
+@event.listens_for(Session, "do_orm_execute")
+def exclude_soft_deleted_entities(execute_state: ORMExecuteState) -> None:
+    """Exclude soft-deleted entities from every ORM query, including the
+    relationships loaded from its results.
+
+    Queries opt out with the `include_deleted` execution option.
+    """
+    if (
+        not execute_state.is_select
+        or execute_state.is_column_load
+        or execute_state.is_relationship_load
+        or execute_state.execution_options.get("include_deleted", False)
+    ):
+        return
+
+    configure_mappers()
+    if _soft_delete_criteria:
+        statement = execute_state.statement.options(*_soft_delete_criteria)
+        execute_state.statement = statement
+
+
+_soft_delete_criteria: tuple[LoaderCriteriaOption, ...] = ()
+
+
+@event.listens_for(Mapper, "after_configured")
+def collect_soft_delete_criteria() -> None:
+    """Build the criteria excluding soft-deleted entities once mappers are 
+    configured, rather than on every query.
+    """
+    global _soft_delete_criteria
+    _soft_delete_criteria = tuple(
+        with_loader_criteria(
+            model, col(model.is_deleted) == false(), include_aliases=True
+        )
+        for model in _soft_delete_models(SoftDeleteEntity)
+    )
+
+
+def _soft_delete_models(base: type[SoftDeleteEntity]) -> list[type[SoftDeleteEntity]]:
+    models = []
+    for cls in base.__subclasses__():
+        if inspect(cls, raiseerr=False) is not None:
+            models.append(cls)
+        models.extend(_soft_delete_models(cls))
+    return models
+
+
+def soft_delete_entity(
+    db_session: Session | AsyncSession, 
+    entity: SoftDeleteEntity
+) -> None:
     entity.is_deleted = True
     entity.deleted_utc = datetime.now(UTC)
     db_session.add(entity)
@@ -0,0 +1,149 @@
+"""
+Connection pool instrumentation.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, final
+
+from sqlalchemy.pool import Pool
+
+
+@dataclass(frozen=True)
+@final
+class PoolStats:
+    """A snapshot of connection pool statistics.
+
+    Attributes:
+        name (str): Name of the engine owning the pool.
+        pool_size (int): Number of connections kept open in the pool.
+        max_overflow (int): Number of connections allowed beyond the pool size.
+        checked_out (int): Number of connections currently in use.
+        idle (int): Number of open connections waiting in the pool.
+        overflow (int): Number of open connections beyond the pool size.
+        checkouts (int): Number of connections handed out.
+        checkout_errors (int):
+            Number of checkouts that failed, either by timing out waiting for
+            a free connection or by failing to connect.
+        total_wait_seconds (float): Total time spent waiting for a connection.
+        max_wait_seconds (float): Longest time spent waiting for a connection.
+    """
+
+    name: str
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    idle: int
+    overflow: int
+    checkouts: int
+    checkout_errors: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+    @property
+    def average_wait_seconds(self) -> float:
+        """The average time spent waiting for a connection.
+        """
+        return self.total_wait_seconds / self.checkouts if self.checkouts else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """The ratio of connections in use to the connections the pool may open.
+        """
+        capacity = self.pool_size + max(self.max_overflow, 0)
+        return min(self.checked_out / capacity, 1.0) if capacity else 0.0
+
+
+class PoolMonitor:
+    """Collects checkout counts and wait times of a connection pool.
+
+    `instrument` derives a pool class whose checkouts are timed by the
+    monitor. The class survives `Engine.dispose`, which recreates the pool
+    from its own class.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Parameters:
+            name (str): Name of the engine owning the pool.
+        """
+        self.__name = name
+        self.__lock = threading.Lock()
+        self.__pool: Pool | None = None
+        self.__checkouts = 0
+        self.__checkout_errors = 0
+        self.__total_wait = 0.0
+        self.__max_wait = 0.0
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def stats(self) -> PoolStats:
+        """Get a snapshot of the pool statistics.
+        """
+        pool = self.__pool
+        pool_size = _call(pool, "size")
+        checked_out = _call(pool, "checkedout")
+        with self.__lock:
+            return PoolStats(
+                name=self.__name,
+                pool_size=pool_size,
+                max_overflow=getattr(pool, "_max_overflow", 0),
+                checked_out=checked_out,
+                idle=_call(pool, "checkedin"),
+                overflow=max(checked_out - pool_size, 0),
+                checkouts=self.__checkouts,
+                checkout_errors=self.__checkout_errors,
+                total_wait_seconds=self.__total_wait,
+                max_wait_seconds=self.__max_wait
+            )
+
+    def instrument(self, pool_class: type[Pool]) -> type[Pool]:
+        """Derive a pool class reporting its checkouts to this monitor.
+
+        Parameters:
+            pool_class (type[Pool]): The pool class the engine would use.
+        """
+        monitor = self
+
+        class InstrumentedPool(pool_class):  # type: ignore[valid-type, misc]
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
+                super().__init__(*args, **kwargs)
+                monitor._attach(self)
+
+            def _do_get(self) -> Any:
+                start = time.perf_counter()
+                try:
+                    connection = super()._do_get()
+                except Exception:
+                    monitor._record_error()
+                    raise
+                monitor._record_checkout(time.perf_counter() - start)
+                return connection
+
+        InstrumentedPool.__name__ = f"Instrumented{pool_class.__name__}"
+        InstrumentedPool.__qualname__ = InstrumentedPool.__name__
+        return InstrumentedPool
+
+    def _attach(self, pool: Pool) -> None:
+        self.__pool = pool
+
+    def _record_checkout(self, wait: float) -> None:
+        with self.__lock:
+            self.__checkouts += 1
+            self.__total_wait += wait
+            self.__max_wait = max(self.__max_wait, wait)
+
+    def _record_error(self) -> None:
+        with self.__lock:
+            self.__checkout_errors += 1
+
+
+def _call(pool: Pool | None, method: str) -> int:
+    """Read a pool counter, which not every pool implementation provides.
+    """
+    fn = getattr(pool, method, None)
+    return fn() if callable(fn) else 0
@@ -1,29 +1,99 @@
+import base64
+import hashlib
+import inspect as pyinspect
+import json
+import uuid
 from abc import ABC
+from collections.abc import Callable, Hashable, Sequence
+from datetime import datetime
+from enum import StrEnum
 from typing import (
-    Any, 
+    Any,
+    ClassVar,
     Generic,
     NamedTuple,
-    Self, 
+    Self,
     TypeVar,
     final
 )
 
-from sqlalchemy import ColumnElement, UnaryExpression, inspect
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Row,
+    TypeDecorator,
+    and_,
+    bindparam,
+    inspect,
+    tuple_
+)
 from sqlalchemy.orm import (
-    InstrumentedAttribute, 
-    QueryableAttribute, 
-    Mapper, 
-    selectinload
+    InstrumentedAttribute,
+    QueryableAttribute,
+    Mapper,
+    defer,
+    joinedload,
+    load_only,
+    selectinload,
+    subqueryload
 )
 from sqlalchemy.sql.selectable import FromClause
 from sqlmodel import or_, select
 from sqlmodel.sql.expression import SelectOfScalar
 
-from app.models import SoftDeleteEntity
+from app.utils.cache import CacheStats, LRUCache
 
 
 T = TypeVar('T')
 
+_Criteria = Callable[..., ColumnElement[bool]]
+_Ordering = InstrumentedAttribute[Any] | Callable[[], ColumnElement[Any]]
+
+
+class LoadStrategy(StrEnum):
+    """How an included relationship is eager-loaded.
+
+    Attributes:
+        SELECT_IN: 
+            A second SELECT of the related rows by the keys of the results.
+            Suits collections.
+        JOINED: 
+            A LEFT OUTER JOIN in the statement itself, saving a round trip.
+            Suits many-to-one and one-to-one relationships only, since a
+            joined collection would multiply the rows paginated.
+        SUBQUERY: 
+            A second SELECT joining the related rows to the original query 
+            as a subquery. Suits collections of large result sets, whose keys
+            would make too long an IN list.
+    """
+
+    SELECT_IN = "selectin"
+    JOINED = "joined"
+    SUBQUERY = "subquery"
+
+
+_LOADERS: dict[LoadStrategy, Callable[..., Any]] = {
+    LoadStrategy.SELECT_IN: selectinload,
+    LoadStrategy.JOINED: joinedload,
+    LoadStrategy.SUBQUERY: subqueryload,
+}
+
+
+class _SortKey(NamedTuple):
+    """
+    A column the results are ordered by.
+
+    Attributes:
+        column (_Ordering): The mapped column, or a function returning the expression.
+        descending (bool): Whether the results are in descending order.
+        value (Callable[[Any], Any] | None):
+            Reads the value of the expression from a result, for keyset pagination.
+    """
+
+    column: _Ordering
+    descending: bool
+    value: Callable[[Any], Any] | None = None
+
 
 class _Pagination(NamedTuple):
     """
@@ -43,15 +113,25 @@ class QueryBuilder(ABC, Generic[T]):
     A generic, extensible query builder for SQLAlchemy ORM models.
 
     This class provides a fluent interface for constructing complex database queries
-    with filtering, eager loading, ordering, searching, pagination, and soft-delete support.
+    with filtering, eager loading, column projection, ordering, searching, pagination, 
+    and soft-delete support.
+
+    Built statements are cached by query shape: which filters, includes and
+    ordering are present. Values are left as bound parameters, supplied at
+    execution through `parameters`, so a cache hit reuses the statement and
+    the SQL compiled for it. A query is only cached when all of its parts are
+    declared by shape; see `_where` and `_order_by`.
 
     Type Parameters:
         T: The SQLAlchemy ORM model type.
-    
+
     Attributes:
         model (Type[T]): The model class associated with this query builder.
     """
 
+    _statement_cache: ClassVar[LRUCache[Hashable, SelectOfScalar[Any]]] = \
+        LRUCache(max_size=500)
+
     def __init__(self, model: type[T]) -> None:
         """
         Initializes a new instance of a QueryBuilder.
@@ -60,12 +140,18 @@ class QueryBuilder(ABC, Generic[T]):
             model (Type[T]): The SQLAlchemy ORM model class to build queries for.
         """
         self.__model = model
-        self.__filters: list[ColumnElement[bool]] = []
+        self.__filters: list[Callable[[], ColumnElement[bool]]] = []
         self.__filter_joins: list[Any] = []
-        self.__includes: list[Any] = []
-        self.__ordering: list[UnaryExpression[Any]] = []
+        self.__includes: list[tuple[QueryableAttribute[Any], LoadStrategy]] = []
+        self.__load_only: list[InstrumentedAttribute[Any]] = []
+        self.__deferred: list[QueryableAttribute[Any]] = []
+        self.__ordering: list[_SortKey] = []
         self.__pagination: _Pagination = _Pagination()
+        self.__keyset: bool = False
+        self.__cursor: list[str] | None = None
         self.__with_deleted: bool = False
+        self.__shape: list[Hashable] | None = []
+        self.__parameters: dict[str, Any] = {}
 
     @property
     def model(self) -> type[T]:
@@ -73,32 +159,128 @@ class QueryBuilder(ABC, Generic[T]):
         """
         return self.__model
 
+    @property
+    def parameters(self) -> dict[str, Any]:
+        """Get the bound parameter values to execute the built statement with.
+        """
+        return self.__parameters
+
+    @property
+    def columns(self) -> list[InstrumentedAttribute[Any]]:
+        """Get the columns a row projection of the model selects: its primary
+        key and the `_load_only` columns, or all of its columns without them.
+        """
+        mapper: Mapper[Any] = inspect(self.__model, raiseerr=True)
+        if not self.__load_only:
+            return [getattr(self.__model, column.key) for column in mapper.column_attrs]
+        primary_key = [
+            getattr(self.__model, mapper.get_property_by_column(column).key)
+            for column in mapper.primary_key
+        ]
+        return [*primary_key, *self.__load_only]
+
+    @property
+    def is_first_page(self) -> bool:
+        """Whether the results are taken from the start, without an offset
+        or a cursor.
+        """
+        return self.__pagination.skip == 0 and self.__cursor is None
+
+    @classmethod
+    def cache_stats(cls) -> CacheStats:
+        """Get a snapshot of the statement cache statistics.
+        """
+        return cls._statement_cache.stats
+
+    @classmethod
+    def configure_cache(cls, max_size: int) -> None:
+        """Replace the statement cache with an empty one of the given size.
+
+        Raises:
+            ValueError: If the max_size is less than or equal to 0.
+        """
+        cls._statement_cache = LRUCache(max_size=max_size)
+
     @final
-    def _include(self, attribute: QueryableAttribute[Any], condition: bool = True) -> Self:
-        """Eager-load a relationship if the condition is True.
+    def _include(
+        self, 
+        attribute: QueryableAttribute[Any], 
+        condition: bool = True,
+        strategy: LoadStrategy = LoadStrategy.SELECT_IN
+    ) -> Self:
+        """Eager-load a relationship if the condition is True, with the
+        given strategy.
+
+        Raises:
+            ValueError: If a collection is to be loaded with a join.
         """
-        if condition:
-            self.__includes.append(selectinload(attribute))
+        if not condition:
+            return self
+        if strategy is LoadStrategy.JOINED and attribute.property.uselist:
+            raise ValueError(
+                f"Collection {attribute.class_.__name__}.{attribute.key} "
+                "cannot be loaded with a join."
+            )
+        self.__includes.append((attribute, strategy))
+        self.__add_shape("include", attribute.parent, attribute.key, strategy)
+        return self
+
+    @final
+    def _load_only(self, *columns: InstrumentedAttribute[Any]) -> Self:
+        """Select only the given columns of the model, along with its primary
+        key; the others are loaded on access.
+
+        The columns a keyset cursor is read from must be among them.
+        """
+        self.__load_only.extend(columns)
+        self.__add_shape("load_only", tuple(column.key for column in columns))
         return self
-    
+
     @final
-    def _order_by(self, column: InstrumentedAttribute[Any]) -> Self:
+    def _defer(self, *columns: InstrumentedAttribute[Any]) -> Self:
+        """Leave the given columns of the model out of the statement; they
+        are loaded on access.
+        """
+        self.__deferred.extend(columns)
+        self.__add_shape("defer", tuple(column.key for column in columns))
+        return self
+
+    @final
+    def _order_by(
+        self,
+        column: _Ordering,
+        value: Callable[[T], Any] | None = None
+    ) -> Self:
         """Order the results in ascending order by the given column.
+
+        An expression other than a mapped column is given as a function
+        returning it, along with a function reading its value from a result
+        if the query uses keyset pagination.
         """
-        self.__ordering.append(column.asc())
+        self.__ordering.append(_SortKey(column, False, value))
+        self.__add_shape("order_by", self.__ordering_shape(column))
         return self
-    
+
     @final
-    def _order_by_desc(self, column: InstrumentedAttribute[Any]) -> Self:
+    def _order_by_desc(
+        self,
+        column: _Ordering,
+        value: Callable[[T], Any] | None = None
+    ) -> Self:
         """Order the results in descending order by the given column.
+
+        An expression other than a mapped column is given as a function
+        returning it, along with a function reading its value from a result
+        if the query uses keyset pagination.
         """
-        self.__ordering.append(column.desc())
+        self.__ordering.append(_SortKey(column, True, value))
+        self.__add_shape("order_by_desc", self.__ordering_shape(column))
         return self
-    
+
     @final
     def _search(
-        self, 
-        term: str | None, 
+        self,
+        term: str | None,
         *columns: InstrumentedAttribute[str],
         condition: bool = True
     ) -> Self: # TODO: fix: joins, but no search result
@@ -106,11 +288,10 @@ class QueryBuilder(ABC, Generic[T]):
         """
         if not condition or not term:
             return self
-        
+
         if not columns:
             raise ValueError("No columns provided for search. At least one column must be specified.")
-        
-        expressions = []
+
         for column in columns:
             column_type = column.parent.class_
             if column_type != self.__model:
@@ -127,15 +308,19 @@ class QueryBuilder(ABC, Generic[T]):
                 if column_type not in self.__filter_joins:
                     self.__filter_joins.append(column_type)
 
-            expressions.append(column.icontains(term))
-
-        self.__filters.append(or_(*expressions))
+        name = self.__bind_parameter("term", term)
+        self.__filters.append(
+            lambda: or_(*(column.icontains(bindparam(name)) for column in columns))
+        )
+        self.__add_shape(
+            "search", tuple((column.class_, column.key) for column in columns)
+        )
 
         return self
-    
+
     def __resolve_relationship(
-        self, 
-        base_model: type[Any], 
+        self,
+        base_model: type[Any],
         target_model: type[Any]
     ) -> tuple[Any, FromClause | None] | None:
         mapper = inspect(base_model) # type: Mapper[Any]
@@ -145,14 +330,41 @@ class QueryBuilder(ABC, Generic[T]):
                 rel_secondary = rel.secondary
                 return getattr(base_model, rel.key), rel_secondary
         return None
-    
+
     @final
-    def _where(self, expressions: ColumnElement[bool]) -> Self:
+    def _where(
+        self,
+        expressions: ColumnElement[bool] | _Criteria,
+        **parameters: Any
+    ) -> Self:
         """Add a filter expression to the query.
+
+        The filter is given either as an expression, or as a criteria
+        function with the values of its parameters. Only the latter is cached:
+        the function is called with a bound parameter in place of each value
+        when the statement is built. It must not close over any state, so that
+        its code alone identifies the filter.
+
+        Example:
+            self._where(lambda name: col(Food.name).istartswith(name), name=name)
         """
-        self.__filters.append(expressions)
+        if isinstance(expressions, ColumnElement):
+            expression = expressions
+            self.__filters.append(lambda: expression)
+            self.__shape = None
+            return self
+
+        criteria = expressions
+        names = {
+            key: self.__bind_parameter(key, value)
+            for key, value in parameters.items()
+        }
+        self.__filters.append(
+            lambda: criteria(**{key: bindparam(name) for key, name in names.items()})
+        )
+        self.__add_shape("where", _code_of(criteria), tuple(names))
         return self
-    
+
     @final
     def _paginate(self, skip: int, take: int) -> Self:
         """Set pagination (offset and limit) for the query.
@@ -160,8 +372,56 @@ class QueryBuilder(ABC, Generic[T]):
         if self.__pagination.skip > 0 or self.__pagination.take > 0:
             raise ValueError("Pagination already set")
         self.__pagination = _Pagination(skip, take)
+        if skip > 0:
+            self.__parameters["skip"] = skip
+        if take > 0:
+            self.__parameters["take"] = take
+        return self
+
+    @final
+    def _paginate_after(self, cursor: str | None, take: int) -> Self:
+        """Set keyset pagination for the query: take the results following
+        the one the cursor was issued for, or the first results without one.
+
+        Unlike an offset, the position is found through the index matching
+        the ordering, so every page costs the same as the first. The ordering
+        must be set beforehand.
+
+        Raises:
+            ValueError: If the cursor was not issued for this ordering.
+        """
+        if self.__pagination.skip > 0 or self.__pagination.take > 0:
+            raise ValueError("Pagination already set")
+        self.__pagination = _Pagination(0, take)
+        self.__keyset = True
+        if take > 0:
+            self.__parameters["take"] = take
+
+        if cursor is not None:
+            keys = self.__sort_keys()
+            values = _decode_cursor(cursor, self.__cursor_fingerprint())
+            if len(values) != len(keys):
+                raise ValueError("Invalid pagination cursor")
+            self.__cursor = [
+                self.__bind_parameter(
+                    "cursor", _from_json(value, self.__sort_expression(key).type)
+                )
+                for key, value in zip(keys, values, strict=True)
+            ]
+        self.__add_shape("after", cursor is not None)
         return self
-    
+
+    def cursor_after(self, item: T | Row[Any]) -> str:
+        """Get the cursor to continue keyset pagination after the given 
+        result, an entity or a row of `columns`.
+        """
+        values = [
+            key.value(item) if key.value is not None 
+            else getattr(item, key.column.key) # type: ignore[union-attr]
+            for key in self.__sort_keys()
+        ]
+        return _encode_cursor(self.__cursor_fingerprint(), values)
+
     @final
     def _with_deleted(self, condition: bool = True) -> Self:
         """Include soft-deleted records if the condition is True.
@@ -169,19 +429,22 @@ class QueryBuilder(ABC, Generic[T]):
         if condition:
             self.__with_deleted = True
         return self
-    
+
     def build(
-        self, 
-        statement: SelectOfScalar[Any] | None = None, 
+        self,
+        statement: SelectOfScalar[Any] | None = None,
         criteriaOnly: bool = False
     ) -> SelectOfScalar[Any]:
         """
         Build and return the final SQLAlchemy Select statement.
 
+        The statement is taken from the statement cache when a query of the
+        same shape has been built on the same base statement before.
+
         Parameters:
-            statement (SelectOfScalar[Any] | None): 
+            statement (SelectOfScalar[Any] | None):
                 An optional base statement to build upon.
-            criteriaOnly (bool): 
+            criteriaOnly (bool):
                 If True, only apply filters without eager loading or ordering.
 
         Returns:
@@ -190,28 +453,44 @@ class QueryBuilder(ABC, Generic[T]):
         if statement is None:
             statement = select(self.__model)
 
+        key = self.__cache_key(statement, criteriaOnly)
+        if key is not None:
+            cached = self._statement_cache.get(key)
+            if cached is not None:
+                return cached
+
         for join in self.__filter_joins:
             statement = statement.join(join)
 
-        statement = statement.where(*self.__filters)
+        statement = statement.where(*(build() for build in self.__filters))
 
-        if not self.__with_deleted and issubclass(self.__model, SoftDeleteEntity):
-            statement = statement.where(not self.__model.is_deleted)
+        if self.__with_deleted:
+            statement = statement.execution_options(include_deleted=True)
 
         if not criteriaOnly:
-            statement = statement.options(*self.__includes)
-            statement = statement.order_by(*self.__ordering)
+            if _selects_entity(statement, self.__model):
+                statement = statement.options(*self.__load_options())
+            keys = self.__sort_keys()
+            statement = statement.order_by(*(
+                self.__sort_expression(key).desc() if key.descending
+                else self.__sort_expression(key).asc()
+                for key in keys
+            ))
+            if self.__cursor is not None:
+                statement = statement.where(self.__after_cursor(keys, self.__cursor))
 
             if self.__pagination.skip > 0:
-                statement = statement.offset(self.__pagination.skip)
+                statement = statement.offset(bindparam("skip", type_=Integer))
             if self.__pagination.take > 0:
-                statement = statement.limit(self.__pagination.take)
+                statement = statement.limit(bindparam("take", type_=Integer))
 
+        if key is not None:
+            self._statement_cache.set(key, statement)
         return statement
-    
+
     def __call__(
-        self, 
-        statement: SelectOfScalar[Any], 
+        self,
+        statement: SelectOfScalar[Any],
         criteriaOnly: bool = False
     ) -> SelectOfScalar[Any]:
         """
@@ -219,10 +498,181 @@ class QueryBuilder(ABC, Generic[T]):
 
         Parameters:
             statement (SelectOfScalar[Any]): The base statement to build upon.
-            criteriaOnly (bool): 
+            criteriaOnly (bool):
                 If True, only apply filters without eager loading or ordering.
 
         Returns:
             SelectOfScalar[Any]: The final SQLAlchemy Select statement.
         """
         return self.build(statement, criteriaOnly)
+
+    def __load_options(self) -> list[Any]:
+        options: list[Any] = [
+            _LOADERS[strategy](include) for include, strategy in self.__includes
+        ]
+        if self.__load_only:
+            options.append(load_only(*self.__load_only))
+        options.extend(defer(column) for column in self.__deferred)
+        return options
+
+    def __bind_parameter(self, key: str, value: Any) -> str:
+        """Register a parameter value under a name unique within the query.
+        """
+        name = f"{key}_{len(self.__parameters)}"
+        self.__parameters[name] = value
+        return name
+
+    def __add_shape(self, *part: Hashable) -> None:
+        if self.__shape is not None and None not in part:
+            self.__shape.append(part)
+        else:
+            self.__shape = None
+
+    def __cache_key(
+        self,
+        statement: SelectOfScalar[Any],
+        criteriaOnly: bool
+    ) -> Hashable | None:
+        if self.__shape is None:
+            return None
+        base_key = statement._generate_cache_key()
+        if base_key is None:
+            return None
+        return (
+            type(self),
+            self.__model,
+            base_key.key,
+            criteriaOnly,
+            self.__with_deleted,
+            self.__pagination.skip > 0,
+            self.__pagination.take > 0,
+            tuple(self.__shape)
+        )
+
+    def __sort_keys(self) -> list[_SortKey]:
+        """Get the ordering, made total when paginating by breaking ties on
+        the id, so that pages neither overlap nor skip results.
+        """
+        keys = list(self.__ordering)
+        paginated = self.__keyset or self.__pagination != _Pagination()
+        id_column = getattr(self.__model, "id", None)
+        if paginated and id_column is not None and (
+            not keys or keys[-1].column is not id_column
+        ):
+            keys.append(_SortKey(id_column, bool(keys) and keys[-1].descending))
+        return keys
+
+    def __cursor_fingerprint(self) -> str:
+        """Identify the ordering a cursor is issued for.
+        """
+        names = [
+            f"{key.column.class_.__name__}.{key.column.key}"
+            if isinstance(key.column, QueryableAttribute)
+            else key.column.__qualname__
+            for key in self.__sort_keys()
+        ]
+        directions = ["desc" if key.descending else "asc" for key in self.__sort_keys()]
+        digest = hashlib.sha256(json.dumps([names, directions]).encode())
+        return digest.hexdigest()[:12]
+
+    def __after_cursor(
+        self,
+        keys: Sequence[_SortKey],
+        names: Sequence[str]
+    ) -> ColumnElement[bool]:
+        """Filter the results following the cursor position.
+        """
+        expressions = [self.__sort_expression(key) for key in keys]
+        values: list[ColumnElement[Any]] = [
+            bindparam(name, type_=expression.type) 
+            for name, expression in zip(names, expressions, strict=True)
+        ]
+        if all(key.descending == keys[0].descending for key in keys):
+            # A row comparison is matched against a composite index as a whole.
+            if keys[0].descending:
+                return tuple_(*expressions) < tuple_(*values)
+            return tuple_(*expressions) > tuple_(*values)
+
+        clauses = []
+        for i, key in enumerate(keys):
+            equal = [expressions[j] == values[j] for j in range(i)]
+            following = (
+                expressions[i] < values[i] if key.descending 
+                else expressions[i] > values[i]
+            )
+            clauses.append(and_(*equal, following))
+        return or_(*clauses)
+
+    @staticmethod
+    def __sort_expression(key: _SortKey) -> Any:
+        column = key.column
+        return column if isinstance(column, QueryableAttribute) else column()
+
+    @staticmethod
+    def __ordering_shape(column: _Ordering) -> Hashable | None:
+        if isinstance(column, QueryableAttribute):
+            return (column.class_, column.key)
+        return _code_of(column)
+
+
+def _code_of(function: Callable[..., Any]) -> Hashable | None:
+    """Get the code identifying a function, or None if it closes over state.
+    """
+    if not pyinspect.isfunction(function) or function.__closure__:
+        return None
+    return function.__code__
+
+
+def _selects_entity(statement: SelectOfScalar[Any], model: type[Any]) -> bool:
+    """Check if a statement loads entities of the model, rather than rows
+    of its columns, which loader options do not apply to.
+    """
+    return any(
+        description["expr"] is model for description in statement.column_descriptions
+    )
+
+
+def _encode_cursor(fingerprint: str, values: Sequence[Any]) -> str:
+    payload = json.dumps(
+        [fingerprint, list(values)], default=str, separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, fingerprint: str) -> list[Any]:
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        issued_for, values = json.loads(payload)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid pagination cursor") from None
+    if issued_for != fingerprint or not isinstance(values, list):
+        raise ValueError("Invalid pagination cursor")
+    return values
+
+
+def _from_json(value: Any, type_: Any) -> Any:
+    """Convert a cursor value back to the Python type of its column.
+
+    The cursor is not signed, so values of the wrong type are rejected 
+    here rather than by the database driver.
+    """
+    if isinstance(type_, TypeDecorator):
+        type_ = type_.impl_instance
+    try:
+        python_type = type_.python_type
+    except NotImplementedError:
+        return value
+    if value is None:
+        return value
+    if python_type is datetime or python_type is uuid.UUID:
+        if not isinstance(value, str):
+            raise ValueError("Invalid pagination cursor")
+        try:
+            if python_type is datetime:
+                return datetime.fromisoformat(value)
+            return uuid.UUID(value)
+        except ValueError:
+            raise ValueError("Invalid pagination cursor") from None
+    if not isinstance(value, python_type):
+        raise ValueError("Invalid pagination cursor")
+    return value
@@ -0,0 +1,158 @@
+"""
+Read replica selection.
+"""
+
+import itertools
+import logging
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from sqlalchemy import Engine, text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.settings import ReplicaBalancing
+
+logger = logging.getLogger(__name__)
+
+
+_REPLICATION_LAG = text(
+    "SELECT CASE "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE("
+    "EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0"
+    ") END"
+)
+
+
+def replication_lag(engine: Engine) -> float | None:
+    """Measure the replication lag of a replica in seconds.
+
+    A replica that has replayed everything it received has no lag, however
+    long ago the primary last wrote.
+
+    Returns:
+        float | None: The lag, or None if the replica cannot be reached.
+    """
+    try:
+        with engine.connect() as connection:
+            lag = connection.execute(_REPLICATION_LAG).scalar()
+    except SQLAlchemyError:
+        logger.warning("Failed to measure the replication lag of a replica.")
+        return None
+    return float(lag or 0)
+
+
+class ReplicaSet:
+    """Picks the read replica serving the next read-only session.
+
+    Replicas lagging behind the primary by more than `max_lag` seconds, or
+    that cannot be reached, are skipped until their lag is measured again.
+    Lags are measured in the background, so selecting a replica never waits
+    on a connection to one; a replica is used once its first lag is known.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[Engine],
+        balancing: ReplicaBalancing = ReplicaBalancing.ROUND_ROBIN,
+        max_lag: float = 5.0,
+        lag_check_interval: float = 5.0,
+        lag_probe: Callable[[Engine], float | None] = replication_lag,
+        clock: Callable[[], float] = time.monotonic,
+        prober: Executor | None = None
+    ) -> None:
+        """
+        Parameters:
+            engines (Sequence[Engine]): The replica engines.
+            balancing (ReplicaBalancing): How reads are spread across replicas.
+            max_lag (float): Replication lag in seconds beyond which a replica
+                is skipped.
+            lag_check_interval (float):
+                Seconds a measured lag is reused before re-measuring.
+            lag_probe (Callable[[Engine], float | None]):
+                Measures the lag of a replica, None if it cannot be reached.
+            clock (Callable[[], float]): Monotonic clock returning seconds.
+            prober (Executor | None): 
+                Runs the lag probes, a single background thread by default.
+        """
+        self.__engines = tuple(engines)
+        self.__balancing = balancing
+        self.__max_lag = max_lag
+        self.__lag_check_interval = lag_check_interval
+        self.__lag_probe = lag_probe
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__turn = itertools.count()
+        self.__healthy: dict[Engine, tuple[bool, float]] = {}
+        self.__prober = prober or ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="replica-lag"
+        )
+        self.__closed = False
+        for engine in self.__engines:
+            self.__is_healthy(engine)
+
+    @property
+    def engines(self) -> Sequence[Engine]:
+        return self.__engines
+
+    def select(self) -> Engine | None:
+        """Select the replica serving the next read-only session.
+
+        Returns:
+            Engine | None: 
+                The replica, or None if no replica is usable or the set was 
+                shut down.
+        """
+        if self.__closed:
+            return None
+
+        candidates = [engine for engine in self.__engines if self.__is_healthy(engine)]
+        if not candidates:
+            return None
+
+        if self.__balancing == ReplicaBalancing.LEAST_CONNECTIONS:
+            return min(candidates, key=_checked_out)
+
+        with self.__lock:
+            turn = next(self.__turn)
+        return candidates[turn % len(candidates)]
+
+    def shutdown(self) -> None:
+        """Stop measuring the replication lags, discarding pending probes.
+
+        Reads still being served, e.g. while requests drain, go to the 
+        primary from then on.
+        """
+        self.__closed = True
+        self.__prober.shutdown(wait=False, cancel_futures=True)
+
+    def __is_healthy(self, engine: Engine) -> bool:
+        now = self.__clock()
+        with self.__lock:
+            healthy, checked_at = self.__healthy.get(engine, (False, -float("inf")))
+            if now - checked_at < self.__lag_check_interval:
+                return healthy
+            # Claim the check, so readers keep the previous verdict until the
+            # probe reports rather than probing the same replica at once.
+            self.__healthy[engine] = (healthy, now)
+
+        try:
+            self.__prober.submit(self.__probe, engine, now)
+        except RuntimeError:
+            # Shut down since the check was claimed; its lag is not measured
+            # again, so the replica is no longer trusted.
+            return False
+        return healthy
+
+    def __probe(self, engine: Engine, checked_at: float) -> None:
+        lag = self.__lag_probe(engine)
+        healthy = lag is not None and lag <= self.__max_lag
+        with self.__lock:
+            self.__healthy[engine] = (healthy, checked_at)
+
+
+def _checked_out(engine: Engine) -> int:
+    checkedout = getattr(engine.pool, "checkedout", None)
+    return checkedout() if callable(checkedout) else 0
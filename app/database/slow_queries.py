@@ -0,0 +1,213 @@
+"""
+Slow statement recording.
+"""
+
+import logging
+import random
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from typing import Any, final
+
+from sqlalchemy import Engine, event
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.database.explain import explain_sql
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+@final
+class SlowQuery:
+    """A statement that took longer than the slow query threshold.
+
+    Attributes:
+        statement (str): The SQL of the statement.
+        parameter_types (Mapping[str, str]):
+            Type names of its bound parameters, keyed by name or position.
+            The values themselves are not kept.
+        duration_seconds (float): Time spent executing it.
+        caller (str | None):
+            The repository method that executed it, if it was called by one.
+        executed_utc (datetime): When it completed.
+        plan (Mapping[str, Any] | None):
+            Its plan, from `EXPLAIN (ANALYZE, BUFFERS)`, if it was sampled.
+    """
+
+    statement: str
+    parameter_types: Mapping[str, str]
+    duration_seconds: float
+    caller: str | None
+    executed_utc: datetime
+    plan: Mapping[str, Any] | None = None
+
+
+class SlowQueryLog:
+    """Keeps the most recent statements executed slower than a threshold.
+
+    A sample of the slow SELECT statements is explained once more with
+    `EXPLAIN (ANALYZE, BUFFERS)` in the background, on a connection of its
+    own, so the request that ran it is neither delayed nor affected.
+    """
+
+    def __init__(
+        self,
+        threshold_seconds: float,
+        max_entries: int = 100,
+        explain_sample_rate: float = 0.0,
+        sample: Callable[[], float] = random.random
+    ) -> None:
+        """
+        Parameters:
+            threshold_seconds (float): Duration from which a statement is slow.
+            max_entries (int): Number of slow statements kept.
+            explain_sample_rate (float):
+                Share of the slow SELECT statements explained, from 0 to 1.
+            sample (Callable[[], float]):
+                Returns a random number in [0, 1) to sample statements with.
+        """
+        self.__threshold_seconds = threshold_seconds
+        self.__explain_sample_rate = explain_sample_rate
+        self.__sample = sample
+        self.__lock = threading.Lock()
+        self.__entries: deque[SlowQuery] = deque(maxlen=max_entries)
+        self.__explainer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="slow-query-explain"
+        )
+
+    @property
+    def entries(self) -> Sequence[SlowQuery]:
+        """Get the recorded slow statements, the most recent first.
+        """
+        with self.__lock:
+            return list(reversed(self.__entries))
+
+    def attach(self, engine: Engine, explain_engine: Engine | None = None) -> None:
+        """Record the slow statements of the engine.
+
+        Parameters:
+            engine (Engine): The engine, or the sync engine of an async one.
+            explain_engine (Engine | None):
+                The sync engine to explain the statements with, by default
+                the engine itself. An async engine cannot be used.
+        """
+        event.listen(engine, "before_cursor_execute", self.__start)
+        event.listen(
+            engine, "after_cursor_execute", self.__record_slow(explain_engine or engine)
+        )
+        event.listen(engine, "handle_error", self.__discard)
+
+    def shutdown(self) -> None:
+        """Stop explaining statements, discarding the pending ones.
+        """
+        self.__explainer.shutdown(wait=False, cancel_futures=True)
+
+    def __start(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool
+    ) -> None:
+        conn.info.setdefault("slow_query_start_time", []).append(time.perf_counter())
+
+    def __record_slow(self, explain_engine: Engine) -> Callable[..., None]:
+        def record(
+            conn: Any,
+            cursor: Any,
+            statement: str,
+            parameters: Any,
+            context: Any,
+            executemany: bool
+        ) -> None:
+            started = conn.info.get("slow_query_start_time")
+            if not started:
+                return
+            duration = time.perf_counter() - started.pop()
+            if duration < self.__threshold_seconds or statement.startswith("EXPLAIN"):
+                return
+
+            entry = SlowQuery(
+                statement=statement,
+                parameter_types=_parameter_types(parameters, executemany),
+                duration_seconds=duration,
+                caller=_repository_caller(),
+                executed_utc=datetime.now(UTC)
+            )
+            with self.__lock:
+                self.__entries.append(entry)
+
+            if (
+                not executemany
+                and statement.lstrip()[:6].upper() == "SELECT"
+                and " FOR " not in statement
+                and self.__sample() < self.__explain_sample_rate
+            ):
+                try:
+                    self.__explainer.submit(
+                        self.__explain, explain_engine, entry, parameters
+                    )
+                except RuntimeError:
+                    pass # Shut down.
+        return record
+
+    def __discard(self, context: Any) -> None:
+        started = context.connection.info.get("slow_query_start_time") \
+            if context.connection is not None else None
+        if started:
+            started.pop()
+
+    def __explain(self, engine: Engine, entry: SlowQuery, parameters: Any) -> None:
+        try:
+            with engine.connect() as connection:
+                plan = explain_sql(
+                    connection, entry.statement, parameters, analyze=True
+                )
+                # ANALYZE runs the statement; nothing it did is kept.
+                connection.rollback()
+        except SQLAlchemyError:
+            logger.warning("Failed to explain a slow query.", exc_info=True)
+            return
+
+        with self.__lock:
+            for i, recorded in enumerate(self.__entries):
+                if recorded is entry:
+                    self.__entries[i] = replace(entry, plan=plan)
+                    break
+
+
+def _parameter_types(parameters: Any, executemany: bool) -> dict[str, str]:
+    if executemany and isinstance(parameters, Sequence) and parameters:
+        parameters = parameters[0]
+    if isinstance(parameters, Mapping):
+        return {str(key): type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, Sequence):
+        return {str(i): type(value).__name__ for i, value in enumerate(parameters)}
+    return {}
+
+
+def _repository_caller() -> str | None:
+    """Find the outermost repository method on the call stack, if any, 
+    named after the class of the repository it was called on.
+    """
+    caller = None
+    frame = sys._getframe(2)
+    while frame is not None:
+        if frame.f_globals.get("__name__", "").startswith("app.repositories."):
+            instance = frame.f_locals.get("self")
+            caller = (
+                f"{type(instance).__name__}.{frame.f_code.co_name}" 
+                if instance is not None else frame.f_code.co_qualname
+            )
+        elif caller is not None:
+            break
+        frame = frame.f_back # type: ignore[assignment]
+    return caller
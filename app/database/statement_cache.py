@@ -0,0 +1,98 @@
+"""
+Compiled statement cache instrumentation.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, final
+
+from sqlalchemy import Engine, event
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS
+
+
+@dataclass(frozen=True)
+@final
+class CompiledCacheStats:
+    """A snapshot of an engine's compiled statement cache statistics.
+
+    Attributes:
+        name (str): Name of the engine owning the cache.
+        hits (int): Number of executions reusing compiled SQL.
+        misses (int): Number of executions compiling SQL into the cache.
+        uncached (int): Number of executions of statements that cannot be cached.
+        size (int): Current number of compiled statements.
+        max_size (int): Maximum number of compiled statements.
+    """
+
+    name: str
+    hits: int
+    misses: int
+    uncached: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """The ratio of executions reusing compiled SQL.
+        """
+        executions = self.hits + self.misses + self.uncached
+        return self.hits / executions if executions else 0.0
+
+
+class CompiledCacheMonitor:
+    """Counts how often an engine reuses the SQL compiled for a statement.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Parameters:
+            name (str): Name of the engine owning the cache.
+        """
+        self.__name = name
+        self.__lock = threading.Lock()
+        self.__engine: Engine | None = None
+        self.__hits = 0
+        self.__misses = 0
+        self.__uncached = 0
+
+    @property
+    def stats(self) -> CompiledCacheStats:
+        """Get a snapshot of the cache statistics.
+        """
+        cache = getattr(self.__engine, "_compiled_cache", None)
+        with self.__lock:
+            return CompiledCacheStats(
+                name=self.__name,
+                hits=self.__hits,
+                misses=self.__misses,
+                uncached=self.__uncached,
+                size=len(cache) if cache is not None else 0,
+                max_size=getattr(cache, "capacity", 0)
+            )
+
+    def attach(self, engine: Engine) -> None:
+        """Count the executions of the engine.
+
+        Parameters:
+            engine (Engine): The engine, or the sync engine of an async one.
+        """
+        self.__engine = engine
+        event.listen(engine, "after_cursor_execute", self.__record)
+
+    def __record(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool
+    ) -> None:
+        cache_hit = getattr(context, "cache_hit", None)
+        with self.__lock:
+            if cache_hit == CACHE_HIT:
+                self.__hits += 1
+            elif cache_hit == CACHE_MISS:
+                self.__misses += 1
+            else:
+                self.__uncached += 1
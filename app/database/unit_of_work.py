@@ -0,0 +1,81 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from sqlmodel import Session
+
+
+class UnitOfWork:
+    """A unit of work sharing one session and transaction across repositories.
+
+    The session is opened on first use. Repositories only flush their
+    changes; nothing is persisted until `commit` is called, and uncommitted
+    changes are discarded when the unit of work is closed.
+    """
+
+    def __init__(self, session_factory: Callable[..., Session]) -> None:
+        """
+        Parameters:
+            session_factory (Callable[..., Session]):
+                Factory creating the session shared by the unit of work. It 
+                accepts a `read_only` flag asking for a read replica session.
+        """
+        self.__session_factory = session_factory
+        self.__session: Session | None = None
+
+    @property
+    def is_active(self) -> bool:
+        """Whether a session has been opened and not yet closed.
+        """
+        return self.__session is not None
+
+    @contextmanager
+    def session(self) -> Iterator[Session]:
+        """Get the shared session.
+
+        The session is left open when the block exits. A failed block rolls
+        back the transaction, so the session remains usable.
+        """
+        if self.__session is None:
+            self.__session = self.__session_factory()
+        try:
+            yield self.__session
+        except:
+            self.__session.rollback()
+            raise
+
+    @contextmanager
+    def read_only(self) -> Iterator[None]:
+        """Serve the repository calls of the block from a read replica.
+
+        Once a session is open, e.g. after a write, the block keeps using it, 
+        so reads inside a write transaction stay on the primary. A replica 
+        session is closed when the block exits.
+        """
+        if self.__session is not None:
+            yield
+            return
+
+        self.__session = self.__session_factory(read_only=True)
+        try:
+            yield
+        finally:
+            self.close()
+
+    def commit(self) -> None:
+        """Commit the changes made within the unit of work.
+        """
+        if self.__session is not None:
+            self.__session.commit()
+
+    def rollback(self) -> None:
+        """Discard the changes made within the unit of work.
+        """
+        if self.__session is not None:
+            self.__session.rollback()
+
+    def close(self) -> None:
+        """Close the session, discarding uncommitted changes.
+        """
+        session, self.__session = self.__session, None
+        if session is not None:
+            session.close()
@@ -1,17 +1,26 @@
-from collections.abc import AsyncIterator
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
 from typing import Any
 
-from fastapi import FastAPI
+import anyio.to_thread
+from fastapi import FastAPI, Request, Response, status
+from fastapi.responses import JSONResponse
 from scalar_fastapi import get_scalar_api_reference # type: ignore[import-untyped]
 
 from app.api.routers.auth import auth_router
+from app.api.routers.diagnostics import diagnostics_router
 from app.api.routers.food import food_router
 from app.api.routers.roles import roles_router
 from app.api.routers.users import users_router
 from app.core.container import DIContainer
+from app.core.security import PasswordHasherBusyError
 from app.database.initializer import init_db, seed_db
-from app.middlewares import *
+from app.database.instrumentation import record_queries
+from app.utils.rate_limit import RateLimitExceededError
+
+
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
@@ -19,6 +28,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     init_db()
     seed_db()
     yield
+    container.password_hasher().shutdown()
+    await container.app_db_context().dispose()
 
 
 container = DIContainer()
@@ -26,7 +37,6 @@ container = DIContainer()
 app = FastAPI(
     lifespan=lifespan, 
     title="Kalorie Tracker API",
-    middleware=[BearerTokenAuthenticationMiddleware], 
     debug=container.app_settings().DEBUG
 )
 
@@ -34,6 +44,93 @@ app.include_router(auth_router)
 app.include_router(food_router)
 app.include_router(roles_router)
 app.include_router(users_router)
+app.include_router(diagnostics_router)
+
+
+@app.middleware("http")
+async def unit_of_work_scope(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Scope a unit of work to the request.
+
+    Services commit their changes explicitly; whatever is left uncommitted 
+    when the request completes is rolled back.
+    """
+    unit_of_work = container.unit_of_work()
+    try:
+        return await call_next(request)
+    finally:
+        container.unit_of_work.reset()
+        if unit_of_work.is_active:
+            await anyio.to_thread.run_sync(unit_of_work.close)
+
+
+@app.middleware("http")
+async def query_instrumentation(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Report the statements executed for the request.
+
+    Their count and total duration go out in the Server-Timing header and a
+    log line; statements repeated within the request are logged as likely 
+    N+1 queries.
+    """
+    settings = container.app_settings().DB_INSTRUMENTATION
+    if not settings.ENABLED:
+        return await call_next(request)
+
+    with record_queries(settings.REPEATED_STATEMENT_THRESHOLD) as recorder:
+        response = await call_next(request)
+    stats = recorder.stats
+
+    route = request.scope.get("route")
+    operation_id = getattr(route, "operation_id", None) or request.url.path
+    duration_ms = stats.duration_seconds * 1000
+    response.headers.append(
+        "Server-Timing", f'db;dur={duration_ms:.1f};desc="{stats.statements} queries"'
+    )
+    logger.info(
+        "%s executed %d statements in %.1f ms", 
+        operation_id, stats.statements, duration_ms,
+        extra={
+            "operation_id": operation_id, 
+            "statements": stats.statements, 
+            "db_duration_ms": duration_ms
+        }
+    )
+    for statement, executions in stats.repeated_statements.items():
+        logger.warning(
+            "Likely N+1 query in %s: statement executed %d times: %s", 
+            operation_id, executions, statement,
+            extra={
+                "operation_id": operation_id, 
+                "executions": executions, 
+                "statement": statement
+            }
+        )
+    return response
+
+
+@app.exception_handler(PasswordHasherBusyError)
+async def password_hasher_busy_handler(
+    request: Request, exc: PasswordHasherBusyError
+) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Service is busy, please retry later."},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
+
+@app.exception_handler(RateLimitExceededError)
+async def rate_limit_exceeded_handler(
+    request: Request, exc: RateLimitExceededError
+) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": "Too many requests, please retry later."},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
 
 
 @app.get("/scalar", include_in_schema=False)
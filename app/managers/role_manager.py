@@ -1,17 +1,32 @@
 from collections.abc import Sequence
 from uuid import UUID
 
-from app.repositories import RoleRepository
+from sqlalchemy import inspect
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import col
+
+from app.database import UnitOfWork
+from app.database.constraints import violates_unique
 from app.models.auth import Role
+from app.repositories import RoleRepository
+from app.schemas.auth import Principal
 from app.schemas.common.result import Error
+from app.utils.cache import LRUCache
 
 
 class RoleManager:
     """Manages role-related operations
     """
 
-    def __init__(self, role_repository: RoleRepository) -> None:
+    def __init__(
+        self, 
+        role_repository: RoleRepository, 
+        unit_of_work: UnitOfWork,
+        principal_cache: LRUCache[UUID, Principal]
+    ) -> None:
         self.__role_repository = role_repository
+        self.__unit_of_work = unit_of_work
+        self.__principal_cache = principal_cache
 
     @property
     def roles(self) -> Sequence[Role]:
@@ -20,23 +35,36 @@ class RoleManager:
     def create(self, role: Role) -> Role | Error:
         """Create a new role.
         """
-        if self.role_exists(role.name):
+        try:
+            self.__role_repository.add(role)
+        except IntegrityError as e:
+            if not violates_unique(e, col(Role.name)):
+                raise
             return Error.conflict(
                 "AuthError.RoleExists", 
                 f"Role (Name: {role.name}) already exists"
             )
-
-        return self.__role_repository.add(role)
+        self.__unit_of_work.commit()
+        return role
     
     def update(self, role: Role) -> None:
         """Update a role.
+
+        Renaming the role revokes the tokens of its members, whose role 
+        claims name it.
         """
+        renamed = inspect(role, raiseerr=True).attrs.name.history.has_changes()
+        members = self.__role_repository.rotate_member_security_stamps(role) \
+            if renamed else []
         self.__role_repository.update(role)
+        self.__commit_security_change(members)
 
     def delete(self, role: Role) -> None:
-        """Delete a role.
+        """Delete a role, revoking the tokens of its members.
         """
+        members = self.__role_repository.rotate_member_security_stamps(role)
         self.__role_repository.delete(role)
+        self.__commit_security_change(members)
     
     def role_exists(self, role_name: str) -> bool:
         """Check if a role exists.
@@ -47,4 +75,12 @@ class RoleManager:
         """Find the role associated with the specified ID.
         """
         return self.__role_repository.get_by_id(role_id)
-    
\ No newline at end of file
+    
+
+    def __commit_security_change(self, user_ids: Sequence[UUID]) -> None:
+        """Commit a change to the roles, then drop the cached principals of 
+        the users whose security stamp it rotated.
+        """
+        self.__unit_of_work.commit()
+        for user_id in user_ids:
+            self.__principal_cache.invalidate(user_id)
@@ -1,23 +1,49 @@
 from collections.abc import Sequence, Set
+from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlmodel import col
 
 from app.core.security import PasswordHasher
+from app.database import UnitOfWork
+from app.database.constraints import violates_unique
 from app.models.auth import User, UserPasswordHistory
 from app.repositories import UserRepository
+from app.schemas.auth import Principal
 from app.schemas.common import Error
+from app.utils.cache import LRUCache
 
 
 class UserManager:
     """Manages user-related operations.
     """
 
-    __slots__ = ('__user_repository', '__password_hasher')
+    __slots__ = (
+        '__user_repository', 
+        '__unit_of_work', 
+        '__principal_cache', 
+        '__password_hasher', 
+        '__max_failed_access_attempts', 
+        '__lockout_duration'
+    )
 
-    def __init__(self, user_repository: UserRepository) -> None:
+    def __init__(
+        self, 
+        user_repository: UserRepository, 
+        unit_of_work: UnitOfWork,
+        principal_cache: LRUCache[UUID, Principal],
+        password_hasher: PasswordHasher,
+        max_failed_access_attempts: int = 5,
+        lockout_duration: timedelta = timedelta(minutes=5)
+    ) -> None:
         self.__user_repository = user_repository
-        self.__password_hasher = PasswordHasher()
+        self.__unit_of_work = unit_of_work
+        self.__principal_cache = principal_cache
+        self.__password_hasher = password_hasher
+        self.__max_failed_access_attempts = max_failed_access_attempts
+        self.__lockout_duration = lockout_duration
 
     @property
     def users(self) -> Sequence[User]:
@@ -27,15 +53,10 @@ class UserManager:
 
     def create(self, user: User, password: str) -> User | Error:
         """Creates a new user.
-        """
-        if self.__user_repository.any(
-            col(User.email_address).ilike(user.email_address)
-        ):
-            return Error.conflict("AuthError.UserConflict", "Email already in use")
-        
-        if self.__user_repository.any(col(User.username).ilike(user.username)):
-            return Error.conflict("AuthError.UserConflict", "Username already in use")
 
+        A user whose email address or username is taken is rejected by the 
+        database when it is added, which rolls back the unit of work.
+        """
         user.password_hash = self.__password_hasher.hash_password(password)
         password_history = UserPasswordHistory(
             user_id=user.id,
@@ -43,26 +64,40 @@ class UserManager:
         )
         user.password_history = [password_history]
 
-        self.__user_repository.add(user)
+        try:
+            self.__user_repository.add(user)
+        except IntegrityError as e:
+            if violates_unique(e, col(User.email_address)):
+                return Error.conflict(
+                    "AuthError.UserConflict", "Email already in use"
+                )
+            if violates_unique(e, col(User.username)):
+                return Error.conflict(
+                    "AuthError.UserConflict", "Username already in use"
+                )
+            raise
+        self.__unit_of_work.commit()
 
         return user
     
     def update(self, user: User) -> User | Error:
         """Updates a user.
         """
-        if self.__user_repository.any(col(User.id) == user.id):
+        if not self.__user_repository.any(col(User.id) == user.id):
             return Error.not_found("AuthError.UserNotFound", "User does not exist")
         
         self.__user_repository.update(user)
+        self.__commit_security_change(user)
         return user
     
     def delete(self, user: User) -> Error | None:
         """Deletes a user.
         """
-        if self.__user_repository.any(col(User.id) == user.id):
+        if not self.__user_repository.any(col(User.id) == user.id):
             return Error.not_found("AuthError.UserNotFound", "User does not exist")
         
         self.__user_repository.delete(user)
+        self.__commit_security_change(user)
         return None
 
     def get_by_id(self, user_id: UUID) -> User | None:
@@ -80,23 +115,35 @@ class UserManager:
         """
         return self.__user_repository.find_by_name(username)
     
+    def get_by_email_or_name(self, credential: str) -> User | None:
+        """Retrieves a user by their email address or username.
+        """
+        return self.__user_repository.find_by_email_or_name(credential)
+    
     def add_to_role(self, user: User, role_name: str) -> User | Error:
         """Add the user to the named role.
         """
         if not self.__user_repository.is_in_role(user, role_name):
             self.__user_repository.add_to_role(user, role_name)
+            self.__rotate_security_stamp(user)
+            self.__commit_security_change(user)
 
         return user
     
     def add_to_roles(self, user: User, role_names: Set[str]) -> User | Error:
         """Add the user to the named roles.
         """
+        roles_changed = False
         for role_name in role_names:
             if self.__user_repository.is_in_role(user, role_name):
                 continue
             
             self.__user_repository.add_to_role(user, role_name)
+            roles_changed = True
 
+        if roles_changed:
+            self.__rotate_security_stamp(user)
+            self.__commit_security_change(user)
         return user
     
     def remove_from_role(self, user: User, role_name: str) -> User | Error:
@@ -109,6 +156,8 @@ class UserManager:
             )
         
         self.__user_repository.remove_from_role(user, role_name)
+        self.__rotate_security_stamp(user)
+        self.__commit_security_change(user)
         return user
     
     def get_roles(self, user: User) -> Sequence[str]:
@@ -142,7 +191,8 @@ class UserManager:
             )
         
         user.password_hash = self.__password_hasher.hash_password(new_password)
-        self.__user_repository.update(user)
+        self.__rotate_security_stamp(user)
+        self.__commit_security_change(user)
         return None
 
 
@@ -153,10 +203,64 @@ class UserManager:
         is_valid = self.__password_hasher.verify_password(password, user.password_hash)
         if not is_valid:
             self.set_access_failed(user)
+        elif user.access_failed_count or user.lockout_end_utc:
+            self.reset_access_failed(user)
         return is_valid
     
+    def is_locked_out(self, user: User) -> bool:
+        """Checks if the user is locked out after too many failed sign-ins.
+        """
+        return user.lockout_end_utc is not None and \
+            user.lockout_end_utc > datetime.now(UTC)
+    
     def set_access_failed(self, user: User) -> None:
-        """Increments the access failed count.
+        """Increments the access failed count, locking the user out once the 
+        maximum number of failed attempts is reached.
+        """
+        result = self.__user_repository.increment_access_failed_count(
+            user.id, 
+            self.__max_failed_access_attempts, 
+            datetime.now(UTC) + self.__lockout_duration
+        )
+        if result is not None:
+            self.__load_access_failed(user, *result)
+    
+    def reset_access_failed(self, user: User) -> None:
+        """Resets the access failed count and lockout.
         """
-        user.access_failed_count += 1
+        self.__user_repository.reset_access_failed_count(user.id)
+        self.__load_access_failed(user, 0, None)
+
+    def __load_access_failed(
+        self, 
+        user: User, 
+        access_failed_count: int, 
+        lockout_end_utc: datetime | None
+    ) -> None:
+        """Load the values written by an access failed update onto the user.
+
+        They are loaded as committed state, so the unit of work does not flush 
+        them again in a second, non-atomic update.
+        """
+        # Untyped in earlier SQLAlchemy 2.0 releases, such as the locked one.
+        set_committed_value( # type: ignore[no-untyped-call, unused-ignore]
+            user, "access_failed_count", access_failed_count
+        )
+        set_committed_value( # type: ignore[no-untyped-call, unused-ignore]
+            user, "lockout_end_utc", lockout_end_utc
+        )
+
+    def __rotate_security_stamp(self, user: User) -> None:
+        """Rotates the user's security stamp, revoking previously issued tokens.
+        """
+        user.rotate_security_stamp()
         self.__user_repository.update(user)
+
+    def __commit_security_change(self, user: User) -> None:
+        """Commit a change to the user, then drop its cached principal.
+
+        Invalidating only once committed keeps a concurrent lookup from 
+        caching the row as it was before the change.
+        """
+        self.__unit_of_work.commit()
+        self.__principal_cache.invalidate(user.id)
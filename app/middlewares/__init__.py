@@ -1,5 +0,0 @@
-from .authentication import BearerTokenAuthenticationMiddleware
-
-__all__ = [
-    'BearerTokenAuthenticationMiddleware'
-]
@@ -1,8 +1,10 @@
+from datetime import datetime # noqa: I001
 from typing import Optional, TYPE_CHECKING # noqa: I001
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from pydantic import EmailStr, computed_field # noqa: I001
-from sqlmodel import SQLModel, Field, Relationship # noqa: I001
+from sqlalchemy import Index, func # noqa: I001
+from sqlmodel import SQLModel, DateTime, Field, Relationship # noqa: I001
 
 if TYPE_CHECKING:
     from app.models.user import AppUser
@@ -56,7 +58,13 @@ class User(Entity, table=True):
     phone_number: str | None = None
     is_active: bool = False
     access_failed_count: int = 0
+    lockout_end_utc: datetime | None = Field(
+        default=None, sa_type=DateTime(timezone=True) # type: ignore
+    )
     avatar_uri: str | None = None
+    security_stamp: str = Field(
+        default_factory=lambda: uuid4().hex, max_length=64, nullable=False
+    )
 
     app_user: Optional["AppUser"] = Relationship(
         back_populates="auth_user", 
@@ -77,6 +85,18 @@ class User(Entity, table=True):
             return self.app_user.full_name
         return None
 
+    def rotate_security_stamp(self) -> None:
+        """Assign a new security stamp, invalidating previously issued tokens.
+        """
+        self.security_stamp = uuid4().hex
+
+
+# Role names, email addresses and usernames are unique regardless of case;
+# creating a role or a user relies on it rather than checking for one first.
+Index("ix_auth_role_name_lower", func.lower(Role.name), unique=True)
+Index("ix_auth_user_email_address_lower", func.lower(User.email_address), unique=True)
+Index("ix_auth_user_username_lower", func.lower(User.username), unique=True)
+
 
 class UserPasswordHistory(Entity, table=True):
     """Model representing a user's password history for security purposes.
@@ -88,3 +108,23 @@ class UserPasswordHistory(Entity, table=True):
     password_hash: str
     
     user: User = Relationship(back_populates="password_history")
+
+
+class RefreshToken(Entity, table=True):
+    """Model representing a refresh token issued to a user.
+
+    Only a digest of the token is stored. Tokens rotated from the same sign-in 
+    share a `family_id`, so that a token presented after it was used revokes 
+    the whole family.
+    """
+
+    __tablename__ = "auth_refresh_token" # pyright: ignore[reportAssignmentType]
+
+    user_id: UUID = Field(foreign_key="auth_user.id", ondelete="CASCADE")
+    family_id: UUID = Field(index=True)
+    token_hash: str = Field(max_length=64, index=True, unique=True)
+    security_stamp: str = Field(max_length=64)
+    expires_utc: datetime = Field(sa_type=DateTime(timezone=True)) # type: ignore
+    used_utc: datetime | None = Field(
+        default=None, sa_type=DateTime(timezone=True) # type: ignore
+    )
@@ -3,12 +3,19 @@ from datetime import datetime
 from typing import Any
 import uuid
 
+from sqlalchemy import Index, Table, event, false
+from sqlalchemy.orm import Mapper
 from sqlmodel import SQLModel, DateTime, Field
 
 
 class Entity(SQLModel, ABC):
     """Base model for all database entities in the application.
     """
+
+    # Server-generated values are fetched by the INSERT/UPDATE itself 
+    # (RETURNING) rather than by a SELECT when they are first accessed.
+    __mapper_args__ = {"eager_defaults": True}
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
 
     def is_transient(self) -> bool:
@@ -37,3 +44,17 @@ class SoftDeleteEntity(Entity, ABC):
     """
     is_deleted: bool = False
     deleted_utc: datetime | None = Field(default=None, sa_type=DateTime(timezone=True)) # type: ignore
+
+
+@event.listens_for(SoftDeleteEntity, "after_mapper_constructed", propagate=True)
+def index_live_rows(mapper: Mapper[Any], cls: type[SoftDeleteEntity]) -> None:
+    """Index the rows of a soft-deletable table that are not deleted, the
+    only ones queries see, so they stay fast as deleted rows pile up.
+    """
+    table = mapper.local_table
+    assert isinstance(table, Table)
+    Index(
+        f"ix_{table.name}_not_deleted", 
+        table.c.id, 
+        postgresql_where=table.c.is_deleted == false()
+    )
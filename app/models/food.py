@@ -1,7 +1,8 @@
 from uuid import UUID
 
+from sqlalchemy import Index, func
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
-from sqlmodel import SQLModel, Column, String, Field, Relationship
+from sqlmodel import SQLModel, Column, String, Field, Relationship, col
 
 from app.models import AuditableEntity
 from app.validators.common import NotEmptyStr
@@ -68,6 +69,20 @@ class FoodItem(AuditableEntity, table=True):
     )
 
 
+# Indexes matching the orderings of food item listings, id breaking ties,
+# so that keyset pagination seeks straight to a page.
+Index(
+    "ix_food_item_last_modified_id", 
+    func.coalesce(FoodItem.last_modified_utc, FoodItem.created_utc), 
+    col(FoodItem.id)
+)
+Index("ix_food_item_name_id", col(FoodItem.name), col(FoodItem.id))
+
+# Names are unique regardless of case; creating a food item relies on it
+# rather than checking for one first.
+Index("ix_food_item_name_lower", func.lower(FoodItem.name), unique=True)
+
+
 class Recipe(AuditableEntity, table=True):
     """Model representing a recipe for a food item.
     """
@@ -1,6 +1,8 @@
-from typing import assert_never
+from datetime import datetime
+from typing import Any, assert_never
 from uuid import UUID
 
+from sqlalchemy import ColumnElement, Row
 from sqlmodel import col, or_, func
 
 from app.database import QueryBuilder
@@ -12,8 +14,17 @@ class FoodCategoriesQuery(QueryBuilder[FoodCategory]):
     def __init__(self, name: str | None) -> None:
         super().__init__(FoodCategory)
 
+        # Only the columns of a listed category (`FoodCategoryResponse`).
+        self._load_only(
+            self.model.name, # type: ignore
+            self.model.description, # type: ignore
+            self.model.image_uri # type: ignore
+        )
+
         if name:
-            self._where(col(self.model.name).istartswith(name))
+            self._where(
+                lambda name: col(FoodCategory.name).istartswith(name), name=name
+            )
 
         self._order_by(self.model.name) # type: ignore
 
@@ -22,7 +33,7 @@ class FoodItemQuery(QueryBuilder[FoodItem]):
     def __init__(self, item_id: UUID, eager: bool = False) -> None:
         super().__init__(FoodItem)
 
-        self._where(col(self.model.id) == item_id)
+        self._where(lambda item_id: col(FoodItem.id) == item_id, item_id=item_id)
 
         if eager:
             self._include(self.model.food_categories) # type: ignore
@@ -33,27 +44,40 @@ class FoodItemsFilterQuery(QueryBuilder[FoodItem]):
     def __init__(self, filter: FoodItemsFilter) -> None:
         super().__init__(FoodItem)
 
+        # Only the columns of a listed item (`FoodItemsResponse`) and of its
+        # cursor; the nutrition content is left in the database.
+        self._load_only(
+            self.model.name, # type: ignore
+            self.model.description, # type: ignore
+            self.model.serving_size, # type: ignore
+            self.model.calories_per_serving, # type: ignore
+            self.model.image_uri, # type: ignore
+            self.model.created_utc, # type: ignore
+            self.model.last_modified_utc # type: ignore
+        )
+
         if filter.search:
-            self._where(
-                or_(
-                    col(self.model.name).icontains(filter.search),
-                    col(self.model.food_categories).any(col(FoodCategory.name).icontains(filter.search)),
-                    col(self.model.recipes).any(col(Recipe.name).icontains(filter.search))
-                )
-            )
+            self._where(_search_food_items, search=filter.search)
 
         if filter.name:
-            self._where(col(self.model.name).istartswith(filter.name))
+            self._where(
+                lambda name: col(FoodItem.name).istartswith(name), 
+                name=filter.name
+            )
         if filter.min_calories:
-            self._where(col(self.model.calories_per_serving) >= filter.min_calories)
+            self._where(
+                lambda calories: col(FoodItem.calories_per_serving) >= calories, 
+                calories=filter.min_calories
+            )
         if filter.max_calories:
-            self._where(col(self.model.calories_per_serving) <= filter.max_calories)
+            self._where(
+                lambda calories: col(FoodItem.calories_per_serving) <= calories, 
+                calories=filter.max_calories
+            )
 
         match filter.sort_order:
             case FoodItemSortOrder.DEFAULT:
-                self._order_by_desc(
-                    func.coalesce(self.model.last_modified_utc, self.model.created_utc) # type: ignore
-                )
+                self._order_by_desc(_last_modified, value=_last_modified_value)
             case FoodItemSortOrder.NAME_ASC:
                 self._order_by(self.model.name) # type: ignore
             case FoodItemSortOrder.NAME_DESC:
@@ -61,4 +85,23 @@ class FoodItemsFilterQuery(QueryBuilder[FoodItem]):
             case _ as unreachable: 
                 assert_never(unreachable)
 
-        self._paginate(skip=(filter.index - 1) * filter.size, take=filter.size)
+        if filter.cursor is not None:
+            self._paginate_after(filter.cursor, take=filter.size)
+        else:
+            self._paginate(skip=(filter.index - 1) * filter.size, take=filter.size)
+
+
+def _search_food_items(search: Any) -> ColumnElement[bool]:
+    return or_(
+        col(FoodItem.name).icontains(search),
+        col(FoodItem.food_categories).any(col(FoodCategory.name).icontains(search)),
+        col(FoodItem.recipes).any(col(Recipe.name).icontains(search))
+    )
+
+
+def _last_modified() -> ColumnElement[datetime]:
+    return func.coalesce(FoodItem.last_modified_utc, FoodItem.created_utc)
+
+
+def _last_modified_value(item: FoodItem | Row[Any]) -> datetime | None:
+    return item.last_modified_utc or item.created_utc
@@ -1,10 +1,19 @@
-from .food_repository import FoodCategoryRepository, FoodItemRepository
+from .food_repository import (
+    AsyncFoodCategoryRepository,
+    AsyncFoodItemRepository,
+    FoodCategoryRepository,
+    FoodItemRepository,
+)
+from .refresh_token_repository import RefreshTokenRepository
 from .role_repository import RoleRepository
 from .user_repository import UserRepository
 
 __all__ = [
+    'AsyncFoodCategoryRepository',
+    'AsyncFoodItemRepository',
     'FoodCategoryRepository',
     'FoodItemRepository',
+    'RefreshTokenRepository',
     'RoleRepository',
     'UserRepository'
 ]
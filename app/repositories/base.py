@@ -1,28 +1,119 @@
 from abc import ABC
 from collections.abc import Callable, Sequence
-from contextlib import AbstractContextManager
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from datetime import UTC, datetime
 from typing import (
     Any,
     Generic, 
     TypeVar,
+    cast,
     overload,
 )
 from uuid import UUID
 
-from sqlalchemy import ColumnElement
-from sqlalchemy.orm import QueryableAttribute, selectinload
+from sqlalchemy import ColumnElement, Row, Table, inspect
+from sqlalchemy.orm import InstrumentedAttribute, QueryableAttribute, selectinload
 from sqlmodel import Session, select, func
-from sqlmodel.sql.expression import SelectOfScalar
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import Select, SelectOfScalar
 
 from app.database import QueryBuilder
+from app.database.bulk import DEFAULT_BATCH_SIZE, DEFAULT_COPY_THRESHOLD, insert_rows
+from app.database.explain import estimated_rows, explain
 from app.database.interceptors import soft_delete_entity
-from app.models import Entity, SoftDeleteEntity
+from app.models import AuditableEntity, Entity, SoftDeleteEntity
 
 
 TEntity = TypeVar('TEntity', bound=Entity)
 
 
-class BaseRepository(ABC, Generic[TEntity]):
+class _RepositoryStatements(ABC, Generic[TEntity]):
+    """Statement builders shared by the sync and async repositories.
+    """
+
+    def __init__(self, entity: type[TEntity]) -> None:
+        self._entity = entity
+
+    def _any_statement(
+        self, 
+        filters: Sequence[ColumnElement[bool]], 
+        query: QueryBuilder[TEntity] | None
+    ) -> SelectOfScalar[int]:
+        stmt = select(1).select_from(self._entity)
+        if query is not None:
+            return query(stmt, criteriaOnly=True)
+        return stmt.where(*filters)
+
+    def _count_statement(
+        self, 
+        filters: Sequence[ColumnElement[bool]], 
+        query: QueryBuilder[TEntity] | None
+    ) -> SelectOfScalar[int]:
+        stmt = select(func.count()).select_from(self._entity)
+        if query is not None:
+            return query(stmt, criteriaOnly=True)
+        return stmt.where(*filters)
+
+    def _find_statement(
+        self, 
+        filters: Sequence[ColumnElement[bool]], 
+        includes: Sequence[QueryableAttribute[Any]] | None,
+        query: QueryBuilder[TEntity] | None
+    ) -> SelectOfScalar[TEntity]:
+        statement = select(self._entity)
+        if query is not None:
+            return query(statement)
+        for eager in includes or []:
+            statement = statement.options(selectinload(eager))
+        return statement.where(*filters)
+
+    def _list_statement(
+        self, 
+        filters: Sequence[ColumnElement[bool]], 
+        query: QueryBuilder[TEntity] | None,
+        options: dict[str, Any]
+    ) -> SelectOfScalar[TEntity]:
+        statement = select(self._entity)
+        if query is not None:
+            return query(statement)
+        if options.get("includes", []):
+            statement = statement.options(selectinload(*options["includes"]))
+        statement = statement.where(*filters)
+        if options.get("ordering", None) is not None:
+            statement = statement.order_by(options["ordering"])
+        if options.get("skip", 0):
+            statement = statement.offset(options["skip"])
+        if options.get("take", 0):
+            statement = statement.limit(options["take"])
+        return statement
+
+    def _page_statement(
+        self, query: QueryBuilder[TEntity]
+    ) -> Select[tuple[TEntity, int]]:
+        """Select the entities of a page along with the number of rows 
+        matching the query, counted before the page is limited.
+        """
+        statement = select(self._entity, func.count().over().label("total_count"))
+        return query(statement) # type: ignore[arg-type, return-value]
+
+    def _rows_statement(
+        self, query: QueryBuilder[TEntity], count: bool = False
+    ) -> Select[Any]:
+        """Select the columns of the query's projection rather than entities,
+        along with the number of matching rows if counting.
+        """
+        columns: list[Any] = list(query.columns)
+        if count:
+            columns.append(func.count().over().label("total_count"))
+        return query(select(*columns)) # type: ignore[return-value]
+
+    def _parameters(self, query: QueryBuilder[TEntity] | None) -> dict[str, Any] | None:
+        """Get the bound parameter values of the query builder, if any.
+        """
+        return query.parameters if query is not None else None
+
+
+class BaseRepository(_RepositoryStatements[TEntity]):
     """A generic base repository for managing database operations.
     """
 
@@ -31,42 +122,64 @@ class BaseRepository(ABC, Generic[TEntity]):
         entity: type[TEntity], 
         db_session_factory: Callable[..., AbstractContextManager[Session]]
     ) -> None:
-        self._entity = entity
+        super().__init__(entity)
         self._db_session_factory = db_session_factory
 
     # --------------------
     # Commands
     # --------------------
 
-    def add(self, entity: TEntity) -> TEntity:
+    def add(self, entity: TEntity, *, refresh: bool = False) -> TEntity:
         """Add an entity to the database.
+
+        Parameters:
+            refresh (bool): Reload the entity from the database once flushed.
         """
         with self._db_session_factory() as session: 
             session.add(entity)
-            self._save_changes(session, entity)
+            self._save_changes(session, entity, refresh=refresh)
             return entity
     
-    def add_range(self, entities: Sequence[TEntity]) -> Sequence[TEntity]:
+    def add_range(
+        self,
+        entities: Sequence[TEntity],
+        *,
+        refresh: bool = False
+    ) -> Sequence[TEntity]:
         """Add a list of entities to the database.
+
+        Parameters:
+            refresh (bool): Reload the entities from the database once flushed.
         """
         with self._db_session_factory() as session:
             session.add_all(entities)
-            self._save_changes(session, *entities)
+            self._save_changes(session, *entities, refresh=refresh)
             return entities
     
-    def update(self, entity: TEntity) -> None:
+    def update(self, entity: TEntity, *, refresh: bool = False) -> None:
         """Update an entity in the database.
+
+        Parameters:
+            refresh (bool): Reload the entity from the database once flushed.
         """
         with self._db_session_factory() as session:  
             session.add(entity)
-            self._save_changes(session, entity)
+            self._save_changes(session, entity, refresh=refresh)
     
-    def update_range(self, entities: Sequence[TEntity]) -> None:
+    def update_range(
+        self,
+        entities: Sequence[TEntity],
+        *,
+        refresh: bool = False
+    ) -> None:
         """Update a list of entities in the database.
+
+        Parameters:
+            refresh (bool): Reload the entities from the database once flushed.
         """
         with self._db_session_factory() as session:  
             session.add_all(entities)
-            self._save_changes(session, *entities)
+            self._save_changes(session, *entities, refresh=refresh)
 
     def delete(self, entity: TEntity) -> None:
         """Delete an entity from the database.
@@ -89,12 +202,135 @@ class BaseRepository(ABC, Generic[TEntity]):
                     session.delete(entity)
             self._save_changes(session)
 
-    def _save_changes(self, session: Session, *entities: TEntity) -> None:
-        """Persist changes to the database.
+    def bulk_insert(
+        self,
+        entities: Sequence[TEntity],
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        copy_threshold: int = DEFAULT_COPY_THRESHOLD
+    ) -> None:
+        """Insert a large number of entities with multi-row statements.
+
+        Unlike `add_range`, the entities bypass the session: they are written
+        as rows, without the per-entity unit of work bookkeeping, and are not
+        attached to the session afterwards. Large loads are streamed with COPY.
+
+        Parameters:
+            batch_size (int): Rows per INSERT statement.
+            copy_threshold (int): Row count from which COPY is used instead.
+        """
+        with self._db_session_factory() as session:
+            session.flush()
+            insert_rows(
+                session.connection(),
+                self.__table,
+                self.__rows(entities),
+                batch_size=batch_size,
+                copy_threshold=copy_threshold
+            )
+
+    def bulk_upsert(
+        self,
+        entities: Sequence[TEntity],
+        conflict_target: Sequence[InstrumentedAttribute[Any]] | None = None,
+        update: Sequence[InstrumentedAttribute[Any]] | None = None,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        copy_threshold: int = DEFAULT_COPY_THRESHOLD
+    ) -> None:
+        """Insert a large number of entities, updating the existing rows 
+        they conflict with.
+
+        Behaves as `bulk_insert` otherwise. A conflicting row keeps its id, so
+        the id of the entity written over it is not stored. The conflict
+        target values must be unique among the entities.
+
+        Example:
+            repository.bulk_upsert(food_items, conflict_target=[FoodItem.name])
+
+        Parameters:
+            conflict_target (Sequence[InstrumentedAttribute[Any]] | None):
+                Columns of the unique constraint identifying existing rows.
+                Defaults to the primary key.
+            update (Sequence[InstrumentedAttribute[Any]] | None):
+                Columns overwritten on conflict. Defaults to all columns but
+                the conflict target, the primary key and the creation time.
+                When empty, conflicting entities are skipped.
+            batch_size (int): Rows per INSERT statement.
+            copy_threshold (int): Row count from which COPY is used instead.
         """
-        session.commit()
-        for entity in entities:
-            session.refresh(entity)
+        table = self.__table
+        conflict_columns = (
+            [attribute.key for attribute in conflict_target]
+            if conflict_target is not None
+            else [column.name for column in table.primary_key]
+        )
+        if update is not None:
+            update_columns = [attribute.key for attribute in update]
+        else:
+            excluded = {
+                *conflict_columns, *(c.name for c in table.primary_key), "created_utc"
+            }
+            update_columns = [c.name for c in table.columns if c.name not in excluded]
+
+        update_values: dict[str, Any] = {}
+        if update_columns and issubclass(self._entity, AuditableEntity):
+            update_values["last_modified_utc"] = datetime.now(UTC)
+
+        with self._db_session_factory() as session:
+            session.flush()
+            insert_rows(
+                session.connection(),
+                table,
+                self.__rows(entities),
+                conflict_columns=conflict_columns,
+                update_columns=update_columns,
+                update_values=update_values,
+                batch_size=batch_size,
+                copy_threshold=copy_threshold
+            )
+
+    @property
+    def __table(self) -> Table:
+        return self._entity.__table__ # type: ignore[attr-defined, no-any-return]
+
+    def __rows(self, entities: Sequence[TEntity]) -> list[dict[str, Any]]:
+        """Get the column values of entities, as the ORM would insert them.
+
+        The entities are left untouched; the creation time is only set on 
+        their rows.
+        """
+        columns = [
+            (attribute.key, attribute.columns[0].name)
+            for attribute in inspect(self._entity, raiseerr=True).column_attrs
+        ]
+        rows = [
+            {name: getattr(entity, key) for key, name in columns} 
+            for entity in entities
+        ]
+        if issubclass(self._entity, AuditableEntity):
+            created_utc = datetime.now(UTC)
+            for row in rows:
+                row["created_utc"] = created_utc
+        return rows
+
+    def _save_changes(
+        self,
+        session: Session,
+        *entities: TEntity,
+        refresh: bool = False
+    ) -> None:
+        """Flush changes to the database.
+
+        Committing is left to the owner of the session. Server-generated
+        values are returned by the INSERT/UPDATE itself (see `Entity`), so
+        entities are only reloaded when `refresh` is requested, e.g. to pick
+        up changes made by triggers.
+        """
+        session.flush()
+        if refresh:
+            for entity in entities:
+                session.refresh(entity)
 
     # --------------------
     # Queries
@@ -119,12 +355,8 @@ class BaseRepository(ABC, Generic[TEntity]):
                 Optional query builder to customize the query.        
         """
         with self._db_session_factory() as session:
-            stmt = select(1).select_from(self._entity)
-            if query is not None:
-                stmt = query(stmt, criteriaOnly=True)
-            else:
-                stmt = self._exclude_deleted_entities(stmt).where(*filters)
-            result = session.exec(stmt).first()
+            stmt = self._any_statement(filters, query)
+            result = session.exec(stmt, params=self._parameters(query)).first()
             return result is not None
 
     @overload
@@ -146,13 +378,8 @@ class BaseRepository(ABC, Generic[TEntity]):
                 Optional query builder to customize the query.
         """
         with self._db_session_factory() as session:
-            stmt = select(func.count()).select_from(self._entity)
-            if query is not None:
-                stmt = query(stmt, criteriaOnly=True)
-            else:
-                stmt = self._exclude_deleted_entities(stmt).where(*filters)
-    
-            return session.exec(stmt).one()
+            stmt = self._count_statement(filters, query)
+            return session.exec(stmt, params=self._parameters(query)).one()
     
     @overload
     def find(self, *, query: QueryBuilder[TEntity]) -> TEntity | None: ...
@@ -180,16 +407,8 @@ class BaseRepository(ABC, Generic[TEntity]):
                 Optional query builder to customize the query.
         """
         with self._db_session_factory() as session:
-            statement = select(self._entity)
-            if query is not None:
-                statement = query(statement)
-            else:
-                for eager in includes or []:
-                    statement = statement.options(selectinload(eager))
-                statement = self._exclude_deleted_entities(statement)
-                statement = statement.where(*filters)
-
-            return session.exec(statement).first()
+            statement = self._find_statement(filters, includes, query)
+            return session.exec(statement, params=self._parameters(query)).first()
 
     def get_by_id(self, id: UUID) -> TEntity | None:
         """Get an entity by its Identifier.
@@ -224,7 +443,8 @@ class BaseRepository(ABC, Generic[TEntity]):
             query (QueryBuilder[TEntity]): 
                 Optional query builder to customize the query.        
             **options (Any): Optional keyword arguments to modify the query behavior:
-                - includes (Sequence[QueryableAttribute[Any]]): Eager load related entities.
+                - includes (Sequence[QueryableAttribute[Any]]): 
+                    Eager load related entities.
                 - ordering (Any): SQLAlchemy ordering expression to sort the results.
                 - skip (int): Number of records to skip (offset).
                 - take (int): Maximum number of records to return (limit).
@@ -233,31 +453,375 @@ class BaseRepository(ABC, Generic[TEntity]):
             Sequence[TEntity]: A sequence of entities matching the query criteria.
         """
         with self._db_session_factory() as session:
-            statement = select(self._entity)
-            if query is not None:
-                statement = query(statement)
+            statement = self._list_statement(filters, query, options)
+            return session.exec(statement, params=self._parameters(query)).all()
+
+    def get_page(
+        self, 
+        *, 
+        query: QueryBuilder[TEntity], 
+        count: bool = True
+    ) -> tuple[Sequence[TEntity], int | None]:
+        """Retrieve a page of entities along with the number of entities
+        matching the query, in a single round trip.
+
+        The count is a window over the filtered rows, so with keyset 
+        pagination it only covers the rows from the cursor on. An empty page
+        past the last one is counted separately.
+
+        Parameters:
+            query (QueryBuilder[TEntity]): The query builder paginating the results.
+            count (bool): Whether to count the matching entities.
+
+        Returns:
+            tuple[Sequence[TEntity], int | None]: 
+                The entities of the page, and their count, or None if not counted.
+        """
+        if not count:
+            return self.get_list(query=query), None
+
+        with self._db_session_factory() as session:
+            statement = self._page_statement(query)
+            rows = cast(
+                Sequence[Row[Any]],
+                session.exec(statement, params=self._parameters(query)).all()
+            )
+        if not rows:
+            return [], 0 if query.is_first_page else self.count(query=query)
+        entities: list[TEntity] = [row[0] for row in rows]
+        total_count: int = rows[0].total_count
+        return entities, total_count
+
+    def get_rows(self, *, query: QueryBuilder[TEntity]) -> Sequence[Row[Any]]:
+        """Retrieve the columns of the entities matching the query as rows.
+
+        Rows are not entities: the session neither tracks nor validates
+        them, so a read-only listing can build its response from them
+        directly. The columns are those of `QueryBuilder.columns`.
+
+        Parameters:
+            query (QueryBuilder[TEntity]): The query builder to customize the query.
+        """
+        with self._db_session_factory() as session:
+            statement = self._rows_statement(query)
+            return cast(
+                Sequence[Row[Any]],
+                session.exec(statement, params=self._parameters(query)).all()
+            )
+
+    def get_page_rows(
+        self, 
+        *, 
+        query: QueryBuilder[TEntity], 
+        count: bool = True
+    ) -> tuple[Sequence[Row[Any]], int | None]:
+        """Retrieve a page of rows, as `get_rows`, along with the number of
+        entities matching the query, counted as in `get_page`.
+
+        Returns:
+            tuple[Sequence[Row[Any]], int | None]: 
+                The rows of the page, and their count, or None if not counted.
+        """
+        if not count:
+            return self.get_rows(query=query), None
+
+        with self._db_session_factory() as session:
+            statement = self._rows_statement(query, count=True)
+            rows = cast(
+                Sequence[Row[Any]],
+                session.exec(statement, params=self._parameters(query)).all()
+            )
+        if not rows:
+            return [], 0 if query.is_first_page else self.count(query=query)
+        return rows, rows[0].total_count
+
+    def estimate_count(self, *, query: QueryBuilder[TEntity]) -> int:
+        """Estimate the number of entities matching the query from the
+        planner statistics, without running it.
+
+        Parameters:
+            query (QueryBuilder[TEntity]): The query builder filtering the results.
+        """
+        with self._db_session_factory() as session:
+            statement = self._any_statement((), query)
+            plan = explain(session.connection(), statement, self._parameters(query))
+            return estimated_rows(plan)
+
+
+class AsyncBaseRepository(_RepositoryStatements[TEntity]):
+    """A generic base repository for managing database operations asynchronously.
+
+    Mirrors `BaseRepository` and builds the same statements, so query builders 
+    work unchanged. Relationships must be eagerly loaded (`includes` or 
+    `QueryBuilder._include`), since lazy loading is not available on an 
+    `AsyncSession`.
+    """
+
+    def __init__(
+        self, 
+        entity: type[TEntity], 
+        db_session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]]
+    ) -> None:
+        super().__init__(entity)
+        self._db_session_factory = db_session_factory
+
+    # --------------------
+    # Commands
+    # --------------------
+
+    async def add(self, entity: TEntity, *, refresh: bool = False) -> TEntity:
+        """Add an entity to the database.
+
+        Parameters:
+            refresh (bool): Reload the entity from the database once flushed.
+        """
+        async with self._db_session_factory() as session: 
+            session.add(entity)
+            await self._save_changes(session, entity, refresh=refresh)
+            return entity
+    
+    async def add_range(
+        self,
+        entities: Sequence[TEntity],
+        *,
+        refresh: bool = False
+    ) -> Sequence[TEntity]:
+        """Add a list of entities to the database.
+
+        Parameters:
+            refresh (bool): Reload the entities from the database once flushed.
+        """
+        async with self._db_session_factory() as session:
+            session.add_all(entities)
+            await self._save_changes(session, *entities, refresh=refresh)
+            return entities
+    
+    async def update(self, entity: TEntity, *, refresh: bool = False) -> None:
+        """Update an entity in the database.
+
+        Parameters:
+            refresh (bool): Reload the entity from the database once flushed.
+        """
+        async with self._db_session_factory() as session:  
+            session.add(entity)
+            await self._save_changes(session, entity, refresh=refresh)
+
+    async def delete(self, entity: TEntity) -> None:
+        """Delete an entity from the database.
+        """
+        async with self._db_session_factory() as session: 
+            if isinstance(entity, SoftDeleteEntity):
+                soft_delete_entity(session, entity)
             else:
-                if options.get("includes", []):
-                    statement = statement.options(selectinload(*options["includes"]))
-                statement = self._exclude_deleted_entities(statement)
-                statement = statement.where(*filters)
-                if options.get("ordering", None) is not None:
-                    statement = statement.order_by(options["ordering"])
-                if options.get("skip", 0):
-                    statement = statement.offset(options["skip"])
-                if options.get("take", 0):
-                    statement = statement.limit(options["take"])
-            
-            return session.exec(statement).all()
+                await session.delete(entity)
+            await self._save_changes(session)
+
+    async def _save_changes(
+        self,
+        session: AsyncSession,
+        *entities: TEntity,
+        refresh: bool = False
+    ) -> None:
+        """Flush changes to the database.
+
+        Committing is left to the owner of the session. Server-generated
+        values are returned by the INSERT/UPDATE itself (see `Entity`), so
+        entities are only reloaded when `refresh` is requested.
+        """
+        await session.flush()
+        if refresh:
+            for entity in entities:
+                await session.refresh(entity)
+
+    # --------------------
+    # Queries
+    # --------------------
+
+    @overload
+    async def any(self, *filters: ColumnElement[bool]) -> bool: ...
+    @overload
+    async def any(self, *, query: QueryBuilder[TEntity]) -> bool: ...
     
-    _T0 = TypeVar('_T0')
+    async def any(
+        self, 
+        *filters: ColumnElement[bool], 
+        query: QueryBuilder[TEntity] | None = None
+    ) -> bool:
+        """Check if any row in the database match the given criteria.
+
+        Parameters:
+            *filters (ColumnElement[bool]): 
+                Optional SQLAlchemy filter expressions to apply to the query.
+            query (QueryBuilder[TEntity]): 
+                Optional query builder to customize the query.        
+        """
+        async with self._db_session_factory() as session:
+            stmt = self._any_statement(filters, query)
+            result = (await session.exec(stmt, params=self._parameters(query))).first()
+            return result is not None
 
-    def _exclude_deleted_entities(
+    @overload
+    async def count(self, *filters: ColumnElement[bool]) -> int: ...
+    @overload
+    async def count(self, *, query: QueryBuilder[TEntity]) -> int: ...
+    
+    async def count(
         self, 
-        statement: SelectOfScalar[_T0]
-    ) -> SelectOfScalar[_T0]:
-        """Exclude soft-deleted entities from the query.
+        *filters: ColumnElement[bool], 
+        query: QueryBuilder[TEntity] | None = None
+    ) -> int:
+        """Count the number of rows in the database matching all given criteria.
+
+         Parameters:
+            *filters (ColumnElement[bool]): 
+                Optional SQLAlchemy filter expressions to apply to the query.
+            query (QueryBuilder[TEntity]): 
+                Optional query builder to customize the query.
         """
-        if issubclass(self._entity, SoftDeleteEntity):
-            statement = statement.where(not self._entity.is_deleted)
-        return statement
+        async with self._db_session_factory() as session:
+            stmt = self._count_statement(filters, query)
+            return (await session.exec(stmt, params=self._parameters(query))).one()
+    
+    @overload
+    async def find(self, *, query: QueryBuilder[TEntity]) -> TEntity | None: ...
+    @overload
+    async def find(
+        self, 
+        *filters: ColumnElement[bool], 
+        includes: Sequence[QueryableAttribute[Any]] | None = None
+    ) -> TEntity | None: ...
+
+    async def find(
+        self,
+        *filters: ColumnElement[bool], 
+        includes: Sequence[QueryableAttribute[Any]] | None = None,
+        query: QueryBuilder[TEntity] | None = None,
+    ) -> TEntity | None:
+        """Find an entity matching the given criteria.
+
+        Parameters:
+            *filters (ColumnElement[bool]): 
+                Optional SQLAlchemy filter expressions to apply to the query.
+            includes (Sequence[QueryableAttribute[Any]]): 
+                Optional list of related entities to eagerly load.
+            query (QueryBuilder[TEntity]): 
+                Optional query builder to customize the query.
+        """
+        async with self._db_session_factory() as session:
+            statement = self._find_statement(filters, includes, query)
+            results = await session.exec(statement, params=self._parameters(query))
+            return results.first()
+
+    async def get_by_id(self, id: UUID) -> TEntity | None:
+        """Get an entity by its Identifier.
+
+        Parameters:
+            id (UUID): The unique identifier of the entity.
+        """
+        async with self._db_session_factory() as session:
+            return await session.get(self._entity, id)
+
+    @overload 
+    async def get_list(self, *, query: QueryBuilder[TEntity]) -> Sequence[TEntity]: ...
+    @overload
+    async def get_list(
+        self, 
+        *filters: ColumnElement[bool], 
+        **options: Any
+    ) -> Sequence[TEntity]: ...
+
+    async def get_list(
+            self, 
+            *filters: ColumnElement[bool], 
+            query: QueryBuilder[TEntity] | None = None, 
+            **options: Any
+    ) -> Sequence[TEntity]:
+        """
+        Retrieve a list of entities matching the specified filters and options.
+
+        Parameters:
+            *filters (ColumnElement[bool]): 
+                Optional SQLAlchemy filter expressions to apply to the query.
+            query (QueryBuilder[TEntity]): 
+                Optional query builder to customize the query.        
+            **options (Any): Optional keyword arguments to modify the query behavior:
+                - includes (Sequence[QueryableAttribute[Any]]): 
+                    Eager load related entities.
+                - ordering (Any): SQLAlchemy ordering expression to sort the results.
+                - skip (int): Number of records to skip (offset).
+                - take (int): Maximum number of records to return (limit).
+
+        Returns:
+            Sequence[TEntity]: A sequence of entities matching the query criteria.
+        """
+        async with self._db_session_factory() as session:
+            statement = self._list_statement(filters, query, options)
+            return (await session.exec(statement, params=self._parameters(query))).all()
+
+    async def get_page(
+        self, 
+        *, 
+        query: QueryBuilder[TEntity], 
+        count: bool = True
+    ) -> tuple[Sequence[TEntity], int | None]:
+        """Retrieve a page of entities along with the number of entities
+        matching the query, in a single round trip.
+
+        See `BaseRepository.get_page`.
+        """
+        if not count:
+            return await self.get_list(query=query), None
+
+        async with self._db_session_factory() as session:
+            statement = self._page_statement(query)
+            result = await session.exec(statement, params=self._parameters(query))
+            rows = cast(Sequence[Row[Any]], result.all())
+        if not rows:
+            return [], 0 if query.is_first_page else await self.count(query=query)
+        entities: list[TEntity] = [row[0] for row in rows]
+        total_count: int = rows[0].total_count
+        return entities, total_count
+
+    async def get_rows(self, *, query: QueryBuilder[TEntity]) -> Sequence[Row[Any]]:
+        """Retrieve the columns of the entities matching the query as rows.
+
+        See `BaseRepository.get_rows`.
+        """
+        async with self._db_session_factory() as session:
+            statement = self._rows_statement(query)
+            result = await session.exec(statement, params=self._parameters(query))
+            return cast(Sequence[Row[Any]], result.all())
+
+    async def get_page_rows(
+        self, 
+        *, 
+        query: QueryBuilder[TEntity], 
+        count: bool = True
+    ) -> tuple[Sequence[Row[Any]], int | None]:
+        """Retrieve a page of rows along with the number of entities matching
+        the query.
+
+        See `BaseRepository.get_page_rows`.
+        """
+        if not count:
+            return await self.get_rows(query=query), None
+
+        async with self._db_session_factory() as session:
+            statement = self._rows_statement(query, count=True)
+            result = await session.exec(statement, params=self._parameters(query))
+            rows = cast(Sequence[Row[Any]], result.all())
+        if not rows:
+            return [], 0 if query.is_first_page else await self.count(query=query)
+        return rows, rows[0].total_count
+
+    async def estimate_count(self, *, query: QueryBuilder[TEntity]) -> int:
+        """Estimate the number of entities matching the query from the
+        planner statistics, without running it.
+        """
+        async with self._db_session_factory() as session:
+            statement = self._any_statement((), query)
+            connection = await session.connection()
+            plan = await connection.run_sync(
+                explain, statement, self._parameters(query)
+            )
+            return estimated_rows(plan)
@@ -1,10 +1,12 @@
 from collections.abc import Callable
-from contextlib import AbstractContextManager
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
 
+from sqlalchemy import func
 from sqlmodel import Session, col
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models.food import FoodCategory, FoodItem
-from app.repositories.base import BaseRepository
+from app.repositories.base import AsyncBaseRepository, BaseRepository
 
 
 class FoodCategoryRepository(BaseRepository[FoodCategory]):
@@ -34,6 +36,38 @@ class FoodItemRepository(BaseRepository[FoodItem]):
         """Check if a food item exists.
         """
         return self.any(
-            col(self._entity.name).ilike(item.name), 
+            func.lower(self._entity.name) == item.name.lower(), 
+            col(self._entity.id) != item.id
+        )
+
+
+class AsyncFoodCategoryRepository(AsyncBaseRepository[FoodCategory]):
+    def __init__(
+        self, 
+        db_session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]]
+    ) -> None:
+        super().__init__(FoodCategory, db_session_factory)
+
+    async def exists(self, category: FoodCategory) -> bool:
+        """Check if a food category exists.
+        """
+        return await self.any(
+            col(self._entity.name).ilike(category.name), 
+            col(self._entity.id) != category.id
+        )
+
+
+class AsyncFoodItemRepository(AsyncBaseRepository[FoodItem]):
+    def __init__(
+        self, 
+        db_session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]]
+    ) -> None:
+        super().__init__(FoodItem, db_session_factory)
+
+    async def exists(self, item: FoodItem) -> bool:
+        """Check if a food item exists.
+        """
+        return await self.any(
+            func.lower(self._entity.name) == item.name.lower(), 
             col(self._entity.id) != item.id
         )
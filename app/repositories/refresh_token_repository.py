@@ -0,0 +1,55 @@
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import inspect, update
+from sqlmodel import Session, col
+
+from app.models.auth import RefreshToken
+from app.repositories.base import BaseRepository
+
+
+class RefreshTokenRepository(BaseRepository[RefreshToken]):
+    def __init__(
+        self, 
+        db_session_factory: Callable[..., AbstractContextManager[Session]]
+    ) -> None:
+        super().__init__(RefreshToken, db_session_factory)
+    
+    def find_by_hash(self, token_hash: str) -> RefreshToken | None:
+        """Find the refresh token stored under the given digest.
+        """
+        return self.find(col(RefreshToken.token_hash) == token_hash)
+    
+    def consume(self, token_hash: str, used_utc: datetime) -> RefreshToken | None:
+        """Atomically mark an unused refresh token as used.
+
+        Returns:
+            RefreshToken | None: 
+                The consumed token, or `None` if there is no unused token 
+                stored under the given digest.
+        """
+        columns = inspect(RefreshToken).columns
+        with self._db_session_factory() as session:
+            statement = update(RefreshToken) \
+                .where(
+                    col(RefreshToken.token_hash) == token_hash, 
+                    col(RefreshToken.used_utc).is_(None)
+                ) \
+                .values(used_utc=used_utc) \
+                .returning(*columns)
+            row = session.connection().execute(statement).one_or_none()
+            return RefreshToken.model_validate(row._mapping) if row else None
+    
+    def revoke_family(self, family_id: UUID, used_utc: datetime) -> None:
+        """Mark every unused refresh token of a token family as used.
+        """
+        with self._db_session_factory() as session:
+            statement = update(RefreshToken) \
+                .where(
+                    col(RefreshToken.family_id) == family_id, 
+                    col(RefreshToken.used_utc).is_(None)
+                ) \
+                .values(used_utc=used_utc)
+            session.connection().execute(statement)
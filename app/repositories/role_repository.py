@@ -1,9 +1,11 @@
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from contextlib import AbstractContextManager
+from uuid import UUID, uuid4
 
+from sqlalchemy import func, select, update
 from sqlmodel import Session, col
 
-from app.models.auth import Role
+from app.models.auth import Role, User, UserRole
 from app.repositories.base import BaseRepository
 
 
@@ -17,9 +19,29 @@ class RoleRepository(BaseRepository[Role]):
     def exists(self, role_name: str) -> bool:
         """Check if a named role exists.
         """
-        return self.any(col(Role.name).ilike(role_name))
+        return self.any(func.lower(Role.name) == role_name.lower())
     
     def find_by_name(self, role_name: str) -> Role | None:
         """Find the role with the specified name.
         """
-        return self.find(col(Role.name).ilike(role_name))
+        return self.find(func.lower(Role.name) == role_name.lower())
+    
+    def rotate_member_security_stamps(self, role: Role) -> Sequence[UUID]:
+        """Rotate the security stamp of every member of the role in a single 
+        statement, revoking the tokens naming the role.
+
+        The members share the new stamp, which only has to differ from the 
+        stamps their tokens were issued with.
+
+        Returns:
+            Sequence[UUID]: The IDs of the members.
+        """
+        members = select(col(UserRole.user_id)) \
+            .where(col(UserRole.role_id) == role.id) \
+            .scalar_subquery()
+        with self._db_session_factory() as session:
+            statement = update(User) \
+                .where(col(User.id).in_(members)) \
+                .values(security_stamp=uuid4().hex) \
+                .returning(col(User.id))
+            return session.connection().execute(statement).scalars().all()
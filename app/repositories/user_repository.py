@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Sequence
 from contextlib import AbstractContextManager
+from datetime import datetime
 from uuid import UUID
 
+from sqlalchemy import case, func, or_, update
 from sqlmodel import Session, col, select
 from typing_extensions import override
 
@@ -51,12 +53,71 @@ class UserRepository(BaseRepository[User], UserRoleRepository):
     def find_by_email(self, email: str) -> User | None:
         """Get a user by their email address.
         """
-        return self.find(col(User.email_address).ilike(email))
+        return self.find(func.lower(User.email_address) == email.lower())
     
     def find_by_name(self, username: str) -> User | None:
         """Get a user by their username.
         """
-        return self.find(col(User.username).ilike(username))
+        return self.find(func.lower(User.username) == username.lower())
+    
+    def find_by_email_or_name(self, credential: str) -> User | None:
+        """Get a user whose email address or username matches the credential.
+
+        Resolves both in a single query; an email address match takes 
+        precedence over a username match.
+        """
+        credential = credential.lower()
+        email_match = func.lower(User.email_address) == credential
+        username_match = func.lower(User.username) == credential
+        with self._db_session_factory() as session:
+            statement = select(User) \
+                .where(or_(email_match, username_match)) \
+                .order_by(case((email_match, 0), else_=1)) \
+                .limit(1)
+            return session.exec(statement).first()
+    
+    def increment_access_failed_count(
+        self, 
+        user_id: UUID, 
+        max_failed_attempts: int, 
+        lockout_end_utc: datetime
+    ) -> tuple[int, datetime | None] | None:
+        """Atomically increment the access failed count of a user.
+
+        Reaching `max_failed_attempts` locks the user out until 
+        `lockout_end_utc` and resets the count.
+
+        Returns:
+            tuple[int, datetime | None] | None: 
+                The new count and lockout end, or `None` if the user does 
+                not exist.
+        """
+        failed_count = col(User.access_failed_count) + 1
+        locks_out = failed_count >= max_failed_attempts
+        with self._db_session_factory() as session:
+            statement = update(User) \
+                .where(col(User.id) == user_id) \
+                .values(
+                    access_failed_count=case((locks_out, 0), else_=failed_count),
+                    lockout_end_utc=case(
+                        (locks_out, lockout_end_utc), 
+                        else_=col(User.lockout_end_utc)
+                    )
+                ) \
+                .returning(
+                    col(User.access_failed_count), col(User.lockout_end_utc)
+                )
+            row = session.connection().execute(statement).one_or_none()
+            return (row[0], row[1]) if row else None
+    
+    def reset_access_failed_count(self, user_id: UUID) -> None:
+        """Reset the access failed count and lockout of a user.
+        """
+        with self._db_session_factory() as session:
+            statement = update(User) \
+                .where(col(User.id) == user_id) \
+                .values(access_failed_count=0, lockout_end_utc=None)
+            session.connection().execute(statement)
     
     def get_profile(self, user: User) -> AppUser:
         """Get the `AppUser` (user profile) entity.
@@ -110,7 +171,7 @@ class UserRepository(BaseRepository[User], UserRoleRepository):
 
     def _find_role(self, role_name: str) -> Role | None:
         with self._db_session_factory() as session:
-            stmt = select(Role).where(col(Role.name).ilike(role_name))
+            stmt = select(Role).where(func.lower(Role.name) == role_name.lower())
             return session.exec(stmt).first()
     
     def _find_user_role(self, user_id: UUID, role_id: UUID) -> UserRole | None:
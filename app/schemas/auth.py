@@ -1,11 +1,13 @@
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
 
 class TokenPayload(BaseModel):
     sub: UUID
+    stamp: str
+    roles: tuple[str, ...] = ()
 
     @field_validator("sub", mode="before")
     @classmethod
@@ -15,9 +17,28 @@ class TokenPayload(BaseModel):
         return value
 
 
+class Principal(BaseModel):
+    """The authenticated user of a request.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    id: UUID
+    username: str
+    email_address: str
+    avatar_uri: str | None = None
+    is_active: bool
+    security_stamp: str
+
+
 class TokenResponse(BaseModel):
     access_token: str
     token_type: str = "bearer"
+    refresh_token: str | None = None
+
+
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str
 
 
 class UserSessionInfo(BaseModel):
@@ -1,7 +1,8 @@
-from .pagination import PaginationFilter, PaginationResponse
+from .pagination import CountMode, PaginationFilter, PaginationResponse
 from .result import Error, ErrorType, PagedList
 
 __all__ = [
+    'CountMode', 
     'Error', 
     'ErrorType', 
     'PagedList',  
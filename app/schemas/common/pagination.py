@@ -1,25 +1,45 @@
+from enum import StrEnum
 from typing import ClassVar
 
 from pydantic import BaseModel, computed_field, Field
 
 
+class CountMode(StrEnum):
+    """How the items matching a paginated listing are counted.
+    """
+
+    EXACT = "exact"
+    """Count all matching items."""
+    ESTIMATED = "estimated"
+    """Estimate large counts from the planner statistics."""
+    NONE = "none"
+    """Skip counting."""
+
+
 class PaginationFilter(BaseModel):
     """Pagination filter.
 
     Attributes:
         index (int): The page number (1-based index).
         size (int): The number of items per page.
+        cursor (str | None): 
+            The continuation token of the previous page, taking precedence
+            over the page number.
+        count (CountMode): How the matching items are counted.
 
         DEFAULT_INDEX (ClassVar[int]):
         DEFAULT_SIZE (ClassVar[int]):
         MAX_SIZE (ClassVar[int]):
         MIN_SIZE (ClassVar[int]):
+        EXACT_COUNT_LIMIT (ClassVar[int]): 
+            Estimated count above which an estimated count is not made exact.
     """
     
     DEFAULT_INDEX: ClassVar[int] = 1
     DEFAULT_SIZE: ClassVar[int] = 10
     MAX_SIZE: ClassVar[int] = 50
     MIN_SIZE: ClassVar[int] = 5
+    EXACT_COUNT_LIMIT: ClassVar[int] = 10_000
 
     index: int = Field(
         default=DEFAULT_INDEX, ge=1, description="The page number (1-based index)."
@@ -30,29 +50,61 @@ class PaginationFilter(BaseModel):
         le=MAX_SIZE, 
         description="The number of items per page."
     )
+    cursor: str | None = Field(
+        default=None,
+        max_length=512,
+        description=(
+            "The continuation token of the previous page, taking precedence "
+            "over the page number."
+        )
+    )
+    count: CountMode = Field(
+        default=CountMode.EXACT, 
+        description="How the matching items are counted."
+    )
 
 
 class PaginationResponse(BaseModel):
     index: int
     size: int
-    items_count: int
-    page_count: int
+    items_count: int | None
+    page_count: int | None
+    is_count_estimated: bool = False
+    cursor: str | None = None
+    next_cursor: str | None = None
 
     @property
     def __skip(self) -> int: return (self.index - 1) * self.size
 
+    @property
+    def __is_offset_page(self) -> bool:
+        """Whether the page is positioned by its index rather than a cursor,
+        which leaves the index at its default.
+        """
+        return self.cursor is None
+
     @computed_field # type: ignore[prop-decorator]
     @property
-    def current_page_size(self) -> int:
-        """The size of the current page.
+    def current_page_size(self) -> int | None:
+        """The size of the current page, unless items are not counted or the
+        page follows a cursor.
         """
+        if self.items_count is None or not self.__is_offset_page:
+            return None
         return min(self.size, self.items_count - self.__skip)
     
     @computed_field # type: ignore[prop-decorator]
     @property
-    def current_end_index(self) -> int:
-        """The index of the last item in the current
+    def current_end_index(self) -> int | None:
+        """The index of the last item in the current page, unless items are
+        not counted or the page follows a cursor.
         """
+        if (
+            self.items_count is None 
+            or self.current_page_size is None 
+            or self.current_start_index is None
+        ):
+            return None
         return min(
             self.items_count, 
             self.current_start_index + self.current_page_size - 1
@@ -60,9 +112,14 @@ class PaginationResponse(BaseModel):
 
     @computed_field # type: ignore[prop-decorator]
     @property 
-    def current_start_index(self) -> int:
-        """The index of the first item in the current page.
+    def current_start_index(self) -> int | None:
+        """The index of the first item in the current page, unless the page
+        follows a cursor.
         """
+        if not self.__is_offset_page:
+            return None
+        if self.items_count is None:
+            return self.__skip + 1
         return min(self.items_count, self.__skip + 1)
 
     @computed_field # type: ignore[prop-decorator]
@@ -70,6 +127,8 @@ class PaginationResponse(BaseModel):
     def has_next_page(self) -> bool:
         """Indicates if there is a next page.
         """
+        if self.page_count is None or not self.__is_offset_page:
+            return self.next_cursor is not None
         return self.index < self.page_count
     
     @computed_field # type: ignore[prop-decorator]
@@ -77,4 +136,4 @@ class PaginationResponse(BaseModel):
     def has_previous_page(self) -> bool:
         """Indicates if there is a previous page.
         """
-        return self.index > 1
+        return self.index > 1 or not self.__is_offset_page
@@ -107,12 +107,24 @@ class PagedList(list[T]):
     """Paginated list of items.
     """
 
-    def __init__(self, items: Iterable[T], count: int, index: int, size: int) -> None:
+    def __init__(
+        self, 
+        items: Iterable[T], 
+        count: int | None, 
+        index: int, 
+        size: int, 
+        next_cursor: str | None = None,
+        is_count_estimated: bool = False
+    ) -> None:
         """
         Parameters:
             items (list): The collection of items to be paginated.
+            count (int | None): The number of items in all pages, if counted.
             index (int): The page number.
             size (int): The page size.
+            next_cursor (str | None): 
+                The continuation token of the next page, if there is one.
+            is_count_estimated (bool): Whether the count is an estimate.
 
         Raises:
             ValueError: If the page number or page size is less than or equal to 0.
@@ -127,4 +139,6 @@ class PagedList(list[T]):
         self._index = index 
         self._size = size
         self._items_count = count
-        self._page_count = ceil(count / size)
+        self._page_count = ceil(count / size) if count is not None else None
+        self._next_cursor = next_cursor
+        self._is_count_estimated = is_count_estimated
@@ -0,0 +1,61 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class CacheStatistics(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+    hit_ratio: float
+
+
+class WorkerPoolStatistics(BaseModel):
+    max_workers: int
+    max_queue: int
+    in_flight: int
+    queued: int
+    completed: int
+    rejected: int
+    utilization: float
+
+
+class ConnectionPoolStatistics(BaseModel):
+    name: str
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    idle: int
+    overflow: int
+    checkouts: int
+    checkout_errors: int
+    average_wait_seconds: float
+    max_wait_seconds: float
+    utilization: float
+
+
+class CompiledCacheStatistics(BaseModel):
+    name: str
+    hits: int
+    misses: int
+    uncached: int
+    size: int
+    max_size: int
+    hit_ratio: float
+
+
+class StatementCacheStatistics(BaseModel):
+    query_builder: CacheStatistics
+    compiled: list[CompiledCacheStatistics]
+
+
+class SlowQueryEntry(BaseModel):
+    statement: str
+    parameter_types: dict[str, str]
+    duration_seconds: float
+    caller: str | None
+    executed_utc: datetime
+    plan: dict[str, Any] | None
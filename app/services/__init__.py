@@ -1,9 +1,11 @@
 from .auth_service import AuthService
 from .food_service import FoodService
+from .principal_service import PrincipalService
 from .user_service import UserService
 
 __all__ = [
     'AuthService', 
     'FoodService', 
+    'PrincipalService', 
     'UserService'
 ]
@@ -1,33 +1,69 @@
+from datetime import UTC, datetime
 from typing import Any
+from uuid import UUID, uuid4
 
 from app.core.security import TokenProvider
+from app.database import UnitOfWork
 from app.managers import UserManager
-from app.models.auth import User
+from app.models.auth import RefreshToken, User
+from app.repositories import RefreshTokenRepository
+from app.schemas.auth import TokenResponse
 from app.schemas.common import Error
+from app.utils.rate_limit import SlidingWindowRateLimiter
 
 
 class AuthService:
     """Service for handling authentication-related operations.
     """
 
-    def __init__(self, user_manager: UserManager) -> None:
+    def __init__(
+        self, 
+        user_manager: UserManager, 
+        refresh_token_repository: RefreshTokenRepository,
+        username_rate_limiter: SlidingWindowRateLimiter[str],
+        ip_rate_limiter: SlidingWindowRateLimiter[str],
+        unit_of_work: UnitOfWork
+    ) -> None:
         self.__user_manager = user_manager
+        self.__refresh_token_repository = refresh_token_repository
+        self.__username_rate_limiter = username_rate_limiter
+        self.__ip_rate_limiter = ip_rate_limiter
+        self.__unit_of_work = unit_of_work
         self.__token_provider = TokenProvider()
 
-    def authenticate_user(self, username: str, password: str) -> Error | str:
+    def authenticate_user(
+        self, 
+        username: str, 
+        password: str,
+        ip_address: str | None = None
+    ) -> Error | TokenResponse:
         """
         Authenticate a user with the given username and password.
+
+        Throttled attempts and locked out users are rejected before the 
+        password is verified.
         
         Parameters:
             username (str): The username/email of the user.
             password (str): The password of the user.
+            ip_address (str | None): The IP address of the client.
         
         Returns:
-            (Error | str): 
-                The access_token if authentication is successful, error otherwise.
+            (Error | TokenResponse): 
+                The access and refresh tokens if authentication is successful, 
+                error otherwise.
+
+        Raises:
+            RateLimitExceededError: 
+                If too many attempts were made for the username or from the 
+                IP address.
         """
-        user = self.__user_manager.get_by_email(username) or \
-            self.__user_manager.get_by_name(username)
+        if ip_address:
+            self.__ip_rate_limiter.acquire(ip_address)
+        username_key = username.casefold()
+        self.__username_rate_limiter.acquire(username_key)
+
+        user = self.__user_manager.get_by_email_or_name(username)
         
         if not user:
             return Error.invalid(
@@ -41,22 +77,102 @@ class AuthService:
                 "Invalid authentication request."
             )
         
+        if self.__user_manager.is_locked_out(user):
+            return Error.invalid(
+                "AuthError.UserLockedOut", 
+                "Invalid authentication request."
+            )
+        
         if not self.__user_manager.check_password(user, password):
+            # Persist the failed attempt, which may have locked the user out.
+            self.__unit_of_work.commit()
             return Error.invalid(
                 "AuthError.InvalidCredentials", 
                 "Invalid authentication request."
             )
         
+        self.__username_rate_limiter.reset(username_key)
+        tokens = self.__issue_tokens(user, family_id=uuid4())
+        self.__unit_of_work.commit()
+        return tokens
+
+    def refresh_access_token(self, refresh_token: str) -> Error | TokenResponse:
+        """
+        Exchange a refresh token for a new access token.
+
+        The refresh token is rotated: it can only be exchanged once. Presenting
+        a token that has already been used revokes every token issued from the
+        same sign-in, and tokens issued before the user's security stamp
+        changed are rejected.
+
+        Parameters:
+            refresh_token (str): The refresh token.
+
+        Returns:
+            (Error | TokenResponse):
+                The new access and refresh tokens if the refresh token is
+                valid, error otherwise.
+        """
+        result = self.__rotate_refresh_token(refresh_token)
+        # A consumed or revoked token stays so even if the exchange is rejected.
+        self.__unit_of_work.commit()
+        return result
+
+    def __rotate_refresh_token(self, refresh_token: str) -> Error | TokenResponse:
+        token_hash = self.__token_provider.hash_refresh_token(refresh_token)
+        now = datetime.now(UTC)
+
+        stored_token = self.__refresh_token_repository.consume(token_hash, now)
+        if not stored_token:
+            reused_token = self.__refresh_token_repository.find_by_hash(token_hash)
+            if reused_token:
+                self.__refresh_token_repository.revoke_family(
+                    reused_token.family_id, now
+                )
+            return self.__invalid_refresh_token()
+
+        if stored_token.expires_utc <= now:
+            return self.__invalid_refresh_token()
+
+        user = self.__user_manager.get_by_id(stored_token.user_id)
+        if (
+            not user or
+            not user.is_active or
+            user.security_stamp != stored_token.security_stamp
+        ):
+            return self.__invalid_refresh_token()
+
+        return self.__issue_tokens(user, family_id=stored_token.family_id)
+
+    def __issue_tokens(self, user: User, family_id: UUID) -> TokenResponse:
         token_claims = self.__get_token_claims(user)
-        token = self.__token_provider.generate_access_token(token_claims)
-        
-        return token
-    
+        access_token = self.__token_provider.generate_access_token(token_claims)
+
+        refresh_token, expires_utc = self.__token_provider.generate_refresh_token()
+        self.__refresh_token_repository.add(RefreshToken(
+            user_id=user.id,
+            family_id=family_id,
+            token_hash=self.__token_provider.hash_refresh_token(refresh_token),
+            security_stamp=user.security_stamp,
+            expires_utc=expires_utc
+        ))
+
+        return TokenResponse(access_token=access_token, refresh_token=refresh_token)
+
     def __get_token_claims(self, user: User) -> dict[str, Any]:
         claims: dict[str, Any] = {
             "sub": str(user.id),
             "name": user.username,
             "email": user.email_address,
+            "roles": list(self.__user_manager.get_roles(user)),
+            "stamp": user.security_stamp,
         }
 
         return claims
+
+    @staticmethod
+    def __invalid_refresh_token() -> Error:
+        return Error.invalid(
+            "AuthError.InvalidRefreshToken",
+            "Invalid refresh token."
+        )
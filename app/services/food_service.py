@@ -1,8 +1,14 @@
 from collections.abc import Sequence
+from typing import Any, assert_never
 from uuid import UUID
 
+from pydantic import TypeAdapter
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import col
 
+from app.database import UnitOfWork
+from app.database.constraints import violates_unique
 from app.models.food import FoodCategory, FoodItem
 from app.queries.food_queries import (
     FoodCategoriesQuery, 
@@ -10,7 +16,7 @@ from app.queries.food_queries import (
     FoodItemsFilterQuery
 )
 from app.repositories import FoodCategoryRepository, FoodItemRepository
-from app.schemas.common import Error, PagedList
+from app.schemas.common import CountMode, Error, PagedList
 from app.schemas.food import (
     FoodCategoryResponse, 
     FoodCategoryUpdate,
@@ -21,6 +27,10 @@ from app.schemas.food import (
 )
 from app.utils.collection import compare_collections
 
+# Listings are validated from rows in one call rather than model by model.
+_food_categories_adapter = TypeAdapter(list[FoodCategoryResponse])
+_food_items_adapter = TypeAdapter(list[FoodItemsResponse])
+
 
 class FoodService:
     """Service for managing food-related operations.
@@ -29,10 +39,12 @@ class FoodService:
     def __init__(
         self, 
         food_category_repository: FoodCategoryRepository, 
-        food_item_repository: FoodItemRepository
+        food_item_repository: FoodItemRepository,
+        unit_of_work: UnitOfWork
     ):
         self.__food_category_repository = food_category_repository
         self.__food_item_repository = food_item_repository
+        self.__unit_of_work = unit_of_work
 
     def delete_food_category(self, category_id: UUID) -> Error | UUID:
         """Delete a food category by its ID.
@@ -45,6 +57,7 @@ class FoodService:
             )
         
         self.__food_category_repository.delete(category)
+        self.__unit_of_work.commit()
 
         return category_id
     
@@ -55,12 +68,10 @@ class FoodService:
         """Retrieve a list of food categories.
         """
         query = FoodCategoriesQuery(name)
-        categories = self.__food_category_repository.get_list(query=query)
+        with self.__unit_of_work.read_only():
+            rows = self.__food_category_repository.get_rows(query=query)
 
-        return [
-            FoodCategoryResponse.model_validate(category, from_attributes=True) 
-            for category in categories
-        ]
+        return _food_categories_adapter.validate_python(rows, from_attributes=True)
     
     def update_food_category(
         self, 
@@ -84,32 +95,73 @@ class FoodService:
             )
         
         self.__food_category_repository.update(category)
+        self.__unit_of_work.commit()
 
         return category.id
 
-    def get_food_items(self, filter: FoodItemsFilter) -> PagedList[FoodItemsResponse]:
+    def get_food_items(
+        self, 
+        filter: FoodItemsFilter
+    ) -> Error | PagedList[FoodItemsResponse]:
         """Retrieve a list of food items.
         """
-        query = FoodItemsFilterQuery(filter)
-        items_response: Sequence[FoodItemsResponse] = [] 
+        try:
+            query = FoodItemsFilterQuery(filter)
+        except ValueError as e:
+            return Error.invalid("FoodError.Cursor", str(e))
+
+        with self.__unit_of_work.read_only():
+            rows, count, is_count_estimated = self.__get_food_items_page(query, filter)
+        items_response = _food_items_adapter.validate_python(rows, from_attributes=True)
+        next_cursor = query.cursor_after(rows[-1]) if len(rows) == filter.size else None
 
-        count = self.__food_item_repository.count(query=query)
-        if count == 0:
-            return PagedList(items_response, count, filter.index, filter.size)
+        return PagedList(
+            items_response, 
+            count, 
+            filter.index, 
+            filter.size, 
+            next_cursor, 
+            is_count_estimated
+        )
+
+    def __get_food_items_page(
+        self, 
+        query: FoodItemsFilterQuery, 
+        filter: FoodItemsFilter
+    ) -> tuple[Sequence[Row[Any]], int | None, bool]:
+        """Retrieve a page of food item rows and count them as the filter asks.
 
-        items = self.__food_item_repository.get_list(query=query)
-        items_response = [
-            FoodItemsResponse.model_validate(item, from_attributes=True) 
-            for item in items
-        ]
+        Returns:
+            tuple[Sequence[Row[Any]], int | None, bool]: 
+                The food item rows, their count, and whether it is an estimate.
+        """
+        repository = self.__food_item_repository
+        match filter.count:
+            case CountMode.NONE:
+                return repository.get_rows(query=query), None, False
+            case CountMode.ESTIMATED:
+                estimate = repository.estimate_count(query=query)
+                if estimate > filter.EXACT_COUNT_LIMIT:
+                    return repository.get_rows(query=query), estimate, True
+            case CountMode.EXACT:
+                pass
+            case _ as unreachable:
+                assert_never(unreachable)
 
-        return PagedList(items_response, count, filter.index, filter.size)
+        if filter.cursor is not None:
+            # Counted along with the page, only the items from the cursor on
+            # would be.
+            rows = repository.get_rows(query=query)
+            return rows, repository.count(query=query), False
+        rows, count = repository.get_page_rows(query=query)
+        return rows, count, False
 
     def get_food_item(self, food_id: UUID) -> Error | FoodItemResponse:
         """Retrieve a food item by its ID.
         """
         query = FoodItemQuery(food_id, eager=True)
-        food_item = self.__food_item_repository.find(query=query)
+        with self.__unit_of_work.read_only():
+            food_item = self.__food_item_repository.find(query=query)
         if not food_item:
             return Error.not_found(
                 "FoodError.NotFound", 
@@ -122,12 +174,6 @@ class FoodService:
         """Create a new food item.
         """
         food_item = FoodItem.model_validate(food_entry, from_attributes=True)
-        if self.__food_item_repository.exists(food_item):
-            return Error.conflict(
-                "FoodError.Conflict", 
-                f"Food Item (Name: {food_item.name}) already exists."
-            )
-        
         if food_entry.food_category_ids:
             categories = self.__food_category_repository.get_list(
                 col(FoodCategory.id).in_(food_entry.food_category_ids)
@@ -139,7 +185,16 @@ class FoodService:
                 )
             food_item.food_categories = list(categories)
 
-        self.__food_item_repository.add(food_item)
+        try:
+            self.__food_item_repository.add(food_item)
+        except IntegrityError as e:
+            if not violates_unique(e, col(FoodItem.name)):
+                raise
+            return Error.conflict(
+                "FoodError.Conflict", 
+                f"Food Item (Name: {food_item.name}) already exists."
+            )
+        self.__unit_of_work.commit()
 
         return food_item.id
 
@@ -158,12 +213,6 @@ class FoodService:
             )
         
         update_item = FoodItem.model_validate(food_entry, from_attributes=True)
-        if (self.__food_item_repository.exists(update_item)):
-            return Error.conflict(
-                "FoodError.Conflict", 
-                f"Food Item (Name: {food_item.name}) already exists."
-            )
-        
         categories = self.__food_category_repository.get_list(
             col(FoodCategory.id).in_(food_entry.food_category_ids)
         )
@@ -180,7 +229,16 @@ class FoodService:
         
         food_item.sqlmodel_update(update_item)
         
-        self.__food_item_repository.update(food_item)
+        try:
+            self.__food_item_repository.update(food_item)
+        except IntegrityError as e:
+            if not violates_unique(e, col(FoodItem.name)):
+                raise
+            return Error.conflict(
+                "FoodError.Conflict", 
+                f"Food Item (Name: {update_item.name}) already exists."
+            )
+        self.__unit_of_work.commit()
 
         return food_item.id
 
@@ -195,5 +253,6 @@ class FoodService:
             )
         
         self.__food_item_repository.delete(food_item)
+        self.__unit_of_work.commit()
 
         return food_id
@@ -0,0 +1,86 @@
+from collections.abc import Callable
+from uuid import UUID
+
+import anyio.to_thread
+from anyio import CapacityLimiter
+
+from app.managers import UserManager
+from app.schemas.auth import Principal
+from app.utils.cache import LRUCache
+
+
+class PrincipalService:
+    """Service for resolving the authenticated principal of a request.
+    """
+
+    def __init__(
+        self, 
+        user_manager_factory: Callable[[], UserManager], 
+        principal_cache: LRUCache[UUID, Principal],
+        thread_limit: int
+    ) -> None:
+        """
+        Parameters:
+            user_manager_factory (Callable[[], UserManager]): 
+                Factory creating the user manager used to load principals.
+            principal_cache (LRUCache[UUID, Principal]): 
+                Cache of resolved principals, keyed by user ID.
+            thread_limit (int): 
+                Maximum number of worker threads loading principals at once.
+        """
+        self.__user_manager_factory = user_manager_factory
+        self.__principal_cache = principal_cache
+        self.__limiter = CapacityLimiter(thread_limit)
+
+    async def resolve(self, user_id: UUID, security_stamp: str) -> Principal | None:
+        """Resolve the principal for the specified user ID.
+
+        Cached principals are returned without touching the database. 
+        Otherwise the blocking lookup runs on a bounded pool of worker threads, 
+        so the event loop is never stalled while the principal is loaded.
+
+        Parameters:
+            user_id (UUID): The user ID (token subject).
+            security_stamp (str): The security stamp the token was issued with.
+
+        Returns:
+            (Principal | None): 
+                The principal, or None if the user does not exist or the 
+                security stamp has since been rotated (stale token).
+        """
+        principal = self.__principal_cache.get(user_id)
+
+        # A mismatch against a cached entry may be a stamp rotated after the 
+        # entry was cached, so reload once before rejecting the token.
+        if principal is None or principal.security_stamp != security_stamp:
+            # A principal loaded across an invalidation may carry the stamp 
+            # from before it, so it is returned but not cached.
+            generation = self.__principal_cache.generation(user_id)
+            principal = await anyio.to_thread.run_sync(
+                self.load, user_id, limiter=self.__limiter
+            )
+            if principal is None:
+                return None
+            self.__principal_cache.set(user_id, principal, generation=generation)
+
+        if principal.security_stamp != security_stamp:
+            return None
+
+        return principal
+
+    def load(self, user_id: UUID) -> Principal | None:
+        """Load the principal for the specified user ID (blocking).
+        """
+        user_manager = self.__user_manager_factory()
+        user = user_manager.get_by_id(user_id)
+        if user is None:
+            return None
+
+        return Principal(
+            id=user.id,
+            username=user.username,
+            email_address=user.email_address,
+            avatar_uri=user.avatar_uri,
+            is_active=user.is_active,
+            security_stamp=user.security_stamp
+        )
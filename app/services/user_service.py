@@ -4,20 +4,30 @@ import sqlalchemy.exc as sa_ex
 from sqlmodel import col
 
 import app.constants as constants
+from app.database import UnitOfWork
 from app.errors import user_errors
 from app.models.auth import User
 from app.models.user import AppUser
 from app.repositories.user_repository import UserRepository
+from app.schemas.auth import Principal
 from app.schemas.common import Error
 from app.schemas.users import UserProfileUpdate
+from app.utils.cache import LRUCache
 
 
 class UserService:
 
-    __slots__ = ('__user_repo')
+    __slots__ = ('__user_repo', '__principal_cache', '__unit_of_work')
     
-    def __init__(self, user_repo: UserRepository):
+    def __init__(
+        self, 
+        user_repo: UserRepository, 
+        principal_cache: LRUCache[UUID, Principal],
+        unit_of_work: UnitOfWork
+    ):
         self.__user_repo = user_repo
+        self.__principal_cache = principal_cache
+        self.__unit_of_work = unit_of_work
     
     def update_profile(
         self, 
@@ -48,6 +58,8 @@ class UserService:
         user.sqlmodel_update(schema)
         user.app_user.sqlmodel_update(schema)
         self.__user_repo.update(user)
+        self.__unit_of_work.commit()
+        self.__principal_cache.invalidate(user.id)
 
         return user.id
 
@@ -62,6 +74,8 @@ class UserService:
             return user_errors.super_user_delete_attempt()
         
         self.__user_repo.delete(user)
+        self.__unit_of_work.commit()
+        self.__principal_cache.invalidate(user.id)
 
         return user.id
 
@@ -0,0 +1,181 @@
+"""
+Size-bounded, in-process caches.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar, final
+
+_K = TypeVar('_K', bound=Hashable)
+_V = TypeVar('_V')
+
+
+@dataclass(frozen=True)
+@final
+class CacheStats:
+    """A snapshot of cache statistics.
+
+    Attributes:
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups not found in the cache (or expired).
+        evictions (int): Number of entries evicted to respect the size bound.
+        size (int): Current number of entries.
+        max_size (int): Maximum number of entries.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """The ratio of lookups served from the cache.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache(Generic[_K, _V]):
+    """
+    A thread-safe LRU cache with a size bound and per-entry expiry.
+
+    Type Parameters:
+        _K: The key type.
+        _V: The value type.
+    """
+
+    def __init__(
+        self, 
+        max_size: int, 
+        ttl: float | None = None, 
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Parameters:
+            max_size (int): The maximum number of entries kept in the cache.
+            ttl (float | None): 
+                Default time-to-live of an entry in seconds, None to never expire.
+            clock (Callable[[], float]): Monotonic clock returning seconds.
+
+        Raises:
+            ValueError: If the max_size is less than or equal to 0.
+        """
+        if max_size <= 0:
+            raise ValueError("Cache size must be greater than 0.")
+
+        self.__max_size = max_size
+        self.__ttl = ttl
+        self.__clock = clock
+        self.__entries: OrderedDict[_K, tuple[_V, float | None]] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        # Generations of the most recently invalidated keys; older keys 
+        # share the floor, the newest generation dropped from the record.
+        self.__version = 0
+        self.__invalidated: OrderedDict[_K, int] = OrderedDict()
+        self.__floor = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """Get a snapshot of the cache statistics.
+        """
+        with self.__lock:
+            return CacheStats(
+                hits=self.__hits,
+                misses=self.__misses,
+                evictions=self.__evictions,
+                size=len(self.__entries),
+                max_size=self.__max_size
+            )
+
+    def get(self, key: _K) -> _V | None:
+        """Get the cached value for the key, or None if absent or expired.
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.__misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= self.__clock():
+                del self.__entries[key]
+                self.__misses += 1
+                return None
+
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return value
+
+    def generation(self, key: _K) -> int:
+        """Get the generation of the key, which changes whenever the key is 
+        invalidated.
+
+        Record it before loading a value, and pass it to `set` so a value 
+        loaded before an invalidation is not cached.
+        """
+        with self.__lock:
+            return self.__generation(key)
+
+    def set(
+        self, 
+        key: _K, 
+        value: _V, 
+        ttl: float | None = None, 
+        generation: int | None = None
+    ) -> None:
+        """Cache a value for the key.
+
+        Parameters:
+            key (_K): The cache key.
+            value (_V): The value to cache.
+            ttl (float | None): 
+                Time-to-live in seconds, overriding the cache's default.
+            generation (int | None): 
+                The generation of the key when the value was loaded; the value 
+                is not cached if the key has since been invalidated.
+        """
+        ttl = self.__ttl if ttl is None else ttl
+        expires_at = self.__clock() + ttl if ttl is not None else None
+
+        with self.__lock:
+            if generation is not None and generation != self.__generation(key):
+                return
+            self.__entries[key] = (value, expires_at)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+                self.__evictions += 1
+
+    def invalidate(self, key: _K) -> None:
+        """Remove the cached value for the key, if any.
+        """
+        with self.__lock:
+            self.__entries.pop(key, None)
+            self.__version += 1
+            self.__invalidated[key] = self.__version
+            self.__invalidated.move_to_end(key)
+            while len(self.__invalidated) > self.__max_size:
+                _, self.__floor = self.__invalidated.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached values.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__version += 1
+            self.__invalidated.clear()
+            self.__floor = self.__version
+
+    def __generation(self, key: _K) -> int:
+        return self.__invalidated.get(key, self.__floor)
+
+    def __len__(self) -> int:
+        return len(self.__entries)
@@ -0,0 +1,98 @@
+"""
+In-process, sliding-window rate limiting.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+_K = TypeVar('_K', bound=Hashable)
+
+
+class RateLimitExceededError(Exception):
+    """Raised when a rate limit is exceeded.
+    """
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__("Rate limit exceeded.")
+        self.retry_after = retry_after
+
+
+class SlidingWindowRateLimiter(Generic[_K]):
+    """
+    A thread-safe rate limiter admitting at most `limit` hits per key within
+    any `window` seconds.
+
+    Keys are tracked in least-recently-used order and the oldest keys are
+    dropped beyond `max_keys`, so memory stays bounded under key churn.
+
+    Type Parameters:
+        _K: The key type.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        window: float,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Parameters:
+            limit (int): The maximum number of hits per key within the window.
+            window (float): The window length in seconds.
+            max_keys (int): The maximum number of keys tracked.
+            clock (Callable[[], float]): Monotonic clock returning seconds.
+
+        Raises:
+            ValueError: If the limit, window or max_keys is not positive.
+        """
+        if limit <= 0 or window <= 0 or max_keys <= 0:
+            raise ValueError("Limit, window and max_keys must be greater than 0.")
+
+        self.__limit = limit
+        self.__window = window
+        self.__max_keys = max_keys
+        self.__clock = clock
+        self.__hits: OrderedDict[_K, deque[float]] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def acquire(self, key: _K) -> None:
+        """Record a hit for the key.
+
+        Raises:
+            RateLimitExceededError:
+                If the key has used up its limit within the window; the hit
+                is not recorded.
+        """
+        with self.__lock:
+            now = self.__clock()
+            hits = self.__hits.get(key)
+            if hits is None:
+                hits = self.__hits[key] = deque()
+                if len(self.__hits) > self.__max_keys:
+                    self.__hits.popitem(last=False)
+            else:
+                self.__hits.move_to_end(key)
+
+            while hits and hits[0] <= now - self.__window:
+                hits.popleft()
+
+            if len(hits) >= self.__limit:
+                retry_after = hits[0] + self.__window - now
+                raise RateLimitExceededError(max(math.ceil(retry_after), 1))
+
+            hits.append(now)
+
+    def reset(self, key: _K) -> None:
+        """Forget the hits recorded for the key.
+        """
+        with self.__lock:
+            self.__hits.pop(key, None)
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__hits)
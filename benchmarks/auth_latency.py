@@ -0,0 +1,128 @@
+"""
+Latency benchmark for concurrent authenticated `GET /auth/me` requests.
+
+The database is replaced by a fake that blocks for a fixed latency, so the
+benchmark isolates how principal resolution in the authentication dependency
+interacts with the event loop. The "before" run resolves the principal
+inline on the event loop, the "after" run uses the bounded thread offload.
+
+Usage:
+    python -m benchmarks.auth_latency --requests 500 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+import uuid
+from collections.abc import Sequence
+from typing import Any
+
+os.environ.setdefault("DB_HOST", "localhost")
+os.environ.setdefault("DB_USER", "benchmark")
+os.environ.setdefault("DB_PASSWORD", "benchmark")
+os.environ.setdefault("DB_NAME", "benchmark")
+
+import httpx  # noqa: E402
+
+from app.core.security import TokenProvider  # noqa: E402
+from app.main import app, container  # noqa: E402
+from app.models.auth import User  # noqa: E402
+from app.schemas.auth import Principal  # noqa: E402
+from app.services import PrincipalService  # noqa: E402
+from app.utils.cache import LRUCache  # noqa: E402
+
+
+class FakeUserManager:
+    """User manager whose lookups block like a Postgres round trip."""
+
+    def __init__(self, user: User, latency: float) -> None:
+        self.__user = user
+        self.__latency = latency
+
+    def get_by_id(self, user_id: uuid.UUID) -> User | None:
+        time.sleep(self.__latency)
+        return self.__user
+
+
+class BlockingPrincipalService(PrincipalService):
+    """Resolves principals inline on the event loop (previous behaviour)."""
+
+    async def resolve(
+        self, user_id: uuid.UUID, security_stamp: str
+    ) -> Principal | None:
+        principal = self.load(user_id)
+        if principal is None or principal.security_stamp != security_stamp:
+            return None
+        return principal
+
+
+async def run(
+    service: PrincipalService, token: str, requests: int, concurrency: int
+) -> list[float]:
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    transport = httpx.ASGITransport(app=app)
+    client = httpx.AsyncClient(transport=transport, base_url="http://bench")
+    async with client:
+
+        async def request() -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get("/auth/me", headers=headers)
+                latencies.append(time.perf_counter() - start)
+                response.raise_for_status()
+
+        with container.principal_service.override(service):
+            await asyncio.gather(*(request() for _ in range(requests)))
+
+    return latencies
+
+
+def report(label: str, latencies: list[float]) -> None:
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{label:<8} p50={quantiles[49] * 1000:8.2f}ms "
+        f"p99={quantiles[98] * 1000:8.2f}ms "
+        f"max={max(latencies) * 1000:8.2f}ms"
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--db-latency-ms", type=float, default=2.0)
+    args = parser.parse_args(argv)
+
+    user = User(
+        username="benchmark", email_address="benchmark@example.com", is_active=True
+    )
+    user_manager: Any = FakeUserManager(user, args.db_latency_ms / 1000)
+    token = TokenProvider().generate_access_token(
+        {"sub": str(user.id), "stamp": user.security_stamp, "roles": []}
+    )
+
+    # A zero TTL disables principal caching, so every request resolves.
+    thread_limit = container.app_settings().AUTH.RESOLVER_THREAD_LIMIT
+    services = {
+        "before": BlockingPrincipalService(
+            lambda: user_manager, LRUCache(max_size=1, ttl=0), thread_limit
+        ),
+        "after": PrincipalService(
+            lambda: user_manager, LRUCache(max_size=1, ttl=0), thread_limit
+        ),
+    }
+
+    for label, service in services.items():
+        latencies = asyncio.run(
+            run(service, token, args.requests, args.concurrency)
+        )
+        report(label, latencies)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Benchmark for serving a 50-item food item page, from the query to the
+response models.
+
+Each run reads one page from an in-memory SQLite database, so the numbers
+leave out the network and measure loading and validation:
+
+- entities: full `FoodItem` entities, each validated into a response model,
+  as the listing did originally.
+- load_only: the same with only the listed columns loaded.
+- rows: rows of the listed columns, validated into response models in one
+  call, without any entity or session tracking.
+
+Usage:
+    python -m benchmarks.food_item_page [--iterations 2000] [--items 1000]
+"""
+
+import argparse
+import os
+import timeit
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+os.environ.setdefault("DB_HOST", "localhost")
+os.environ.setdefault("DB_USER", "benchmark")
+os.environ.setdefault("DB_PASSWORD", "benchmark")
+os.environ.setdefault("DB_NAME", "benchmark")
+
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.dialects.postgresql import JSONB  # noqa: E402
+from sqlalchemy.ext.compiler import compiles  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+
+from app.database import QueryBuilder  # noqa: E402
+from app.models.food import FoodItem, NutritionContent  # noqa: E402
+from app.queries.food_queries import FoodItemsFilterQuery  # noqa: E402
+from app.repositories import FoodItemRepository  # noqa: E402
+from app.schemas.common import CountMode  # noqa: E402
+from app.schemas.food import (  # noqa: E402
+    FoodItemsFilter,
+    FoodItemSortOrder,
+    FoodItemsResponse,
+)
+
+PAGE_SIZE = 50
+
+
+@compiles(JSONB, "sqlite")
+def compile_jsonb(type_: Any, compiler: Any, **kw: Any) -> str:
+    return "JSON"
+
+
+class EntitiesPage(QueryBuilder[FoodItem]):
+    """The food item listing without column projection."""
+
+    def __init__(self) -> None:
+        super().__init__(FoodItem)
+        self._order_by(self.model.name) # type: ignore
+        self._paginate(skip=0, take=PAGE_SIZE)
+
+
+def report(label: str, seconds: float, iterations: int) -> None:
+    print(f"{label:<9} {seconds / iterations * 1_000_000:8.2f}us/page")
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2_000)
+    parser.add_argument("--items", type=int, default=1_000)
+    args = parser.parse_args(argv)
+
+    engine = create_engine("sqlite://")
+    FoodItem.__table__.create(engine)  # type: ignore[attr-defined]
+    with Session(engine) as session:
+        session.add_all([
+            FoodItem(
+                name=f"Food {i:05}",
+                description="A staple served with stew. " * 4,
+                serving_size="1 plate",
+                calories_per_serving=350.0,
+                nutrition_content=NutritionContent(
+                    carb_g=45.0, fat_g=12.0, protein_g=8.0
+                ).model_dump(),
+            )
+            for i in range(args.items)
+        ])
+        session.commit()
+
+    @contextmanager
+    def session_factory() -> Iterator[Session]:
+        with Session(engine) as session:
+            yield session
+
+    repository = FoodItemRepository(session_factory)
+    adapter = TypeAdapter(list[FoodItemsResponse])
+    filter = FoodItemsFilter(
+        sort_order=FoodItemSortOrder.NAME_ASC, size=PAGE_SIZE, count=CountMode.NONE
+    )
+
+    def validate(items: Sequence[Any]) -> list[FoodItemsResponse]:
+        return [
+            FoodItemsResponse.model_validate(item, from_attributes=True)
+            for item in items
+        ]
+
+    def entities() -> None:
+        validate(repository.get_list(query=EntitiesPage()))
+
+    def load_only() -> None:
+        validate(repository.get_list(query=FoodItemsFilterQuery(filter)))
+
+    def rows() -> None:
+        page = repository.get_rows(query=FoodItemsFilterQuery(filter))
+        adapter.validate_python(page, from_attributes=True)
+
+    results = {}
+    runs = (("entities", entities), ("load_only", load_only), ("rows", rows))
+    for label, run in runs:
+        run()
+        results[label] = timeit.timeit(run, number=args.iterations)
+        report(label, results[label], args.iterations)
+
+    print(f"speedup {results['entities'] / results['rows']:.1f}x over entities")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
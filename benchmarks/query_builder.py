@@ -0,0 +1,75 @@
+"""
+Microbenchmarks for building and compiling the food item filter query.
+
+Each run builds a `FoodItemsFilterQuery` and resolves the SQL it executes:
+
+- cold: the statement is built and compiled, as on a first request.
+- fresh: the statement is built and its cache key generated, which is all a
+  compiled cache hit costs when every request builds a new statement.
+- cached: the statement comes from the query builder's statement cache, so
+  its memoized cache key finds the compiled SQL directly.
+
+Usage:
+    python -m benchmarks.query_builder [--iterations 5000]
+"""
+
+import argparse
+import os
+import timeit
+from collections.abc import Callable, Sequence
+
+os.environ.setdefault("DB_HOST", "localhost")
+os.environ.setdefault("DB_USER", "benchmark")
+os.environ.setdefault("DB_PASSWORD", "benchmark")
+os.environ.setdefault("DB_NAME", "benchmark")
+
+from sqlalchemy.dialects.postgresql.psycopg import dialect  # noqa: E402
+
+from app.database import QueryBuilder  # noqa: E402
+from app.queries.food_queries import FoodItemsFilterQuery  # noqa: E402
+from app.schemas.food import FoodItemsFilter  # noqa: E402
+
+
+def report(label: str, seconds: float, iterations: int) -> None:
+    print(f"{label:<7} {seconds / iterations * 1_000_000:8.2f}us/op")
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=5_000)
+    args = parser.parse_args(argv)
+
+    postgres = dialect()  # type: ignore[no-untyped-call]
+    filters = [
+        FoodItemsFilter(search=f"rice {i}", min_calories=i, index=i % 10 + 1)
+        for i in range(args.iterations)
+    ]
+
+    def build(i: int) -> None:
+        statement = FoodItemsFilterQuery(filters[i]).build()
+        statement._generate_cache_key()
+
+    def cold(i: int) -> None:
+        QueryBuilder._statement_cache.clear()
+        statement = FoodItemsFilterQuery(filters[i]).build()
+        statement._generate_cache_key()
+        statement.compile(dialect=postgres)
+
+    def fresh(i: int) -> None:
+        QueryBuilder._statement_cache.clear()
+        build(i)
+
+    def each_filter(run: Callable[[int], None]) -> Callable[[], None]:
+        turns = iter(range(args.iterations))
+        return lambda: run(next(turns))
+
+    results = {}
+    for label, run in (("cold", cold), ("fresh", fresh), ("cached", build)):
+        results[label] = timeit.timeit(each_filter(run), number=args.iterations)
+        report(label, results[label], args.iterations)
+
+    print(f"speedup {results['fresh'] / results['cached']:.1f}x over fresh")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Microbenchmarks for TokenValidator.decode_token cache hits and misses.
+
+A miss verifies the HMAC signature and the registered claims; a hit only
+digests the token and looks it up in the verified-token cache.
+
+Usage:
+    python -m benchmarks.token_validator [--iterations 20000]
+"""
+
+import argparse
+import time
+import timeit
+from collections.abc import Sequence
+
+import jwt
+
+from app.core.security import TokenProvider, TokenValidator
+
+SECRET_KEY = "benchmark-secret-key-with-32-chars"
+ISSUER = "kalorie-tracker-api"
+AUDIENCE = ["http://localhost:8000"]
+
+
+def create_token(subject: int) -> str:
+    payload = {
+        "sub": str(subject),
+        "iss": ISSUER,
+        "aud": AUDIENCE,
+        "exp": int(time.time()) + 3600,
+        "roles": ["viewer"],
+        "stamp": "0" * 32,
+    }
+    return jwt.encode(payload, SECRET_KEY, algorithm=TokenProvider.ALGORITHM)
+
+
+def report(label: str, seconds: float, iterations: int) -> None:
+    print(f"{label:<6} {seconds / iterations * 1_000_000:8.2f}us/op")
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args(argv)
+
+    validator = TokenValidator(
+        SECRET_KEY, ISSUER, AUDIENCE, cache_size=args.iterations
+    )
+
+    # Distinct tokens are never found in the cache.
+    tokens = iter([create_token(i) for i in range(args.iterations)])
+    miss = timeit.timeit(
+        lambda: validator.decode_token(next(tokens)), number=args.iterations
+    )
+
+    token = create_token(-1)
+    validator.decode_token(token)
+    hit = timeit.timeit(lambda: validator.decode_token(token), number=args.iterations)
+
+    report("miss", miss, args.iterations)
+    report("hit", hit, args.iterations)
+    print(f"speedup {miss / hit:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""food item add listing indexes
+
+Revision ID: 5d2c81f7a9b4
+Revises: a1951526ac16
+Create Date: 2026-10-16 10:12:37.418205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2c81f7a9b4'
+down_revision: Union[str, None] = 'a1951526ac16'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_food_item_last_modified_id',
+        'food_item',
+        [sa.text('coalesce(last_modified_utc, created_utc)'), 'id'],
+        unique=False
+    )
+    op.create_index('ix_food_item_name_id', 'food_item', ['name', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_food_item_name_id', table_name='food_item')
+    op.drop_index('ix_food_item_last_modified_id', table_name='food_item')
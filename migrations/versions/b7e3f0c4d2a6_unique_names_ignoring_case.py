@@ -0,0 +1,50 @@
+"""unique names ignoring case
+
+Revision ID: b7e3f0c4d2a6
+Revises: 5d2c81f7a9b4
+Create Date: 2026-10-16 14:03:51.206117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3f0c4d2a6'
+down_revision: Union[str, None] = '5d2c81f7a9b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_food_item_name_lower', 'food_item', [sa.text('lower(name)')], unique=True
+    )
+    op.create_index(
+        'ix_auth_role_name_lower', 'auth_role', [sa.text('lower(name)')], unique=True
+    )
+    op.create_index(
+        'ix_auth_user_email_address_lower', 
+        'auth_user', 
+        [sa.text('lower(email_address)')], 
+        unique=True
+    )
+    op.create_index(
+        'ix_auth_user_username_lower', 
+        'auth_user', 
+        [sa.text('lower(username)')], 
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_auth_user_username_lower', table_name='auth_user')
+    op.drop_index('ix_auth_user_email_address_lower', table_name='auth_user')
+    op.drop_index('ix_auth_role_name_lower', table_name='auth_role')
+    op.drop_index('ix_food_item_name_lower', table_name='food_item')
@@ -1,6 +1,18 @@
+import os
+
 import pytest
 
+# The container reads the settings when it is imported; no test connects to 
+# this database.
+for name, value in {
+    "DB_HOST": "localhost",
+    "DB_USER": "test",
+    "DB_PASSWORD": "test",
+    "DB_NAME": "test",
+}.items():
+    os.environ.setdefault(name, value)
+
 
 @pytest.fixture(scope="function", params=["", " "])
 def empty_string(request):
-    return request.param
\ No newline at end of file
+    return request.param
@@ -0,0 +1,144 @@
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import jwt
+from dependency_injector import providers
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import Authorize, CurrentUser
+from app.constants import roles
+from app.core.container import DIContainer
+from app.core.security import TokenProvider, TokenValidator
+from app.schemas.auth import Principal
+from app.services import PrincipalService
+
+
+SECRET_KEY = "unit-test-secret-key-with-32-chars!"
+
+
+class TestPrincipalDependencies:
+    """Tests for authenticating requests through route dependencies.
+    """
+
+    def setup_method(self) -> None:
+        self.principal = Principal(
+            id=uuid4(),
+            username="ada",
+            email_address="ada@example.com",
+            is_active=True,
+            security_stamp="stamp"
+        )
+        self.token_validator = MagicMock(wraps=TokenValidator(SECRET_KEY))
+        self.principal_service = MagicMock(spec=PrincipalService)
+        self.principal_service.resolve = AsyncMock(return_value=self.principal)
+
+        self.container = DIContainer()
+        self.container.token_validator.override(
+            providers.Object(self.token_validator)
+        )
+        self.container.principal_service.override(
+            providers.Object(self.principal_service)
+        )
+        self.container.wire(modules=["app.api.dependencies"])
+
+        app = FastAPI()
+
+        @app.get("/public")
+        def public() -> None:
+            return None
+
+        @app.get("/me", dependencies=[Depends(Authorize())])
+        def me(user: CurrentUser) -> str:
+            return user.username
+
+        @app.get(
+            "/food", 
+            dependencies=[Depends(Authorize(roles=[roles.FOOD_EDITOR]))]
+        )
+        def food() -> None:
+            return None
+
+        self.client = TestClient(app)
+
+    def teardown_method(self) -> None:
+        self.container.unwire()
+
+    def token(self, **claims: Any) -> str:
+        payload = {
+            "sub": str(self.principal.id),
+            "stamp": self.principal.security_stamp,
+            "exp": int(time.time()) + 60,
+            **claims,
+        }
+        return jwt.encode(payload, SECRET_KEY, algorithm=TokenProvider.ALGORITHM)
+
+    def get(self, path: str, token: str | None = None) -> Any:
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        return self.client.get(path, headers=headers)
+
+    def test_public_route_does_no_auth_work(self) -> None:
+        """Test a route without auth dependencies ignores the bearer token.
+        """
+        response = self.get("/public", self.token())
+
+        assert response.status_code == 200
+        self.token_validator.decode_token.assert_not_called()
+        self.principal_service.resolve.assert_not_called()
+
+    def test_missing_token_is_unauthorized(self) -> None:
+        """Test a protected route without a bearer token returns 401.
+        """
+        response = self.get("/me")
+
+        assert response.status_code == 401
+        assert response.headers["WWW-Authenticate"] == "Bearer"
+        self.principal_service.resolve.assert_not_called()
+
+    def test_invalid_token_is_unauthorized(self) -> None:
+        """Test a protected route with an invalid bearer token returns 401.
+        """
+        response = self.get("/me", "not-a-token")
+
+        assert response.status_code == 401
+        assert response.headers["WWW-Authenticate"] == "Bearer"
+        self.principal_service.resolve.assert_not_called()
+
+    def test_stale_principal_is_unauthorized(self) -> None:
+        """Test a token whose principal cannot be resolved returns 401.
+        """
+        self.principal_service.resolve.return_value = None
+
+        response = self.get("/me", self.token())
+
+        assert response.status_code == 401
+        assert response.headers["WWW-Authenticate"] == "Bearer"
+
+    def test_missing_permission_is_forbidden(self) -> None:
+        """Test a role that does not imply the required one returns 403.
+        """
+        response = self.get("/food", self.token(roles=[roles.VIEWER]))
+
+        assert response.status_code == 403
+
+    def test_implied_permission_is_authorized(self) -> None:
+        """Test a role implying the required one is authorized.
+        """
+        response = self.get("/food", self.token(roles=[roles.FOOD_ADMIN]))
+
+        assert response.status_code == 200
+
+    def test_resolves_principal_once_per_request(self) -> None:
+        """Test the principal is resolved once for a request whose 
+        dependencies all need it.
+        """
+        response = self.get("/me", self.token())
+
+        assert response.status_code == 200
+        assert response.json() == "ada"
+        self.token_validator.decode_token.assert_called_once()
+        self.principal_service.resolve.assert_awaited_once_with(
+            self.principal.id, self.principal.security_stamp
+        )
@@ -0,0 +1,71 @@
+import os
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from app.core import security
+from app.core.security import PasswordHasher, PasswordHasherBusyError
+
+
+def exit_worker(password: str) -> str:
+    os._exit(1)
+
+
+class TestPasswordHasher:
+    """Tests for the PasswordHasher.
+    """
+
+    def setup_method(self):
+        self.hasher = PasswordHasher(max_workers=1, max_queue=0, retry_after=3)
+
+    def teardown_method(self):
+        self.hasher.shutdown()
+
+    def test_hash_and_verify_password(self):
+        """Test a hashed password verifies in the worker pool.
+        """
+        password_hash = self.hasher.hash_password("passworD123!")
+
+        assert self.hasher.verify_password("passworD123!", password_hash)
+        assert not self.hasher.verify_password("wrong", password_hash)
+        assert self.hasher.stats.completed == 3
+
+    def test_rejects_when_pool_is_full(self):
+        """Test a request is rejected when no worker or queue slot is free.
+        """
+        worker = threading.Thread(target=self.hasher.hash_password, args=("a",))
+        worker.start()
+        while self.hasher.stats.in_flight == 0:
+            time.sleep(0.001)
+
+        with pytest.raises(PasswordHasherBusyError) as exc_info:
+            self.hasher.hash_password("b")
+        worker.join()
+
+        assert exc_info.value.retry_after == 3
+        assert self.hasher.stats.rejected == 1
+        assert self.hasher.stats.in_flight == 0
+
+    def test_failures_are_not_completions(self) -> None:
+        """Test a request failing in the worker is not counted as completed.
+        """
+        with pytest.raises(ValueError):
+            self.hasher.verify_password("passworD123!", "not a hash")
+
+        assert self.hasher.stats.completed == 0
+        assert self.hasher.stats.in_flight == 0
+
+    def test_replaces_broken_pool(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a pool broken by a dead worker is replaced for later requests.
+        """
+        monkeypatch.setattr(security, "_hash_password", exit_worker)
+        with pytest.raises(BrokenProcessPool):
+            self.hasher.hash_password("passworD123!")
+        monkeypatch.undo()
+
+        password_hash = self.hasher.hash_password("passworD123!")
+
+        assert self.hasher.verify_password("passworD123!", password_hash)
+        assert self.hasher.stats.completed == 2
@@ -0,0 +1,64 @@
+import pytest
+
+from app.constants import roles
+from app.core.permissions import ROLE_HIERARCHY, RolePermissions, role_permissions
+
+
+class TestRolePermissions:
+    """Tests for the RolePermissions.
+    """
+
+    def test_role_grants_itself(self):
+        """Test a role satisfies a requirement for the same role.
+        """
+        granted = role_permissions.granted([roles.VIEWER])
+
+        assert granted & role_permissions.required([roles.VIEWER])
+
+    def test_role_grants_implied_roles(self):
+        """Test a role satisfies requirements for the roles it implies.
+        """
+        granted = role_permissions.granted([roles.ADMINISTRATOR])
+
+        assert granted & role_permissions.required([roles.FOOD_EDITOR])
+        assert granted & role_permissions.required([roles.IAM_ROLE_ADMIN])
+        assert granted & role_permissions.required([roles.VIEWER])
+
+    def test_implied_role_does_not_grant_parent(self):
+        """Test a role does not satisfy requirements for roles implying it.
+        """
+        granted = role_permissions.granted([roles.FOOD_EDITOR])
+
+        assert not granted & role_permissions.required([roles.FOOD_ADMIN])
+        assert not granted & role_permissions.required([roles.EDITOR])
+
+    def test_unknown_roles_grant_nothing(self):
+        """Test unknown role names grant no permissions.
+        """
+        assert role_permissions.granted(["unknown"]) == 0
+        assert role_permissions.granted([]) == 0
+
+    def test_required_rejects_unknown_roles(self):
+        """Test a requirement on an unknown role fails fast.
+        """
+        with pytest.raises(ValueError):
+            role_permissions.required(["unknown"])
+
+    def test_hierarchy_rejects_unknown_roles(self):
+        """Test the hierarchy may only refer to known roles.
+        """
+        with pytest.raises(ValueError):
+            RolePermissions(["a"], {"a": ["b"]})
+
+    def test_hierarchy_cycles_terminate(self):
+        """Test a cyclic hierarchy compiles to the union of the cycle.
+        """
+        permissions = RolePermissions(["a", "b"], {"a": ["b"], "b": ["a"]})
+
+        assert permissions.granted(["a"]) == permissions.granted(["b"]) == 0b11
+
+    def test_every_hierarchy_role_is_known(self):
+        """Test the application hierarchy only refers to defined roles.
+        """
+        for role, implied_roles in ROLE_HIERARCHY.items():
+            role_permissions.required([role, *implied_roles])
@@ -0,0 +1,80 @@
+import time
+from typing import Any
+
+import jwt
+import pytest
+
+from app.core.security import TokenProvider, TokenValidator
+
+
+SECRET_KEY = "unit-test-secret-key-with-32-chars!"
+ISSUER = "kalorie-tracker-api"
+AUDIENCE = ["http://localhost:8000"]
+
+
+def encode(**claims: Any) -> str:
+    payload = {
+        "sub": "user",
+        "iss": ISSUER,
+        "aud": AUDIENCE,
+        "exp": int(time.time()) + 60,
+        **claims,
+    }
+    return jwt.encode(payload, SECRET_KEY, algorithm=TokenProvider.ALGORITHM)
+
+
+class TestTokenValidator:
+    """Tests for the TokenValidator.
+    """
+
+    def setup_method(self) -> None:
+        self.validator = TokenValidator(SECRET_KEY, ISSUER, AUDIENCE, cache_size=4)
+
+    def test_decode_valid_token(self) -> None:
+        """Test a valid token is decoded.
+        """
+        payload = self.validator.decode_token(encode(sub="abc"))
+
+        assert payload["sub"] == "abc"
+
+    def test_decode_caches_verified_token(self) -> None:
+        """Test a repeated token is served from the cache.
+        """
+        token = encode()
+        self.validator.decode_token(token)
+        self.validator.decode_token(token)
+
+        stats = self.validator.cache_stats
+        assert stats.misses == 1
+        assert stats.hits == 1
+
+    def test_cached_payload_cannot_be_mutated(self) -> None:
+        """Test callers receive a copy of the cached payload.
+        """
+        token = encode(sub="abc")
+        self.validator.decode_token(token)["sub"] = "changed"
+
+        assert self.validator.decode_token(token)["sub"] == "abc"
+
+    @pytest.mark.parametrize("claims", [
+        {"exp": int(time.time()) - 1},
+        {"iss": "another-issuer"},
+        {"aud": "http://another-audience"},
+    ])
+    def test_decode_rejects_invalid_claims(self, claims):
+        """Test expired tokens and unexpected issuers or audiences are rejected.
+        """
+        with pytest.raises(jwt.InvalidTokenError):
+            self.validator.decode_token(encode(**claims))
+
+    def test_decode_rejects_invalid_signature(self) -> None:
+        """Test a token signed with another key is rejected.
+        """
+        token = jwt.encode(
+            {"sub": "user", "exp": int(time.time()) + 60}, 
+            "another-secret-key-with-32-chars!!", 
+            algorithm=TokenProvider.ALGORITHM
+        )
+        with pytest.raises(jwt.InvalidSignatureError):
+            self.validator.decode_token(token)
+        assert self.validator.cache_stats.size == 0
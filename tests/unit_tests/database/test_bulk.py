@@ -0,0 +1,100 @@
+from typing import Any
+from unittest.mock import MagicMock
+
+from psycopg.types.json import Jsonb
+from sqlalchemy import Column, Integer, MetaData, String, Table
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.database.bulk import insert_rows
+
+
+class TestInsertRows:
+    """Tests for bulk row insertion.
+    """
+
+    def setup_method(self) -> None:
+        self.table = Table(
+            "item",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("name", String, unique=True),
+            Column("content", JSONB)
+        )
+        self.connection = MagicMock()
+        self.connection.dialect = postgresql.psycopg.dialect()  # type: ignore[no-untyped-call]
+        self.copy = self.connection.connection.driver_connection.cursor.return_value \
+            .__enter__.return_value.copy.return_value.__enter__.return_value
+
+    def rows(self, count: int) -> list[dict[str, Any]]:
+        return [{"id": i, "name": f"item {i}", "content": {"i": i}} for i in range(count)]
+
+    def executed_sql(self) -> list[str]:
+        return [
+            str(call.args[0].compile(dialect=self.connection.dialect))
+            for call in self.connection.execute.call_args_list
+        ]
+
+    def test_inserts_in_batches(self) -> None:
+        """Test rows are sent as multi-row INSERT statements.
+        """
+        insert_rows(self.connection, self.table, self.rows(5), batch_size=2)
+
+        statements = self.executed_sql()
+        assert len(statements) == 3
+        assert statements[0].count("%(") == 6
+        assert statements[2].count("%(") == 3
+        self.copy.write_row.assert_not_called()
+
+    def test_updates_on_conflict(self) -> None:
+        """Test conflicting rows are updated from the inserted values.
+        """
+        insert_rows(
+            self.connection,
+            self.table,
+            self.rows(1),
+            conflict_columns=["name"],
+            update_columns=["content"],
+            update_values={"id": 0}
+        )
+
+        [statement] = self.executed_sql()
+        assert "ON CONFLICT (name) DO UPDATE SET" in statement
+        assert "content = excluded.content" in statement
+        assert "id = %(param_1)s" in statement
+
+    def test_skips_conflicts_without_update_columns(self) -> None:
+        """Test conflicting rows are left unchanged when nothing is updated.
+        """
+        insert_rows(self.connection, self.table, self.rows(1), conflict_columns=["name"])
+
+        [statement] = self.executed_sql()
+        assert "ON CONFLICT (name) DO NOTHING" in statement
+
+    def test_copies_from_threshold(self) -> None:
+        """Test large loads are streamed with COPY, with values bind processed.
+        """
+        insert_rows(self.connection, self.table, self.rows(3), copy_threshold=3)
+
+        self.connection.execute.assert_not_called()
+        assert self.copy.write_row.call_count == 3
+        row = self.copy.write_row.call_args.args[0]
+        assert row[:2] == [2, "item 2"]
+        assert isinstance(row[2], Jsonb)
+
+    def test_copies_into_staging_table_on_conflict(self) -> None:
+        """Test conflicts are resolved by inserting from a copied staging table.
+        """
+        insert_rows(
+            self.connection,
+            self.table,
+            self.rows(3),
+            conflict_columns=["name"],
+            update_columns=["content"],
+            copy_threshold=3
+        )
+
+        assert self.copy.write_row.call_count == 3
+        [statement] = self.executed_sql()
+        assert statement.startswith("INSERT INTO item (id, name, content) SELECT")
+        assert "ON CONFLICT (name) DO UPDATE" in statement
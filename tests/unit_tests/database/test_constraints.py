@@ -0,0 +1,78 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import col
+
+from app.database import UnitOfWork
+from app.database.constraints import violated_unique_constraint, violates_unique
+from app.managers.role_manager import RoleManager
+from app.models.auth import Role, User
+from app.models.food import FoodItem
+from app.schemas.common import Error, ErrorType
+from app.utils.cache import LRUCache
+
+
+def integrity_error(constraint_name: str, sqlstate: str = "23505") -> IntegrityError:
+    orig = SimpleNamespace(
+        sqlstate=sqlstate,
+        diag=SimpleNamespace(constraint_name=constraint_name)
+    )
+    return IntegrityError("INSERT ...", {}, orig) # type: ignore[arg-type]
+
+
+class TestUniqueViolations:
+    """Tests for identifying the unique constraint an error violated.
+    """
+
+    def test_names_violated_constraint(self) -> None:
+        """Test the constraint name is read from the driver diagnostics.
+        """
+        assert violated_unique_constraint(integrity_error("ix_food_item_name")) \
+            == "ix_food_item_name"
+        assert violated_unique_constraint(
+            integrity_error("fk_food_item", sqlstate="23503")
+        ) is None
+
+    def test_matches_indexes_over_column(self) -> None:
+        """Test plain and expression unique indexes match their column only.
+        """
+        for name in ("ix_auth_user_email_address", "ix_auth_user_email_address_lower"):
+            error = integrity_error(name)
+            assert violates_unique(error, col(User.email_address))
+            assert not violates_unique(error, col(User.username))
+
+        assert violates_unique(integrity_error("ix_food_item_name_lower"), col(FoodItem.name))
+        assert not violates_unique(integrity_error("unknown"), col(FoodItem.name))
+
+
+class TestRoleManagerConflicts:
+    """Tests for creating a role whose name is taken.
+    """
+
+    def setup_method(self) -> None:
+        self.role_repository = MagicMock()
+        self.unit_of_work = MagicMock(spec=UnitOfWork)
+        self.role_manager = RoleManager(
+            self.role_repository, self.unit_of_work, LRUCache(max_size=10)
+        )
+
+    def test_creates_role_without_checking_first(self) -> None:
+        """Test a new role is added and committed with no prior query.
+        """
+        role = Role(name="Editor")
+
+        assert self.role_manager.create(role) is role
+        self.role_repository.exists.assert_not_called()
+        self.unit_of_work.commit.assert_called_once()
+
+    def test_translates_unique_violation(self) -> None:
+        """Test a name taken by another role is reported as a conflict.
+        """
+        self.role_repository.add.side_effect = integrity_error("ix_auth_role_name_lower")
+
+        result = self.role_manager.create(Role(name="editor"))
+
+        assert isinstance(result, Error)
+        assert result.error_type == ErrorType.CONFLICT
+        self.unit_of_work.commit.assert_not_called()
@@ -0,0 +1,59 @@
+from typing import Any
+
+import anyio
+import anyio.to_thread
+from sqlalchemy import create_engine, text
+
+from app.database.instrumentation import QueryMonitor, QueryRecorder, record_queries
+
+
+class TestQueryMonitor:
+    """Tests for the per-request QueryMonitor.
+    """
+
+    def setup_method(self) -> None:
+        self.engine = create_engine("sqlite://")
+        QueryMonitor().attach(self.engine)
+
+    def teardown_method(self) -> None:
+        self.engine.dispose()
+
+    def execute(self, *statements: str, **parameters: Any) -> None:
+        with self.engine.connect() as connection:
+            for statement in statements:
+                connection.execute(text(statement), parameters)
+
+    def test_counts_statements_of_the_block(self) -> None:
+        """Test only the statements executed within the block are recorded.
+        """
+        self.execute("SELECT 1")
+        with record_queries(repeated_statement_threshold=5) as recorder:
+            self.execute("SELECT 1", "SELECT 2")
+        self.execute("SELECT 3")
+
+        stats = recorder.stats
+        assert stats.statements == 2
+        assert stats.duration_seconds > 0
+        assert stats.repeated_statements == {}
+
+    def test_reports_repeated_statements(self) -> None:
+        """Test a statement executed as often as the threshold is reported.
+        """
+        with record_queries(repeated_statement_threshold=3) as recorder:
+            for id in range(3):
+                self.execute("SELECT :id", id=id)
+            self.execute("SELECT 1", "SELECT 1")
+
+        assert recorder.stats.repeated_statements == {"SELECT ?": 3}
+
+    def test_records_statements_of_worker_threads(self) -> None:
+        """Test statements of work handed off to a worker thread are recorded.
+        """
+        async def handle_request() -> QueryRecorder:
+            with record_queries(repeated_statement_threshold=5) as recorder:
+                await anyio.to_thread.run_sync(self.execute, "SELECT 1")
+            return recorder
+
+        recorder = anyio.run(handle_request)
+
+        assert recorder.stats.statements == 1
@@ -0,0 +1,59 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import QueuePool
+
+from app.database.pool import PoolMonitor
+
+
+class TestPoolMonitor:
+    """Tests for the PoolMonitor.
+    """
+
+    def setup_method(self):
+        self.monitor = PoolMonitor("test")
+        self.engine = create_engine(
+            "sqlite://", 
+            poolclass=self.monitor.instrument(QueuePool),
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.01
+        )
+
+    def teardown_method(self):
+        self.engine.dispose()
+
+    def test_reports_checked_out_connections(self):
+        """Test checkouts are counted and reflected while in use.
+        """
+        with self.engine.connect():
+            stats = self.monitor.stats
+            assert stats.checked_out == 1
+            assert stats.utilization == 1.0
+
+        stats = self.monitor.stats
+        assert stats.name == "test"
+        assert stats.checkouts == 1
+        assert stats.checked_out == 0
+        assert stats.idle == 1
+        assert stats.checkout_errors == 0
+
+    def test_counts_checkout_timeouts(self):
+        """Test a checkout that times out on an exhausted pool is an error.
+        """
+        with self.engine.connect():
+            with pytest.raises(TimeoutError):
+                self.engine.connect()
+
+        stats = self.monitor.stats
+        assert stats.checkout_errors == 1
+        assert stats.max_wait_seconds >= 0.0
+
+    def test_survives_dispose(self):
+        """Test the recreated pool still reports to the monitor.
+        """
+        self.engine.dispose()
+        with self.engine.connect():
+            pass
+
+        assert self.monitor.stats.checkouts == 1
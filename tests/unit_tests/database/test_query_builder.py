@@ -0,0 +1,272 @@
+import base64
+import json
+from datetime import UTC, datetime
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, event, func, inspect
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session, col, select
+from sqlmodel.sql.expression import SelectOfScalar
+
+from app.database import LoadStrategy, QueryBuilder
+from app.database.statement_cache import CompiledCacheMonitor
+from app.models.auth import Role, UserRole
+from app.models.food import FoodCategory, FoodItem
+from app.queries.food_queries import FoodCategoriesQuery, FoodItemsFilterQuery
+from app.schemas.food import FoodItemsFilter
+
+
+class TestQueryBuilderStatementCache:
+    """Tests for the QueryBuilder statement cache.
+    """
+
+    def setup_method(self) -> None:
+        QueryBuilder._statement_cache.clear()
+
+    def test_reuses_statement_of_same_shape(self) -> None:
+        """Test queries differing only in values share one statement.
+        """
+        rice = FoodItemsFilterQuery(FoodItemsFilter(search="rice", index=2))
+        beans = FoodItemsFilterQuery(FoodItemsFilter(search="beans", index=3))
+
+        assert rice.build() is beans.build()
+        assert rice.parameters == {"search_0": "rice", "skip": 10, "take": 10}
+        assert beans.parameters == {"search_0": "beans", "skip": 20, "take": 10}
+
+    def test_separates_different_shapes(self) -> None:
+        """Test the filters, base statement and criteria-only flag are keyed.
+        """
+        search = FoodItemsFilterQuery(FoodItemsFilter(search="rice"))
+        name = FoodItemsFilterQuery(FoodItemsFilter(name="rice"))
+        count = select(func.count()).select_from(search.model)
+
+        assert search.build() is not name.build()
+        assert search.build() is not search(count, criteriaOnly=True)
+
+    def test_configured_size_bounds_cache(self) -> None:
+        """Test a configured cache replaces the current one and keeps at
+        most its size of statements.
+        """
+        cache = QueryBuilder._statement_cache
+        try:
+            QueryBuilder.configure_cache(1)
+            FoodItemsFilterQuery(FoodItemsFilter(search="rice")).build()
+            FoodItemsFilterQuery(FoodItemsFilter(name="rice")).build()
+
+            stats = QueryBuilder.cache_stats()
+            assert (stats.size, stats.max_size, stats.evictions) == (1, 1, 1)
+        finally:
+            QueryBuilder._statement_cache = cache
+
+    def test_expression_filters_are_not_cached(self) -> None:
+        """Test a query with a prebuilt expression is built every time.
+        """
+        def build() -> SelectOfScalar[FoodCategory]:
+            query = FoodCategoriesQuery(None)
+            return query._where(col(FoodCategory.name) == "Soup").build()
+
+        assert build() is not build()
+        assert QueryBuilder.cache_stats().size == 0
+
+    def test_criteria_closing_over_state_are_not_cached(self) -> None:
+        """Test a criteria function closing over a value is built every time.
+        """
+        def build(name: str) -> SelectOfScalar[FoodCategory]:
+            query = FoodCategoriesQuery(None)
+            return query._where(lambda: col(FoodCategory.name) == name).build()
+
+        assert build("Soup") is not build("Snack")
+
+    def test_executes_cached_statement_with_parameters(self) -> None:
+        """Test a cached statement returns rows for each query's values.
+        """
+        engine = create_engine("sqlite://")
+        FoodCategory.__table__.create(engine)  # type: ignore[attr-defined]
+        monitor = CompiledCacheMonitor("test")
+        monitor.attach(engine)
+        hits = QueryBuilder.cache_stats().hits
+
+        with Session(engine) as session:
+            session.add_all([FoodCategory(name="Rice"), FoodCategory(name="Soup")])
+            session.commit()
+
+            names = []
+            for term in ("Ri", "So"):
+                query = FoodCategoriesQuery(term)
+                categories = session.exec(query.build(), params=query.parameters)
+                names.append([category.name for category in categories])
+
+        assert names == [["Rice"], ["Soup"]]
+        assert QueryBuilder.cache_stats().hits == hits + 1
+        assert monitor.stats.hits >= 1
+        engine.dispose()
+
+
+class CategoriesPage(QueryBuilder[FoodCategory]):
+    def __init__(self, cursor: str | None, descending: bool = False) -> None:
+        super().__init__(FoodCategory)
+        if descending:
+            self._order_by_desc(self.model.description) # type: ignore
+        else:
+            self._order_by(self.model.description) # type: ignore
+        self._paginate_after(cursor, take=2)
+
+
+class TestQueryBuilderKeysetPagination:
+    """Tests for the QueryBuilder keyset pagination.
+    """
+
+    def setup_method(self) -> None:
+        QueryBuilder._statement_cache.clear()
+        self.engine = create_engine("sqlite://")
+        FoodCategory.__table__.create(self.engine)  # type: ignore[attr-defined]
+        with Session(self.engine) as session:
+            session.add_all([
+                FoodCategory(name=name, description="Same") for name in "ABCDE"
+            ])
+            session.commit()
+
+    def teardown_method(self) -> None:
+        self.engine.dispose()
+
+    def pages(self, descending: bool = False) -> list[list[FoodCategory]]:
+        pages: list[list[FoodCategory]] = []
+        cursor: str | None = None
+        with Session(self.engine) as session:
+            while True:
+                query = CategoriesPage(cursor, descending)
+                page = list(session.exec(query.build(), params=query.parameters))
+                if not page:
+                    return pages
+                pages.append(page)
+                cursor = query.cursor_after(page[-1])
+
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_pages_through_ties(self, descending: bool) -> None:
+        """Test pages follow each other without overlap when sort values tie.
+        """
+        pages = self.pages(descending)
+
+        ids = [category.id for page in pages for category in page]
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert ids == sorted(ids, reverse=descending)
+
+    def test_rejects_cursor_of_other_ordering(self) -> None:
+        """Test a cursor only continues the ordering it was issued for, with
+        values of its column types.
+        """
+        first = self.pages()[0]
+        cursor = CategoriesPage(None).cursor_after(first[-1])
+
+        with pytest.raises(ValueError):
+            CategoriesPage(cursor, descending=True)
+        with pytest.raises(ValueError):
+            CategoriesPage("not a cursor")
+        for values in (["Same", 5], [{"a": 1}, str(uuid4())], [["x"], str(uuid4())]):
+            with pytest.raises(ValueError):
+                CategoriesPage(self.forge(cursor, values))
+
+    @staticmethod
+    def forge(cursor: str, values: list[Any]) -> str:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        fingerprint, _ = json.loads(payload)
+        return base64.urlsafe_b64encode(
+            json.dumps([fingerprint, values]).encode()
+        ).decode()
+
+    def test_seeks_with_row_comparison(self) -> None:
+        """Test the page position is a row comparison matching the index.
+        """
+        first = FoodItemsFilterQuery(FoodItemsFilter())
+        cursor = first.cursor_after(
+            FoodItem(name="Rice", created_utc=datetime.now(UTC))  # type: ignore[call-arg]
+        )
+
+        query = FoodItemsFilterQuery(FoodItemsFilter(cursor=cursor))
+        sql = str(query.build().compile(dialect=postgresql.dialect()))  # type: ignore[no-untyped-call]
+
+        assert "(coalesce(food_item.last_modified_utc, food_item.created_utc), food_item.id) < (" in sql
+        assert "ORDER BY coalesce(food_item.last_modified_utc, food_item.created_utc) DESC, food_item.id DESC" in sql
+        assert "OFFSET" not in sql
+
+
+
+class RoleMembers(QueryBuilder[Role]):
+    def __init__(self, strategy: LoadStrategy) -> None:
+        super().__init__(Role)
+        self._include(self.model.user_roles, strategy=strategy) # type: ignore
+        self._load_only(self.model.name) # type: ignore
+
+
+class MemberRoles(QueryBuilder[UserRole]):
+    def __init__(self) -> None:
+        super().__init__(UserRole)
+        self._include(self.model.role, strategy=LoadStrategy.JOINED) # type: ignore
+
+
+class TestQueryBuilderLoading:
+    """Tests for the QueryBuilder load strategies and column projection.
+    """
+
+    def setup_method(self) -> None:
+        QueryBuilder._statement_cache.clear()
+        self.engine = create_engine("sqlite://")
+        Role.__table__.create(self.engine)  # type: ignore[attr-defined]
+        UserRole.__table__.create(self.engine)  # type: ignore[attr-defined]
+        with Session(self.engine) as session:
+            role = Role(name="Editor", description="Edits")
+            session.add(UserRole(user_id=uuid4(), role=role))
+            session.commit()
+
+    def teardown_method(self) -> None:
+        self.engine.dispose()
+
+    def test_listing_leaves_out_unserialized_columns(self) -> None:
+        """Test a food item listing does not select the nutrition content.
+        """
+        query = FoodItemsFilterQuery(FoodItemsFilter())
+        sql = str(query.build().compile(dialect=postgresql.dialect()))  # type: ignore[no-untyped-call]
+
+        assert "food_item.name" in sql
+        assert "food_item.last_modified_utc" in sql
+        assert "nutrition_content" not in sql
+
+    @pytest.mark.parametrize("strategy", [LoadStrategy.SELECT_IN, LoadStrategy.SUBQUERY])
+    def test_loads_collection_with_strategy(self, strategy: LoadStrategy) -> None:
+        """Test an included collection is loaded, and only the projected columns.
+        """
+        with Session(self.engine) as session:
+            query = RoleMembers(strategy)
+            [role] = session.exec(query.build(), params=query.parameters).all()
+            state = inspect(role)
+
+            assert "user_roles" not in state.unloaded
+            assert "description" in state.unloaded
+            assert len(role.user_roles) == 1
+        assert RoleMembers(strategy).build() is query.build()
+        assert RoleMembers(LoadStrategy.SELECT_IN).build() \
+            is not RoleMembers(LoadStrategy.SUBQUERY).build()
+
+    def test_joins_many_to_one(self) -> None:
+        """Test a many-to-one relationship is loaded within the statement.
+        """
+        statements: list[str] = []
+
+        def record(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+            statements.append(statement)
+
+        event.listen(self.engine, "before_cursor_execute", record)
+        with Session(self.engine) as session:
+            [member] = session.exec(MemberRoles().build()).all()
+
+            assert member.role.name == "Editor"
+        assert len(statements) == 1
+        assert "JOIN auth_role" in statements[0]
+
+    def test_rejects_joined_collection(self) -> None:
+        """Test a collection cannot be joined into a paginated statement.
+        """
+        with pytest.raises(ValueError):
+            RoleMembers(LoadStrategy.JOINED)
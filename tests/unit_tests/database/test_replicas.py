@@ -0,0 +1,149 @@
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.pool import QueuePool
+
+from app.core.settings import ReplicaBalancing
+from app.database.replicas import ReplicaSet
+
+_T = TypeVar("_T")
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class InlineExecutor(Executor):
+    """Runs each probe as it is submitted."""
+
+    def submit(
+        self, fn: Callable[..., _T], /, *args: Any, **kwargs: Any
+    ) -> Future[_T]:
+        future: Future[_T] = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+class TestReplicaSet:
+    """Tests for the ReplicaSet.
+    """
+
+    def setup_method(self) -> None:
+        self.engines = [
+            create_engine("sqlite://", poolclass=QueuePool) for _ in range(2)
+        ]
+        self.lags: dict[Engine, float | None] = {
+            engine: 0.0 for engine in self.engines
+        }
+        self.probes = 0
+        self.clock = FakeClock()
+
+    def teardown_method(self) -> None:
+        for engine in self.engines:
+            engine.dispose()
+
+    def probe(self, engine: Engine) -> float | None:
+        self.probes += 1
+        return self.lags[engine]
+
+    def replica_set(
+        self,
+        balancing: ReplicaBalancing = ReplicaBalancing.ROUND_ROBIN,
+        prober: Executor | None = None
+    ) -> ReplicaSet:
+        return ReplicaSet(
+            self.engines,
+            balancing=balancing,
+            max_lag=1.0,
+            lag_check_interval=5.0,
+            lag_probe=self.probe,
+            clock=self.clock,
+            prober=prober or InlineExecutor()
+        )
+
+    def test_round_robin(self) -> None:
+        """Test reads alternate between replicas.
+        """
+        replicas = self.replica_set()
+
+        selected = [replicas.select() for _ in range(4)]
+
+        assert selected == self.engines * 2
+        assert self.probes == 2
+
+    def test_least_connections(self) -> None:
+        """Test the replica with the fewest connections in use is selected.
+        """
+        replicas = self.replica_set(ReplicaBalancing.LEAST_CONNECTIONS)
+
+        with self.engines[0].connect():
+            assert replicas.select() is self.engines[1]
+        with self.engines[1].connect():
+            assert replicas.select() is self.engines[0]
+
+    def test_skips_lagging_replica(self) -> None:
+        """Test a lagging replica is skipped until its lag is measured again.
+        """
+        self.lags[self.engines[0]] = 2.0
+        replicas = self.replica_set()
+
+        assert {replicas.select() for _ in range(3)} == {self.engines[1]}
+
+        self.lags[self.engines[0]] = 0.0
+        assert {replicas.select() for _ in range(3)} == {self.engines[1]}
+
+        self.clock.now = 5.0
+        assert self.engines[0] in {replicas.select() for _ in range(3)}
+
+    def test_no_usable_replica(self) -> None:
+        """Test None is returned when every replica lags or is unreachable.
+        """
+        self.lags = {self.engines[0]: 2.0, self.engines[1]: None}
+
+        assert self.replica_set().select() is None
+
+    def test_select_does_not_wait_for_probe(self) -> None:
+        """Test a replica whose lag is still being measured is skipped
+        rather than waited for, and used once the probe reports.
+        """
+        release = threading.Event()
+        prober = ThreadPoolExecutor(max_workers=1)
+
+        def probe(engine: Engine) -> float | None:
+            release.wait(timeout=5)
+            return 0.0
+
+        replicas = ReplicaSet(self.engines[:1], lag_probe=probe, prober=prober)
+        assert replicas.select() is None
+
+        release.set()
+        prober.shutdown(wait=True)
+        assert replicas.select() is self.engines[0]
+
+    def test_select_after_shutdown(self) -> None:
+        """Test reads fall back to the primary once shut down, even when a 
+        lag probe is due, rather than failing to schedule it.
+        """
+        replicas = self.replica_set(prober=ThreadPoolExecutor(max_workers=1))
+        replicas.shutdown()
+        self.clock.now += 10
+
+        assert replicas.select() is None
+
+    def test_select_with_prober_shut_down(self) -> None:
+        """Test a probe due after the prober stopped, as when it is shut down
+        while a read is selecting, skips the replica rather than raising.
+        """
+        prober = ThreadPoolExecutor(max_workers=1)
+        replicas = self.replica_set(prober=prober)
+        prober.shutdown(wait=True)
+        self.clock.now += 10
+
+        assert replicas.select() is None
@@ -0,0 +1,78 @@
+from contextlib import contextmanager
+from typing import Any
+
+from sqlalchemy import create_engine, text
+from sqlmodel import Session
+
+from app.database.slow_queries import SlowQueryLog
+from app.models.food import FoodCategory
+from app.repositories import FoodCategoryRepository
+
+
+class TestSlowQueryLog:
+    """Tests for the SlowQueryLog.
+    """
+
+    def setup_method(self) -> None:
+        self.engine = create_engine("sqlite://")
+        FoodCategory.__table__.create(self.engine)  # type: ignore[attr-defined]
+
+    def teardown_method(self) -> None:
+        self.engine.dispose()
+
+    def slow_query_log(
+        self, threshold_seconds: float = 0.0, max_entries: int = 10
+    ) -> SlowQueryLog:
+        log = SlowQueryLog(threshold_seconds, max_entries)
+        log.attach(self.engine)
+        return log
+
+    def execute(self, statement: str, **parameters: Any) -> None:
+        with self.engine.connect() as connection:
+            connection.execute(text(statement), parameters)
+
+    def test_records_statements_over_threshold(self) -> None:
+        """Test only statements slower than the threshold are recorded.
+        """
+        log = self.slow_query_log(threshold_seconds=60.0)
+
+        self.execute("SELECT 1")
+
+        assert log.entries == []
+
+    def test_records_parameter_types_not_values(self) -> None:
+        """Test bound parameters are recorded by type.
+        """
+        log = self.slow_query_log()
+
+        self.execute("SELECT :name, :calories", name="Rice", calories=130.0)
+
+        [entry] = log.entries
+        assert entry.statement == "SELECT ?, ?"
+        assert entry.parameter_types == {"0": "str", "1": "float"}
+        assert entry.caller is None
+        assert entry.plan is None
+
+    def test_keeps_most_recent_entries(self) -> None:
+        """Test the oldest entries are dropped beyond the maximum.
+        """
+        log = self.slow_query_log(max_entries=2)
+
+        for i in range(3):
+            self.execute(f"SELECT {i}")
+
+        assert [entry.statement for entry in log.entries] == ["SELECT 2", "SELECT 1"]
+
+    def test_records_calling_repository_method(self) -> None:
+        """Test the repository method executing a statement is recorded.
+        """
+        @contextmanager
+        def session_factory():
+            with Session(self.engine) as session:
+                yield session
+
+        log = self.slow_query_log()
+
+        FoodCategoryRepository(session_factory).get_list()
+
+        assert log.entries[0].caller == "FoodCategoryRepository.get_list"
@@ -0,0 +1,85 @@
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, func
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+from sqlmodel import Session, select
+
+from app.database import QueryBuilder
+from app.database import interceptors
+from app.database.interceptors import soft_delete_entity
+from app.models import SoftDeleteEntity
+
+
+class Note(SoftDeleteEntity, table=True):
+    __tablename__ = "test_soft_delete_note" # pyright: ignore[reportAssignmentType]
+
+    text: str
+
+
+class NotesQuery(QueryBuilder[Note]):
+    def __init__(self, with_deleted: bool = False) -> None:
+        super().__init__(Note)
+        self._with_deleted(with_deleted)
+
+
+class TestSoftDelete:
+    """Tests for the exclusion of soft-deleted entities.
+    """
+
+    def setup_method(self):
+        self.engine = create_engine("sqlite://")
+        Note.__table__.create(self.engine)  # type: ignore[attr-defined]
+        with Session(self.engine) as session:
+            session.add_all([Note(text="Kept"), Note(text="Deleted")])
+            session.commit()
+            deleted = session.exec(select(Note).where(Note.text == "Deleted")).one()
+            soft_delete_entity(session, deleted)
+            session.commit()
+
+    def teardown_method(self):
+        self.engine.dispose()
+
+    def test_excludes_deleted_entities(self):
+        """Test queries only see entities that are not deleted.
+        """
+        with Session(self.engine) as session:
+            notes = session.exec(select(Note)).all()
+            count = session.exec(select(func.count()).select_from(Note)).one()
+
+        assert [note.text for note in notes] == ["Kept"]
+        assert count == 1
+
+    def test_builds_criteria_once(self):
+        """Test the soft-deletable models are not looked up on every query.
+        """
+        with patch.object(
+            interceptors, "_soft_delete_models", wraps=interceptors._soft_delete_models
+        ) as lookup, Session(self.engine) as session:
+            session.exec(select(Note)).all()
+            session.exec(select(Note)).all()
+
+        lookup.assert_not_called()
+
+    def test_query_builder_includes_deleted_entities(self):
+        """Test a query asking for deleted entities sees them.
+        """
+        with Session(self.engine) as session:
+            live = session.exec(NotesQuery().build()).all()
+            everything = session.exec(NotesQuery(with_deleted=True).build()).all()
+
+        assert len(live) == 1
+        assert len(everything) == 2
+
+    def test_indexes_rows_not_deleted(self):
+        """Test soft-deletable tables get a partial index of the live rows.
+        """
+        [index] = Note.__table__.indexes  # type: ignore[attr-defined]
+
+        create_index = CreateIndex(index)
+        sql = str(create_index.compile(dialect=postgresql.dialect()))  # type: ignore[no-untyped-call]
+
+        assert sql == (
+            "CREATE INDEX ix_test_soft_delete_note_not_deleted "
+            "ON test_soft_delete_note (id) WHERE is_deleted = false"
+        )
@@ -0,0 +1,89 @@
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from sqlmodel import Session
+
+from app.database import UnitOfWork
+
+
+class TestUnitOfWork:
+    """Tests for the UnitOfWork.
+    """
+
+    def setup_method(self) -> None:
+        self.sessions: list[MagicMock] = []
+        self.session_factory = MagicMock(side_effect=self.open_session)
+        self.unit_of_work = UnitOfWork(self.session_factory)
+
+    def open_session(self, **kwargs: Any) -> MagicMock:
+        session = MagicMock(spec=Session)
+        self.sessions.append(session)
+        return session
+
+    def test_opens_session_lazily(self) -> None:
+        """Test no session is opened until a repository asks for one.
+        """
+        self.unit_of_work.commit()
+
+        assert not self.unit_of_work.is_active
+        self.session_factory.assert_not_called()
+
+    def test_shares_one_session(self) -> None:
+        """Test every repository call is given the same session.
+        """
+        with self.unit_of_work.session() as first:
+            with self.unit_of_work.session() as second:
+                assert first is second
+
+        self.unit_of_work.commit()
+
+        self.session_factory.assert_called_once()
+        self.sessions[0].commit.assert_called_once()
+        self.sessions[0].close.assert_not_called()
+
+    def test_rolls_back_failed_block(self) -> None:
+        """Test a failed block rolls back and keeps the session open.
+        """
+        with pytest.raises(ValueError):
+            with self.unit_of_work.session():
+                raise ValueError()
+
+        self.sessions[0].rollback.assert_called_once()
+        assert self.unit_of_work.is_active
+
+    def test_close_discards_session(self) -> None:
+        """Test closing releases the session and a new one is opened on reuse.
+        """
+        with self.unit_of_work.session() as first:
+            pass
+        self.unit_of_work.close()
+
+        self.sessions[0].close.assert_called_once()
+        assert not self.unit_of_work.is_active
+
+        with self.unit_of_work.session() as second:
+            assert second is not first
+
+    def test_read_only_opens_replica_session(self) -> None:
+        """Test a read-only block uses a replica session closed on exit.
+        """
+        with self.unit_of_work.read_only():
+            with self.unit_of_work.session():
+                pass
+
+        self.session_factory.assert_called_once_with(read_only=True)
+        self.sessions[0].close.assert_called_once()
+        assert not self.unit_of_work.is_active
+
+    def test_read_only_keeps_open_session(self) -> None:
+        """Test reads after a write stay on the session already open.
+        """
+        with self.unit_of_work.session() as primary:
+            pass
+        with self.unit_of_work.read_only():
+            with self.unit_of_work.session() as session:
+                assert session is primary
+
+        self.session_factory.assert_called_once_with()
+        self.sessions[0].close.assert_not_called()
@@ -0,0 +1,127 @@
+from collections.abc import Callable
+from typing import TypeVar
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import anyio
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session
+
+from app.core.security import PasswordHasher
+from app.database import UnitOfWork
+from app.managers import RoleManager, UserManager
+from app.models.auth import Role, User, UserPasswordHistory, UserRole
+from app.repositories import RoleRepository, UserRepository
+from app.schemas.auth import Principal
+from app.services import PrincipalService
+from app.utils.cache import LRUCache
+
+T = TypeVar("T")
+
+
+class TestRoleManagerRevocation:
+    """Tests for revoking the tokens of a role's members when the role is 
+    renamed or deleted.
+    """
+
+    def setup_method(self) -> None:
+        # Principals are loaded on a worker thread, which must see the same 
+        # in-memory database.
+        self.engine = create_engine(
+            "sqlite://", 
+            connect_args={"check_same_thread": False}, 
+            poolclass=StaticPool
+        )
+        for model in (User, UserPasswordHistory, Role, UserRole):
+            model.__table__.create(self.engine)  # type: ignore[attr-defined, union-attr, unused-ignore]
+        self.principal_cache: LRUCache[UUID, Principal] = LRUCache(max_size=10)
+
+        member = User(username="ada", email_address="ada@example.com", password_hash="hash")
+        other = User(username="bob", email_address="bob@example.com", password_hash="hash")
+        role = Role(name="Curator")
+        with Session(self.engine, expire_on_commit=False) as session:
+            session.add_all([member, other, role])
+            session.add(UserRole(user=member, role=role))
+            session.commit()
+        self.member_id, self.other_id, self.role_id = member.id, other.id, role.id
+        self.stamps = {
+            self.member_id: member.security_stamp, 
+            self.other_id: other.security_stamp
+        }
+
+        self.principal_service = PrincipalService(
+            lambda: UserManager(
+                UserRepository(self.session_scope),
+                UnitOfWork(lambda **kwargs: Session(self.engine)),
+                self.principal_cache,
+                MagicMock(spec=PasswordHasher)
+            ),
+            self.principal_cache,
+            thread_limit=1
+        )
+        # Cache the principals, as earlier requests with the tokens would have.
+        for user_id in self.stamps:
+            assert self.resolve(user_id) is not None
+
+    def teardown_method(self) -> None:
+        self.engine.dispose()
+
+    def session_scope(self) -> Session:
+        return Session(self.engine)
+
+    def in_scope(self, action: Callable[[RoleManager, Role], T]) -> T:
+        """Run the action on the role within a request scope.
+        """
+        unit_of_work = UnitOfWork(lambda **kwargs: Session(self.engine))
+        manager = RoleManager(
+            RoleRepository(unit_of_work.session), unit_of_work, self.principal_cache
+        )
+        try:
+            role = manager.get_by_id(self.role_id)
+            assert role is not None
+            return action(manager, role)
+        finally:
+            unit_of_work.close()
+
+    def resolve(self, user_id: UUID) -> Principal | None:
+        """Resolve the principal of a token issued before the change.
+        """
+        async def main() -> Principal | None:
+            return await self.principal_service.resolve(user_id, self.stamps[user_id])
+        return anyio.run(main)
+
+    def test_rename_revokes_member_tokens(self) -> None:
+        """Test a token issued to a member before the role was renamed is 
+        rejected, while other users' tokens are not.
+        """
+        def rename(manager: RoleManager, role: Role) -> None:
+            role.name = "Archivist"
+            manager.update(role)
+
+        self.in_scope(rename)
+
+        assert self.principal_cache.get(self.member_id) is None
+        assert self.resolve(self.member_id) is None
+        assert self.resolve(self.other_id) is not None
+
+    def test_delete_revokes_member_tokens(self) -> None:
+        """Test a token issued to a member before the role was deleted is 
+        rejected.
+        """
+        self.in_scope(lambda manager, role: manager.delete(role))
+
+        assert self.resolve(self.member_id) is None
+        assert self.resolve(self.other_id) is not None
+
+    def test_description_change_keeps_member_tokens(self) -> None:
+        """Test an update that leaves the role's name alone revokes nothing.
+        """
+        def describe(manager: RoleManager, role: Role) -> None:
+            role.description = "Curates the food catalog"
+            manager.update(role)
+
+        self.in_scope(describe)
+
+        assert self.principal_cache.get(self.member_id) is not None
+        assert self.resolve(self.member_id) is not None
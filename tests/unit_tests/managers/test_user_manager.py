@@ -0,0 +1,233 @@
+from collections.abc import Callable
+from typing import Any, TypeVar
+from unittest.mock import MagicMock
+from uuid import UUID
+
+from sqlalchemy import create_engine, event
+from sqlmodel import Session
+
+from app.core.security import PasswordHasher
+from app.database import UnitOfWork
+from app.managers import UserManager
+from app.models.auth import Role, User, UserPasswordHistory, UserRole
+from app.repositories import UserRepository
+from app.schemas.auth import Principal
+from app.utils.cache import LRUCache
+
+T = TypeVar("T")
+
+
+class TestUserManagerPersistence:
+    """Tests for the user manager committing its changes.
+    """
+
+    def setup_method(self) -> None:
+        self.engine = create_engine("sqlite://")
+        User.__table__.create(self.engine)  # type: ignore[attr-defined]
+        UserPasswordHistory.__table__.create(self.engine)  # type: ignore[attr-defined]
+        Role.__table__.create(self.engine)  # type: ignore[attr-defined]
+        UserRole.__table__.create(self.engine)  # type: ignore[attr-defined]
+        self.password_hasher = MagicMock(spec=PasswordHasher)
+        self.password_hasher.hash_password.side_effect = lambda password: f"hash:{password}"
+        self.password_hasher.verify_password.return_value = True
+        self.principal_cache: LRUCache[UUID, Principal] = LRUCache(max_size=10)
+
+        with Session(self.engine) as session:
+            session.add(Role(name="Viewer"))
+            session.commit()
+
+        def create(manager: UserManager) -> UUID:
+            user = User(username="ada", email_address="ada@example.com")
+            assert manager.create(user, "first") is user
+            return user.id
+
+        self.user_id = self.in_scope(create)
+
+    def teardown_method(self) -> None:
+        self.engine.dispose()
+
+    def in_scope(self, action: Callable[[UserManager], T]) -> T:
+        """Run the action within a request scope, closed once it returns.
+        """
+        unit_of_work = UnitOfWork(lambda **kwargs: Session(self.engine))
+        self.unit_of_work = unit_of_work
+        manager = UserManager(
+            UserRepository(unit_of_work.session),
+            unit_of_work,
+            self.principal_cache,
+            self.password_hasher
+        )
+        try:
+            return action(manager)
+        finally:
+            unit_of_work.close()
+
+    def stored_user(self) -> User:
+        with Session(self.engine) as session:
+            user = session.get(User, self.user_id)
+            assert user is not None
+            return user
+
+    def test_persists_created_user(self) -> None:
+        """Test a created user is still stored once the scope closes.
+        """
+        assert self.stored_user().password_hash == "hash:first"
+
+    def test_persists_password_change(self) -> None:
+        """Test a changed password is still stored once the scope closes.
+        """
+        stamp = self.stored_user().security_stamp
+
+        def change_password(manager: UserManager) -> None:
+            user = manager.get_by_id(self.user_id)
+            assert user is not None
+            assert manager.change_password(user, "first", "second") is None
+
+        self.in_scope(change_password)
+
+        user = self.stored_user()
+        assert user.password_hash == "hash:second"
+        assert user.security_stamp != stamp
+
+    def test_persists_update_and_roles(self) -> None:
+        """Test an update and a role assignment are still stored once the
+        scope closes.
+        """
+        def activate(manager: UserManager) -> None:
+            user = manager.get_by_id(self.user_id)
+            assert user is not None
+            user.is_active = True
+            manager.update(user)
+            manager.add_to_role(user, "Viewer")
+
+        def roles(manager: UserManager) -> list[str]:
+            user = manager.get_by_id(self.user_id)
+            assert user is not None
+            return list(manager.get_roles(user))
+
+        self.in_scope(activate)
+
+        assert self.stored_user().is_active
+        assert self.in_scope(roles) == ["Viewer"]
+
+    def record_updates(self) -> list[str]:
+        """Record the UPDATE statements executed from now on.
+        """
+        updates: list[str] = []
+
+        def record(*args: Any) -> None:
+            if args[2].lstrip().upper().startswith("UPDATE"):
+                updates.append(args[2])
+
+        event.listen(self.engine, "before_cursor_execute", record)
+        return updates
+
+    def sign_in(self, manager: UserManager) -> bool:
+        """Check a password the way a sign-in does, committing the outcome.
+        """
+        user = manager.get_by_id(self.user_id)
+        assert user is not None
+        is_valid = manager.check_password(user, "password")
+        self.unit_of_work.commit()
+        return is_valid
+
+    def test_failed_attempt_issues_one_update(self) -> None:
+        """Test a failed attempt is only written by the atomic increment, not
+        flushed again when the unit of work commits.
+        """
+        self.password_hasher.verify_password.return_value = False
+        updates = self.record_updates()
+
+        assert not self.in_scope(self.sign_in)
+        assert len(updates) == 1
+        assert not self.in_scope(self.sign_in)
+        assert len(updates) == 2
+        assert self.stored_user().access_failed_count == 2
+
+    def test_reset_issues_one_update(self) -> None:
+        """Test a successful sign-in after a failed attempt resets the count 
+        with a single update.
+        """
+        self.password_hasher.verify_password.return_value = False
+        self.in_scope(self.sign_in)
+        self.password_hasher.verify_password.return_value = True
+        updates = self.record_updates()
+
+        assert self.in_scope(self.sign_in)
+
+        assert len(updates) == 1
+        assert self.stored_user().access_failed_count == 0
+
+
+class TestUserManagerPrincipalInvalidation:
+    """Tests for the user manager invalidating cached principals.
+    """
+
+    def setup_method(self) -> None:
+        self.calls = MagicMock()
+        self.user_repository = MagicMock(spec=UserRepository)
+        self.user_repository.is_in_role.return_value = False
+        self.password_hasher = MagicMock(spec=PasswordHasher)
+        self.manager = UserManager(
+            self.user_repository,
+            self.calls.unit_of_work,
+            self.calls.principal_cache,
+            self.password_hasher
+        )
+        self.user = User(username="ada", email_address="ada@example.com")
+
+    def assert_invalidated_after_commit(self) -> None:
+        assert [name for name, _, _ in self.calls.mock_calls] == [
+            "unit_of_work.commit", "principal_cache.invalidate"
+        ]
+
+    def test_invalidates_rotated_stamp_after_commit(self) -> None:
+        """Test a principal is only dropped once its new stamp is committed,
+        so a concurrent lookup cannot cache the old one.
+        """
+        self.manager.add_to_role(self.user, "Viewer")
+
+        self.assert_invalidated_after_commit()
+
+    def test_invalidates_updated_user_after_commit(self) -> None:
+        """Test an updated user's principal is dropped once committed.
+        """
+        self.manager.update(self.user)
+
+        self.assert_invalidated_after_commit()
+
+    def test_invalidates_removed_role_after_commit(self) -> None:
+        """Test a principal is dropped once its removed role is committed.
+        """
+        self.user_repository.is_in_role.return_value = True
+
+        self.manager.remove_from_role(self.user, "Viewer")
+
+        self.assert_invalidated_after_commit()
+
+    def test_invalidates_changed_password_after_commit(self) -> None:
+        """Test a principal is dropped once its changed password is committed.
+        """
+        self.user.password_hash = "hash"
+        self.password_hasher.verify_password.return_value = True
+
+        self.manager.change_password(self.user, "first", "second")
+
+        self.assert_invalidated_after_commit()
+
+    def test_invalidates_deleted_user_after_commit(self) -> None:
+        """Test a deleted user's principal is dropped once committed.
+        """
+        self.manager.delete(self.user)
+
+        self.assert_invalidated_after_commit()
+
+    def test_keeps_principal_without_security_change(self) -> None:
+        """Test adding a user to a role they are in leaves the principal 
+        cached.
+        """
+        self.user_repository.is_in_role.return_value = True
+
+        self.manager.add_to_role(self.user, "Viewer")
+
+        assert self.calls.mock_calls == []
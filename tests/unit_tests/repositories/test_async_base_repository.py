@@ -0,0 +1,208 @@
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, TypeVar
+
+import anyio
+import pytest
+from sqlalchemy import Connection, create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel import Session, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.auth import Role, User, UserRole
+from app.models.food import FoodCategory
+from app.repositories import AsyncFoodCategoryRepository, base
+from app.repositories.base import AsyncBaseRepository
+from tests.unit_tests.repositories.test_base_repository import (
+    CategoriesPage,
+    NamesPage,
+)
+
+_T = TypeVar("_T")
+
+
+class TestAsyncBaseRepository:
+    """Tests for the AsyncBaseRepository.
+    """
+
+    @pytest.fixture(autouse=True)
+    def database(self, tmp_path: Path) -> Iterator[None]:
+        # The sync engine arranges and inspects the rows the repository reads 
+        # and writes through an AsyncSession on aiosqlite. Connections are not 
+        # pooled, since each test step runs on an event loop of its own.
+        url = f"sqlite:///{tmp_path / 'test.db'}"
+        self.engine = create_engine(url)
+        self.async_engine = create_async_engine(
+            url.replace("sqlite", "sqlite+aiosqlite", 1), poolclass=NullPool
+        )
+        FoodCategory.__table__.create(self.engine)  # type: ignore[attr-defined]
+        self.repository = AsyncFoodCategoryRepository(self.session_scope)
+        yield
+        self.run(self.async_engine.dispose)
+        self.engine.dispose()
+
+    @asynccontextmanager
+    async def session_scope(self) -> AsyncIterator[AsyncSession]:
+        session = AsyncSession(self.async_engine, expire_on_commit=False)
+        try:
+            yield session
+            await session.commit()
+        finally:
+            await session.close()
+
+    def run(self, call: Callable[[], Awaitable[_T]]) -> _T:
+        async def main() -> _T:
+            return await call()
+        return anyio.run(main)
+
+    def add_categories(self, *names: str) -> list[FoodCategory]:
+        categories = [FoodCategory(name=name) for name in names]
+        with Session(self.engine, expire_on_commit=False) as session:
+            session.add_all(categories)
+            session.commit()
+        return categories
+
+    def stored_names(self) -> list[str]:
+        with Session(self.engine) as session:
+            statement = select(FoodCategory.name).order_by(FoodCategory.name)
+            return list(session.exec(statement).all())
+
+    def test_add(self) -> None:
+        """Test an added entity is flushed with the session.
+        """
+        category = FoodCategory(name="Soup")
+
+        added = self.run(lambda: self.repository.add(category, refresh=True))
+
+        assert added is category
+        assert self.stored_names() == ["Soup"]
+
+    def test_add_range(self) -> None:
+        """Test several entities are added in one flush.
+        """
+        categories = [FoodCategory(name=name) for name in ("Soup", "Stew")]
+
+        self.run(lambda: self.repository.add_range(categories))
+
+        assert self.stored_names() == ["Soup", "Stew"]
+
+    def test_update(self) -> None:
+        """Test the changes to an entity are flushed.
+        """
+        [category] = self.add_categories("Soup")
+        category.name = "Stew"
+
+        self.run(lambda: self.repository.update(category))
+
+        assert self.stored_names() == ["Stew"]
+
+    def test_delete(self) -> None:
+        """Test an entity without soft deletion is deleted.
+        """
+        # Deleting a category would load its food items, which SQLite cannot
+        # store, so roles are deleted instead.
+        User.__table__.create(self.engine)  # type: ignore[attr-defined]
+        Role.__table__.create(self.engine)  # type: ignore[attr-defined]
+        UserRole.__table__.create(self.engine)  # type: ignore[attr-defined]
+        editor, viewer = Role(name="Editor"), Role(name="Viewer")
+        with Session(self.engine, expire_on_commit=False) as session:
+            session.add_all([editor, viewer])
+            session.commit()
+        repository = AsyncBaseRepository(Role, self.session_scope)
+
+        self.run(lambda: repository.delete(editor))
+
+        with Session(self.engine) as session:
+            assert session.exec(select(Role.name)).all() == ["Viewer"]
+
+    def test_any_and_count(self) -> None:
+        """Test rows are matched and counted by filters and by query.
+        """
+        self.add_categories("A", "B", "C")
+        is_b = col(FoodCategory.name) == "B"
+
+        assert self.run(lambda: self.repository.any(is_b))
+        assert not self.run(lambda: self.repository.any(col(FoodCategory.name) == "D"))
+        assert self.run(lambda: self.repository.count(is_b)) == 1
+        assert self.run(lambda: self.repository.count(query=CategoriesPage(1))) == 3
+
+    def test_find_and_get_by_id(self) -> None:
+        """Test a single entity is found by filters and by id.
+        """
+        [_, b] = self.add_categories("A", "B")
+
+        found = self.run(
+            lambda: self.repository.find(col(FoodCategory.name) == "B")
+        )
+
+        assert found is not None and found.id == b.id
+        loaded = self.run(lambda: self.repository.get_by_id(b.id))
+        assert loaded is not None and loaded.name == "B"
+
+    def test_get_list(self) -> None:
+        """Test the entities of a query are listed in its order.
+        """
+        self.add_categories("C", "A", "B")
+
+        items = self.run(lambda: self.repository.get_list(query=CategoriesPage(1)))
+
+        assert [item.name for item in items] == ["A", "B"]
+
+    def test_get_page(self) -> None:
+        """Test a page is listed along with the number of matching rows.
+        """
+        self.add_categories("A", "B", "C")
+
+        items, count = self.run(
+            lambda: self.repository.get_page(query=CategoriesPage(2))
+        )
+
+        assert [item.name for item in items] == ["C"]
+        assert count == 3
+
+    def test_get_rows(self) -> None:
+        """Test rows hold the primary key and the projected columns only.
+        """
+        self.add_categories("A", "B", "C")
+
+        rows = self.run(lambda: self.repository.get_rows(query=NamesPage(1)))
+
+        assert [tuple(row._fields) for row in rows] == [("id", "name")] * 2
+        assert [row.name for row in rows] == ["A", "B"]
+
+    def test_get_page_rows(self) -> None:
+        """Test a page of rows is listed along with the number of matching
+        rows.
+        """
+        self.add_categories("A", "B", "C")
+
+        rows, count = self.run(
+            lambda: self.repository.get_page_rows(query=NamesPage(2))
+        )
+
+        assert [row.name for row in rows] == ["C"]
+        assert count == 3
+
+    def test_estimate_count(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the count is read from the plan of the query's statement.
+        """
+        planned: list[str] = []
+
+        def explain(
+            connection: Connection, statement: Any, parameters: Any = None
+        ) -> dict[str, Any]:
+            planned.append(str(statement))
+            return {"Plan Rows": 42}
+
+        # SQLite has no EXPLAIN (FORMAT JSON) to plan with.
+        monkeypatch.setattr(base, "explain", explain)
+
+        count = self.run(
+            lambda: self.repository.estimate_count(query=CategoriesPage(1))
+        )
+
+        assert count == 42
+        assert len(planned) == 1
+        assert "food_category" in planned[0]
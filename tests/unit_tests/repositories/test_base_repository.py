@@ -0,0 +1,221 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine, event
+from sqlmodel import Session, select
+
+from app.database import QueryBuilder
+from app.models.food import FoodCategory
+from app.repositories import FoodCategoryRepository
+
+
+class CategoriesPage(QueryBuilder[FoodCategory]):
+    def __init__(self, index: int, size: int = 2) -> None:
+        super().__init__(FoodCategory)
+        self._order_by(self.model.name) # type: ignore
+        self._paginate(skip=(index - 1) * size, take=size)
+
+
+class TestBaseRepositoryPages:
+    """Tests for paged listings of the BaseRepository.
+    """
+
+    def setup_method(self) -> None:
+        self.engine = create_engine("sqlite://")
+        FoodCategory.__table__.create(self.engine)  # type: ignore[attr-defined]
+        self.statements: list[str] = []
+        event.listen(
+            self.engine, 
+            "before_cursor_execute", 
+            lambda *args: self.statements.append(args[2])
+        )
+        self.repository = FoodCategoryRepository(self.session)
+
+    def teardown_method(self) -> None:
+        self.engine.dispose()
+
+    @contextmanager
+    def session(self) -> Iterator[Session]:
+        with Session(self.engine, expire_on_commit=False) as session:
+            yield session
+            session.commit()
+
+    def add_categories(self, *names: str) -> None:
+        with self.session() as session:
+            session.add_all([FoodCategory(name=name) for name in names])
+        self.statements.clear()
+
+    def test_counts_along_with_page(self) -> None:
+        """Test the page and the count of all matching rows take one query.
+        """
+        self.add_categories("A", "B", "C")
+
+        items, count = self.repository.get_page(query=CategoriesPage(1))
+
+        assert [item.name for item in items] == ["A", "B"]
+        assert count == 3
+        assert len(self.statements) == 1
+
+    def test_empty_first_page_is_not_counted_again(self) -> None:
+        """Test no rows on the first page means nothing matches.
+        """
+        items, count = self.repository.get_page(query=CategoriesPage(1))
+
+        assert (items, count) == ([], 0)
+        assert len(self.statements) == 1
+
+    def test_counts_page_past_the_last(self) -> None:
+        """Test a page past the last still reports the count.
+        """
+        self.add_categories("A", "B", "C")
+
+        items, count = self.repository.get_page(query=CategoriesPage(3))
+
+        assert (items, count) == ([], 3)
+        assert len(self.statements) == 2
+
+    def test_skips_count(self) -> None:
+        """Test the count is left out when not asked for.
+        """
+        self.add_categories("A", "B", "C")
+
+        items, count = self.repository.get_page(query=CategoriesPage(2), count=False)
+
+        assert [item.name for item in items] == ["C"]
+        assert count is None
+
+
+class NamesPage(CategoriesPage):
+    def __init__(self, index: int, size: int = 2) -> None:
+        super().__init__(index, size)
+        self._load_only(self.model.name) # type: ignore
+
+
+class TestBaseRepositoryRows:
+    """Tests for row listings of the BaseRepository.
+    """
+
+    def setup_method(self) -> None:
+        self.engine = create_engine("sqlite://")
+        FoodCategory.__table__.create(self.engine)  # type: ignore[attr-defined]
+        with Session(self.engine) as session:
+            session.add_all([FoodCategory(name=name) for name in "ABC"])
+            session.commit()
+        self.session = Session(self.engine)
+        self.repository = FoodCategoryRepository(self.session_scope)
+
+    def teardown_method(self) -> None:
+        self.session.close()
+        self.engine.dispose()
+
+    @contextmanager
+    def session_scope(self) -> Iterator[Session]:
+        yield self.session
+
+    def test_selects_projected_columns(self) -> None:
+        """Test rows hold the primary key and the projected columns only.
+        """
+        rows = self.repository.get_rows(query=NamesPage(1))
+
+        assert [tuple(row._fields) for row in rows] == [("id", "name")] * 2
+        assert [row.name for row in rows] == ["A", "B"]
+
+    def test_counts_along_with_rows(self) -> None:
+        """Test a page of rows is counted without loading any entity.
+        """
+        rows, count = self.repository.get_page_rows(query=CategoriesPage(2))
+
+        assert [row.name for row in rows] == ["C"]
+        assert count == 3
+        assert len(self.session.identity_map) == 0
+
+
+class TestBaseRepositoryBulk:
+    """Tests for bulk writes of the BaseRepository.
+    """
+
+    def setup_method(self) -> None:
+        self.engine = create_engine("sqlite://")
+        FoodCategory.__table__.create(self.engine)  # type: ignore[attr-defined]
+        self.repository = FoodCategoryRepository(self.session)
+
+    def teardown_method(self) -> None:
+        self.engine.dispose()
+
+    @contextmanager
+    def session(self) -> Iterator[Session]:
+        with Session(self.engine) as session:
+            yield session
+            session.commit()
+
+    def test_insert_leaves_entities_untouched(self) -> None:
+        """Test the creation time is set on the inserted rows only.
+        """
+        categories = [FoodCategory(name=name) for name in "AB"]
+
+        self.repository.bulk_insert(categories)
+
+        assert [category.created_utc for category in categories] == [None, None]
+        with Session(self.engine) as session:
+            stored = session.exec(select(FoodCategory)).all()
+        assert len(stored) == 2
+        assert all(category.created_utc is not None for category in stored)
+
+
+class TestBaseRepositoryWrites:
+    """Tests for the statements the BaseRepository writes entities with.
+    """
+
+    def setup_method(self) -> None:
+        self.engine = create_engine("sqlite://")
+        FoodCategory.__table__.create(self.engine)  # type: ignore[attr-defined]
+        self.statements: list[str] = []
+        event.listen(
+            self.engine, 
+            "before_cursor_execute", 
+            lambda *args: self.statements.append(args[2])
+        )
+        self.repository = FoodCategoryRepository(self.session)
+
+    def teardown_method(self) -> None:
+        self.engine.dispose()
+
+    @contextmanager
+    def session(self) -> Iterator[Session]:
+        with Session(
+            self.engine, autoflush=False, expire_on_commit=False
+        ) as session:
+            yield session
+            session.commit()
+
+    def statement_kinds(self) -> list[str]:
+        return [statement.split()[0].upper() for statement in self.statements]
+
+    def test_add_issues_only_the_insert(self) -> None:
+        """Test an added entity is not reloaded, and stays readable without
+        a further query.
+        """
+        category = self.repository.add(FoodCategory(name="Soup"))
+
+        assert category.id is not None
+        assert category.created_utc is not None
+        assert self.statement_kinds() == ["INSERT"]
+
+    def test_add_with_refresh_reloads(self) -> None:
+        """Test an added entity is reloaded when a refresh is asked for.
+        """
+        self.repository.add(FoodCategory(name="Soup"), refresh=True)
+
+        assert self.statement_kinds() == ["INSERT", "SELECT"]
+
+    def test_update_issues_only_the_update(self) -> None:
+        """Test an updated entity is not reloaded.
+        """
+        category = self.repository.add(FoodCategory(name="Soup"))
+        self.statements.clear()
+        category.name = "Stew"
+
+        self.repository.update(category)
+
+        assert category.last_modified_utc is not None
+        assert self.statement_kinds() == ["UPDATE"]
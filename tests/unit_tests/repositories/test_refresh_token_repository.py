@@ -0,0 +1,82 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+from sqlalchemy import create_engine
+from sqlmodel import Session, col, select
+
+from app.models.auth import RefreshToken, User
+from app.repositories import RefreshTokenRepository
+
+
+class TestRefreshTokenRepository:
+    """Tests for consuming and revoking stored refresh tokens.
+    """
+
+    def setup_method(self) -> None:
+        self.engine = create_engine("sqlite://")
+        User.__table__.create(self.engine)  # type: ignore[attr-defined]
+        RefreshToken.__table__.create(self.engine)  # type: ignore[attr-defined]
+        self.user = User(
+            username="ada", email_address="ada@example.com", password_hash="hash"
+        )
+        self.family_id = uuid4()
+        self.other_family_id = uuid4()
+        with Session(self.engine) as session:
+            session.add(self.user)
+            session.add_all([
+                self.token("first", self.family_id),
+                self.token("second", self.family_id),
+                self.token("other", self.other_family_id),
+            ])
+            session.commit()
+        self.repository = RefreshTokenRepository(self.session)
+
+    def teardown_method(self) -> None:
+        self.engine.dispose()
+
+    @contextmanager
+    def session(self) -> Iterator[Session]:
+        with Session(self.engine) as session:
+            yield session
+            session.commit()
+
+    def token(self, token_hash: str, family_id: UUID) -> RefreshToken:
+        return RefreshToken(
+            user_id=self.user.id,
+            family_id=family_id,
+            token_hash=token_hash,
+            security_stamp=self.user.security_stamp,
+            expires_utc=datetime.now(UTC) + timedelta(days=1)
+        )
+
+    def used_hashes(self) -> set[str]:
+        with Session(self.engine) as session:
+            return set(session.exec(
+                select(RefreshToken.token_hash)
+                    .where(col(RefreshToken.used_utc).is_not(None))
+            ).all())
+
+    def test_consumes_token_once(self) -> None:
+        """Test a token can only be consumed once.
+        """
+        now = datetime.now(UTC)
+
+        consumed = self.repository.consume("first", now)
+
+        assert consumed is not None
+        assert consumed.token_hash == "first"
+        assert consumed.family_id == self.family_id
+        assert self.repository.consume("first", now) is None
+        assert self.used_hashes() == {"first"}
+
+    def test_revokes_only_its_family(self) -> None:
+        """Test revoking a family marks its unused tokens as used and leaves
+        other families alone.
+        """
+        self.repository.revoke_family(self.family_id, datetime.now(UTC))
+
+        assert self.used_hashes() == {"first", "second"}
+        assert self.repository.consume("second", datetime.now(UTC)) is None
+        assert self.repository.consume("other", datetime.now(UTC)) is not None
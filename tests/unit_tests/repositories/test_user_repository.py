@@ -0,0 +1,171 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import create_engine, event
+from sqlmodel import Session
+
+from app.models.auth import User
+from app.repositories import UserRepository
+
+
+class TestUserRepositoryLookups:
+    """Tests for looking users up by email address or username.
+    """
+
+    def setup_method(self) -> None:
+        self.engine = create_engine("sqlite://")
+        User.__table__.create(self.engine)  # type: ignore[attr-defined]
+        with Session(self.engine) as session:
+            session.add(User(
+                username="Ada", email_address="Ada@Example.com", password_hash="hash"
+            ))
+            session.commit()
+        self.statements: list[str] = []
+
+        def record(*args: Any) -> None:
+            self.statements.append(args[2])
+
+        event.listen(self.engine, "before_cursor_execute", record)
+        self.repository = UserRepository(self.session)
+
+    def teardown_method(self) -> None:
+        self.engine.dispose()
+
+    @contextmanager
+    def session(self) -> Iterator[Session]:
+        with Session(self.engine) as session:
+            yield session
+
+    def test_matches_ignoring_case(self) -> None:
+        """Test lookups match the stored values regardless of case.
+        """
+        assert self.repository.find_by_email("ada@example.COM") is not None
+        assert self.repository.find_by_name("ADA") is not None
+        assert self.repository.find_by_email_or_name("ada") is not None
+
+    def test_email_match_wins_over_username_match(self) -> None:
+        """Test a credential matching one user's email address and another
+        user's username resolves to the email address match.
+        """
+        with Session(self.engine) as session:
+            session.add(User(
+                username="grace@example.com", 
+                email_address="grace@other.example.com", 
+                password_hash="hash"
+            ))
+            session.add(User(
+                username="grace", email_address="Grace@Example.com", password_hash="hash"
+            ))
+            session.commit()
+
+        user = self.repository.find_by_email_or_name("GRACE@example.com")
+
+        assert user is not None
+        assert user.username == "grace"
+
+    def test_compares_lowercased_columns(self) -> None:
+        """Test lookups compare `lower(column)`, the expression the unique 
+        indexes are on, rather than a pattern.
+        """
+        self.repository.find_by_email_or_name("ada")
+
+        [statement] = self.statements
+        assert "lower(auth_user.email_address) = " in statement
+        assert "lower(auth_user.username) = " in statement
+        assert "LIKE" not in statement.upper()
+
+    def test_looks_up_email_or_name_in_one_statement(self) -> None:
+        """Test an email address or username lookup is a single statement.
+        """
+        assert self.repository.find_by_email_or_name("ada@example.com") is not None
+        assert self.repository.find_by_email_or_name("ADA") is not None
+        assert self.repository.find_by_email_or_name("nobody") is None
+
+        assert len(self.statements) == 3
+
+
+class TestUserRepositoryAccessFailed:
+    """Tests for atomically counting failed sign-in attempts.
+    """
+
+    def setup_method(self) -> None:
+        self.engine = create_engine("sqlite://")
+        User.__table__.create(self.engine)  # type: ignore[attr-defined]
+        self.user = User(
+            username="ada", email_address="ada@example.com", password_hash="hash"
+        )
+        with Session(self.engine, expire_on_commit=False) as session:
+            session.add(self.user)
+            session.commit()
+        self.repository = UserRepository(self.session)
+        self.lockout_end = datetime.now(UTC) + timedelta(minutes=5)
+
+    def teardown_method(self) -> None:
+        self.engine.dispose()
+
+    @contextmanager
+    def session(self) -> Iterator[Session]:
+        with Session(self.engine) as session:
+            yield session
+            session.commit()
+
+    def increment(self) -> tuple[int, datetime | None] | None:
+        return self.repository.increment_access_failed_count(
+            self.user.id, 3, self.lockout_end
+        )
+
+    def test_increments_below_threshold(self) -> None:
+        """Test attempts below the threshold are counted without a lockout.
+        """
+        assert self.increment() == (1, None)
+        assert self.increment() == (2, None)
+
+    def test_locks_out_at_threshold(self) -> None:
+        """Test reaching the threshold locks the user out and resets the 
+        count.
+        """
+        self.increment()
+        self.increment()
+
+        result = self.increment()
+
+        assert result is not None
+        count, lockout_end = result
+        assert count == 0
+        assert lockout_end is not None
+        # SQLite drops the timezone of the stored value.
+        assert lockout_end.replace(tzinfo=UTC) == self.lockout_end
+
+    def test_keeps_lockout_below_threshold(self) -> None:
+        """Test an attempt after a lockout keeps the lockout end.
+        """
+        for _ in range(4):
+            result = self.increment()
+
+        assert result is not None
+        assert result[0] == 1
+        assert result[1] is not None
+
+    def test_unknown_user(self) -> None:
+        """Test incrementing the count of an unknown user returns None.
+        """
+        assert self.repository.increment_access_failed_count(
+            uuid4(), 3, self.lockout_end
+        ) is None
+
+    def test_resets_count_and_lockout(self) -> None:
+        """Test a reset clears the count and the lockout.
+        """
+        for _ in range(4):
+            self.increment()
+
+        self.repository.reset_access_failed_count(self.user.id)
+
+        with Session(self.engine) as session:
+            user = session.get(User, self.user.id)
+            assert user is not None
+            assert user.access_failed_count == 0
+            assert user.lockout_end_utc is None
@@ -0,0 +1,35 @@
+from app.schemas.common import PaginationResponse
+
+
+class TestPaginationResponse:
+    """Tests for the pagination header of paged listings.
+    """
+
+    def test_offset_page_positions(self) -> None:
+        """Test an offset page is positioned by its index and the count.
+        """
+        page = PaginationResponse(index=2, size=10, items_count=25, page_count=3)
+
+        assert page.current_start_index == 11
+        assert page.current_end_index == 20
+        assert page.has_next_page
+        assert page.has_previous_page
+
+    def test_cursor_page_follows_cursors(self) -> None:
+        """Test a cursor page, whose index stays at 1, has a next page only
+        when it has a next cursor, and no offset-based position.
+        """
+        middle = PaginationResponse(
+            index=1, size=10, items_count=25, page_count=3, 
+            cursor="first", next_cursor="second"
+        )
+        last = PaginationResponse(
+            index=1, size=10, items_count=25, page_count=3, cursor="second"
+        )
+
+        assert middle.has_next_page
+        assert not last.has_next_page
+        assert last.has_previous_page
+        assert middle.current_start_index is None
+        assert middle.current_end_index is None
+        assert middle.current_page_size is None
@@ -0,0 +1,125 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.core import security
+from app.core.security import TokenProvider
+from app.core.settings import AppSettings
+from app.database import UnitOfWork
+from app.managers import UserManager
+from app.models.auth import RefreshToken, User
+from app.repositories import RefreshTokenRepository
+from app.schemas.auth import TokenResponse
+from app.schemas.common import Error
+from app.services import AuthService
+from app.utils.rate_limit import SlidingWindowRateLimiter
+
+
+class TestAuthServiceRefreshToken:
+    """Tests for exchanging a refresh token for new tokens.
+    """
+
+    @pytest.fixture(autouse=True)
+    def settings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        settings = AppSettings(
+            DB_HOST="localhost", DB_USER="test", DB_PASSWORD="test", DB_NAME="test"
+        )
+        monkeypatch.setattr(security, "get_app_settings", lambda: settings)
+
+    def setup_method(self) -> None:
+        self.user = User(
+            username="ada", email_address="ada@example.com", is_active=True
+        )
+        self.user_manager = MagicMock(spec=UserManager)
+        self.user_manager.get_by_id.return_value = self.user
+        self.user_manager.get_roles.return_value = ["Viewer"]
+        self.repository = MagicMock(spec=RefreshTokenRepository)
+        self.unit_of_work = MagicMock(spec=UnitOfWork)
+        self.service = AuthService(
+            self.user_manager,
+            self.repository,
+            MagicMock(spec=SlidingWindowRateLimiter),
+            MagicMock(spec=SlidingWindowRateLimiter),
+            self.unit_of_work
+        )
+        self.family_id = uuid4()
+
+    def stored_token(
+        self,
+        token: str,
+        expires_in: timedelta = timedelta(days=1),
+        security_stamp: str | None = None
+    ) -> RefreshToken:
+        return RefreshToken(
+            user_id=self.user.id,
+            family_id=self.family_id,
+            token_hash=TokenProvider.hash_refresh_token(token),
+            security_stamp=security_stamp or self.user.security_stamp,
+            expires_utc=datetime.now(UTC) + expires_in
+        )
+
+    def assert_rejected(self, result: Error | TokenResponse) -> None:
+        assert isinstance(result, Error)
+        assert result.title == "AuthError.InvalidRefreshToken"
+        self.repository.add.assert_not_called()
+        self.unit_of_work.commit.assert_called_once()
+
+    def test_rotates_token_within_family(self) -> None:
+        """Test a valid token is consumed and replaced by a new token of the
+        same family.
+        """
+        self.repository.consume.return_value = self.stored_token("old")
+
+        result = self.service.refresh_access_token("old")
+
+        assert isinstance(result, TokenResponse)
+        assert result.refresh_token and result.refresh_token != "old"
+        self.repository.consume.assert_called_once()
+        assert self.repository.consume.call_args.args[0] == \
+            TokenProvider.hash_refresh_token("old")
+        [new_token] = self.repository.add.call_args.args
+        assert new_token.family_id == self.family_id
+        assert new_token.token_hash == \
+            TokenProvider.hash_refresh_token(result.refresh_token)
+        assert new_token.security_stamp == self.user.security_stamp
+        self.unit_of_work.commit.assert_called_once()
+
+    def test_reused_token_revokes_family(self) -> None:
+        """Test presenting a consumed token revokes its family and is
+        rejected.
+        """
+        self.repository.consume.return_value = None
+        self.repository.find_by_hash.return_value = self.stored_token("old")
+
+        result = self.service.refresh_access_token("old")
+
+        self.assert_rejected(result)
+        self.repository.revoke_family.assert_called_once()
+        assert self.repository.revoke_family.call_args.args[0] == self.family_id
+
+    def test_unknown_token_is_rejected(self) -> None:
+        """Test a token that was never issued is rejected without revoking.
+        """
+        self.repository.consume.return_value = None
+        self.repository.find_by_hash.return_value = None
+
+        self.assert_rejected(self.service.refresh_access_token("unknown"))
+        self.repository.revoke_family.assert_not_called()
+
+    def test_expired_token_is_rejected(self) -> None:
+        """Test an expired token is rejected.
+        """
+        self.repository.consume.return_value = \
+            self.stored_token("old", expires_in=-timedelta(seconds=1))
+
+        self.assert_rejected(self.service.refresh_access_token("old"))
+
+    def test_stale_security_stamp_is_rejected(self) -> None:
+        """Test a token issued before the security stamp changed is rejected.
+        """
+        self.repository.consume.return_value = \
+            self.stored_token("old", security_stamp="stale")
+
+        self.assert_rejected(self.service.refresh_access_token("old"))
@@ -0,0 +1,101 @@
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import anyio
+
+from app.managers import UserManager
+from app.models.auth import User
+from app.schemas.auth import Principal
+from app.services import PrincipalService
+from app.utils.cache import LRUCache
+
+_T = TypeVar("_T")
+
+
+class TestPrincipalService:
+    """Tests for resolving principals against their security stamp.
+    """
+
+    def setup_method(self) -> None:
+        self.user = User(
+            username="ada", email_address="ada@example.com", is_active=True
+        )
+        self.user_manager = MagicMock(spec=UserManager)
+        self.user_manager.get_by_id.return_value = self.user
+        self.principal_cache: LRUCache[UUID, Principal] = LRUCache(max_size=10)
+        self.service = PrincipalService(
+            lambda: self.user_manager, self.principal_cache, thread_limit=1
+        )
+
+    def run(self, call: Callable[[], Awaitable[_T]]) -> _T:
+        async def main() -> _T:
+            return await call()
+        return anyio.run(main)
+
+    def resolve(self, security_stamp: str) -> Principal | None:
+        return self.run(lambda: self.service.resolve(self.user.id, security_stamp))
+
+    def test_caches_resolved_principal(self) -> None:
+        """Test a principal is loaded once, then served from the cache.
+        """
+        first = self.resolve(self.user.security_stamp)
+        second = self.resolve(self.user.security_stamp)
+
+        assert first is not None
+        assert first == second
+        self.user_manager.get_by_id.assert_called_once_with(self.user.id)
+
+    def test_rejects_stale_security_stamp(self) -> None:
+        """Test a token issued with a security stamp that no longer matches
+        is rejected.
+        """
+        assert self.resolve("stale") is None
+
+    def test_rejects_stale_stamp_after_one_reload(self) -> None:
+        """Test a stale stamp against a cached principal reloads it once,
+        then rejects the token.
+        """
+        self.resolve(self.user.security_stamp)
+        self.user_manager.get_by_id.reset_mock()
+
+        assert self.resolve("stale") is None
+        self.user_manager.get_by_id.assert_called_once_with(self.user.id)
+
+    def test_reloads_rotated_stamp_once(self) -> None:
+        """Test a stamp rotated after the principal was cached is accepted
+        after a single reload, which replaces the cached principal.
+        """
+        self.resolve(self.user.security_stamp)
+        self.user.rotate_security_stamp()
+        self.user_manager.get_by_id.reset_mock()
+
+        principal = self.resolve(self.user.security_stamp)
+        self.resolve(self.user.security_stamp)
+
+        assert principal is not None
+        assert principal.security_stamp == self.user.security_stamp
+        self.user_manager.get_by_id.assert_called_once_with(self.user.id)
+
+    def test_invalidation_during_load_is_not_overwritten(self) -> None:
+        """Test a principal loaded while the user was invalidated is returned
+        but not cached, so the old stamp is not served afterwards.
+        """
+        def get_by_id(user_id: UUID) -> User:
+            self.principal_cache.invalidate(user_id)
+            return self.user
+        self.user_manager.get_by_id.side_effect = get_by_id
+
+        principal = self.resolve(self.user.security_stamp)
+
+        assert principal is not None
+        assert self.principal_cache.get(self.user.id) is None
+
+    def test_rejects_unknown_user(self) -> None:
+        """Test a token for a user that does not exist is rejected.
+        """
+        self.user_manager.get_by_id.return_value = None
+
+        assert self.resolve(self.user.security_stamp) is None
+        assert self.principal_cache.get(self.user.id) is None
@@ -0,0 +1,96 @@
+import pytest
+
+from app.utils.cache import LRUCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCache:
+    """Tests for the LRUCache.
+    """
+
+    def test_max_size_must_be_positive(self):
+        """Test the cache rejects a non-positive size bound.
+        """
+        with pytest.raises(ValueError):
+            LRUCache(max_size=0)
+
+    def test_get_counts_hits_and_misses(self):
+        """Test lookups are counted as hits or misses.
+        """
+        cache: LRUCache[str, int] = LRUCache(max_size=2)
+
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+        stats = cache.stats
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.hit_ratio == 0.5
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted when full.
+        """
+        cache: LRUCache[str, int] = LRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats.evictions == 1
+
+    def test_entries_expire_after_ttl(self):
+        """Test entries expire after the default or per-entry TTL.
+        """
+        clock = FakeClock()
+        cache: LRUCache[str, int] = LRUCache(max_size=2, ttl=10, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=30)
+
+        clock.now = 10
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        clock.now = 30
+        assert cache.get("b") is None
+        assert len(cache) == 0
+
+    def test_invalidate_removes_entry(self):
+        """Test invalidating a key removes the cached value.
+        """
+        cache: LRUCache[str, int] = LRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.invalidate("a")
+        cache.invalidate("missing")
+
+        assert cache.get("a") is None
+
+    def test_set_skips_value_loaded_before_invalidation(self):
+        """Test a value loaded before its key was invalidated is not cached,
+        even once the invalidation has aged out of the record.
+        """
+        cache: LRUCache[str, int] = LRUCache(max_size=1)
+        a = cache.generation("a")
+        b = cache.generation("b")
+        cache.invalidate("a")
+        cache.set("a", 1, generation=a)
+        cache.set("b", 2, generation=b)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        cache.invalidate("c")
+        cache.set("a", 1, generation=a)
+        assert cache.get("a") is None
+
+        cache.set("a", 1, generation=cache.generation("a"))
+        assert cache.get("a") == 1
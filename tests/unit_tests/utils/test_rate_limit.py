@@ -0,0 +1,80 @@
+import pytest
+
+from app.utils.rate_limit import RateLimitExceededError, SlidingWindowRateLimiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSlidingWindowRateLimiter:
+    """Tests for the SlidingWindowRateLimiter.
+    """
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.limiter: SlidingWindowRateLimiter[str] = SlidingWindowRateLimiter(
+            limit=2, window=10, max_keys=2, clock=self.clock
+        )
+
+    def test_limit_must_be_positive(self):
+        """Test the limiter rejects a non-positive limit.
+        """
+        with pytest.raises(ValueError):
+            SlidingWindowRateLimiter(limit=0, window=1)
+
+    def test_rejects_hits_over_limit(self):
+        """Test hits beyond the limit are rejected with a retry delay.
+        """
+        self.limiter.acquire("a")
+        self.clock.now = 4
+        self.limiter.acquire("a")
+
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            self.limiter.acquire("a")
+
+        assert exc_info.value.retry_after == 6
+
+    def test_window_slides(self):
+        """Test hits older than the window no longer count.
+        """
+        self.limiter.acquire("a")
+        self.clock.now = 4
+        self.limiter.acquire("a")
+        self.clock.now = 10
+
+        self.limiter.acquire("a")
+        with pytest.raises(RateLimitExceededError):
+            self.limiter.acquire("a")
+
+    def test_keys_are_limited_independently(self):
+        """Test each key has its own limit.
+        """
+        self.limiter.acquire("a")
+        self.limiter.acquire("a")
+
+        self.limiter.acquire("b")
+
+    def test_reset_forgets_hits(self):
+        """Test resetting a key clears its recorded hits.
+        """
+        self.limiter.acquire("a")
+        self.limiter.acquire("a")
+        self.limiter.reset("a")
+
+        self.limiter.acquire("a")
+
+    def test_tracked_keys_are_bounded(self):
+        """Test the least recently used key is dropped beyond max_keys.
+        """
+        self.limiter.acquire("a")
+        self.limiter.acquire("a")
+        self.limiter.acquire("b")
+        self.limiter.acquire("c")
+
+        assert len(self.limiter) == 2
+        self.limiter.acquire("a")